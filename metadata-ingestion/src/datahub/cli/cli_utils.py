@@ -5,7 +5,18 @@ import os.path
 import sys
 import typing
 from datetime import datetime
-from typing import Any, Dict, Iterable, List, Optional, Tuple, Type, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
 
 import click
 import requests
@@ -14,12 +25,14 @@ from pydantic import BaseModel, ValidationError
 from requests.models import Response
 from requests.sessions import Session
 
-from datahub.emitter.aspect import ASPECT_MAP, TIMESERIES_ASPECT_MAP
 from datahub.emitter.request_helper import make_curl_command
-from datahub.emitter.serialization_helper import post_json_transform
-from datahub.metadata.schema_classes import _Aspect
 from datahub.utilities.urns.urn import Urn, guess_entity_type
 
+if TYPE_CHECKING:
+    # The generated metadata classes are slow to import, and this module is
+    # imported by the CLI entrypoint, so they're only imported where used.
+    from datahub.metadata.schema_classes import _Aspect
+
 log = logging.getLogger(__name__)
 
 DEFAULT_GMS_HOST = "http://localhost:8080"
@@ -361,18 +374,13 @@ def post_delete_endpoint_with_session_and_url(
     return urn, rows_affected, timeseries_rows_affected
 
 
-def get_urns_by_filter(
+def _get_urn_filter_criteria(
     platform: Optional[str],
     env: Optional[str] = None,
     entity_type: str = "dataset",
-    search_query: str = "*",
     include_removed: bool = False,
     only_soft_deleted: Optional[bool] = None,
-) -> Iterable[str]:
-    # TODO: Replace with DataHubGraph call
-    session, gms_host = get_session_and_host()
-    endpoint: str = "/entities?action=search"
-    url = gms_host + endpoint
+) -> List[Dict[str, str]]:
     filter_criteria = []
     entity_type_lower = entity_type.lower()
     if env and entity_type_lower != "container":
@@ -416,6 +424,28 @@ def get_urns_by_filter(
                 "condition": "EQUAL",
             }
         )
+    return filter_criteria
+
+
+def get_urns_by_filter(
+    platform: Optional[str],
+    env: Optional[str] = None,
+    entity_type: str = "dataset",
+    search_query: str = "*",
+    include_removed: bool = False,
+    only_soft_deleted: Optional[bool] = None,
+) -> Iterable[str]:
+    # TODO: Replace with DataHubGraph call
+    session, gms_host = get_session_and_host()
+    endpoint: str = "/entities?action=search"
+    url = gms_host + endpoint
+    filter_criteria = _get_urn_filter_criteria(
+        platform=platform,
+        env=env,
+        entity_type=entity_type,
+        include_removed=include_removed,
+        only_soft_deleted=only_soft_deleted,
+    )
 
     search_body = {
         "input": search_query,
@@ -445,6 +475,92 @@ def get_urns_by_filter(
         response.raise_for_status()
 
 
+def get_num_urns_by_filter(
+    platform: Optional[str],
+    env: Optional[str] = None,
+    entity_type: str = "dataset",
+    search_query: str = "*",
+    include_removed: bool = False,
+    only_soft_deleted: Optional[bool] = None,
+    cached_session_host: Optional[Tuple[Session, str]] = None,
+) -> int:
+    session, gms_host = cached_session_host or get_session_and_host()
+    search_body = {
+        "input": search_query,
+        "entity": entity_type,
+        "start": 0,
+        "count": 0,
+        "filter": {
+            "or": [
+                {
+                    "and": _get_urn_filter_criteria(
+                        platform=platform,
+                        env=env,
+                        entity_type=entity_type,
+                        include_removed=include_removed,
+                        only_soft_deleted=only_soft_deleted,
+                    )
+                }
+            ]
+        },
+    }
+    response = session.post(
+        gms_host + "/entities?action=search", json.dumps(search_body)
+    )
+    response.raise_for_status()
+    return response.json()["value"]["numEntities"]
+
+
+def scroll_urns_by_filter(
+    platform: Optional[str],
+    env: Optional[str] = None,
+    entity_type: str = "dataset",
+    search_query: str = "*",
+    include_removed: bool = False,
+    only_soft_deleted: Optional[bool] = None,
+    batch_size: int = 1000,
+    cached_session_host: Optional[Tuple[Session, str]] = None,
+) -> Iterator[str]:
+    """
+    Streams all urns matching the filters using the scroll API. Unlike
+    get_urns_by_filter, this isn't limited to the first 10k results.
+    """
+
+    session, gms_host = cached_session_host or get_session_and_host()
+    scroll_body: Dict[str, Any] = {
+        "entities": [entity_type],
+        "input": search_query,
+        "filter": {
+            "or": [
+                {
+                    "and": _get_urn_filter_criteria(
+                        platform=platform,
+                        env=env,
+                        entity_type=entity_type,
+                        include_removed=include_removed,
+                        only_soft_deleted=only_soft_deleted,
+                    )
+                }
+            ]
+        },
+        "keepAlive": "5m",
+        "count": batch_size,
+    }
+    while True:
+        response = session.post(
+            gms_host + "/entities?action=scrollAcrossEntities", json.dumps(scroll_body)
+        )
+        response.raise_for_status()
+        results = response.json()["value"]
+        for x in results["entities"]:
+            yield x["entity"]
+
+        scroll_id = results.get("scrollId")
+        if not scroll_id or not results["entities"]:
+            break
+        scroll_body["scrollId"] = scroll_id
+
+
 def get_container_ids_by_filter(
     env: Optional[str],
     entity_type: str = "container",
@@ -613,11 +729,11 @@ def post_entity(
     }
     payload = json.dumps(proposal)
     url = gms_host + endpoint
-    curl_command = make_curl_command(session, "POST", url, payload)
-    log.debug(
-        "Attempting to emit to DataHub GMS; using curl equivalent to:\n%s",
-        curl_command,
-    )
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug(
+            "Attempting to emit to DataHub GMS; using curl equivalent to:\n%s",
+            make_curl_command(session, "POST", url, payload),
+        )
     response = session.post(url, payload)
     if not response.ok:
         try:
@@ -628,7 +744,11 @@ def post_entity(
     return response.status_code
 
 
-def _get_pydantic_class_from_aspect_name(aspect_name: str) -> Optional[Type[_Aspect]]:
+def _get_pydantic_class_from_aspect_name(
+    aspect_name: str,
+) -> Optional[Type["_Aspect"]]:
+    from datahub.emitter.aspect import ASPECT_MAP
+
     return ASPECT_MAP.get(aspect_name)
 
 
@@ -659,7 +779,10 @@ def get_aspects_for_entity(
     aspects: List[str],
     typed: bool = False,
     cached_session_host: Optional[Tuple[Session, str]] = None,
-) -> Dict[str, Union[dict, _Aspect]]:
+) -> Dict[str, Union[dict, "_Aspect"]]:
+    from datahub.emitter.aspect import TIMESERIES_ASPECT_MAP
+    from datahub.emitter.serialization_helper import post_json_transform
+
     # Process non-timeseries aspects
     non_timeseries_aspects = [a for a in aspects if a not in TIMESERIES_ASPECT_MAP]
     entity_response = get_entity(
@@ -684,7 +807,7 @@ def get_aspects_for_entity(
                 ts_aspect["value"] = json.loads(ts_aspect["value"])
                 aspect_list[timeseries_aspect] = ts_aspect
 
-    aspect_map: Dict[str, Union[dict, _Aspect]] = {}
+    aspect_map: Dict[str, Union[dict, "_Aspect"]] = {}
     for aspect_name, a in aspect_list.items():
         aspect_py_class: Optional[Type[Any]] = _get_pydantic_class_from_aspect_name(
             aspect_name
@@ -1,9 +1,29 @@
+import contextlib
 import logging
+import os
+import threading
 import time
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
 from dataclasses import dataclass
 from datetime import datetime
-from random import choices
-from typing import Any, Dict, List, Optional, Tuple
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    ContextManager,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    TextIO,
+    Tuple,
+)
 
 import click
 import progressbar
@@ -13,17 +33,24 @@ from tabulate import tabulate
 from datahub.cli import cli_utils
 from datahub.emitter import rest_emitter
 from datahub.emitter.mcp import MetadataChangeProposalWrapper
+from datahub.emitter.request_helper import RequestHook
 from datahub.metadata.schema_classes import StatusClass, SystemMetadataClass
 from datahub.telemetry import telemetry
 from datahub.upgrade import upgrade
 from datahub.utilities.urns.urn import guess_entity_type
 
+if TYPE_CHECKING:
+    from ratelimiter import RateLimiter
+
 logger = logging.getLogger(__name__)
 
 RUN_TABLE_COLUMNS = ["urn", "aspect name", "created at"]
 
 UNKNOWN_NUM_RECORDS = -1
 
+_DEFAULT_DELETE_WORKERS = 4
+_DEFAULT_DELETE_BATCH_SIZE = 100
+
 
 @dataclass
 class DeletionResult:
@@ -132,6 +159,32 @@ def delete_for_registry(
 @click.option("--registry-id", required=False, type=str)
 @click.option("-n", "--dry-run", required=False, is_flag=True)
 @click.option("--only-soft-deleted", required=False, is_flag=True, default=False)
+@click.option(
+    "--workers",
+    required=False,
+    type=click.IntRange(min=1),
+    default=_DEFAULT_DELETE_WORKERS,
+    help="the number of concurrent delete requests (only for filter based deletes)",
+)
+@click.option(
+    "--batch-size",
+    required=False,
+    type=click.IntRange(min=1),
+    default=_DEFAULT_DELETE_BATCH_SIZE,
+    help="the number of urns per soft-delete request (only for filter based deletes)",
+)
+@click.option(
+    "--rate-limit",
+    required=False,
+    type=click.IntRange(min=1),
+    help="the maximum number of delete requests per second (only for filter based deletes)",
+)
+@click.option(
+    "--checkpoint-file",
+    required=False,
+    type=click.Path(dir_okay=False),
+    help="a file to record deleted urns in, so that an interrupted filter based delete can be resumed by re-running the same command",
+)
 @upgrade.check_upgrade
 @telemetry.with_telemetry()
 def delete(
@@ -148,6 +201,10 @@ def delete(
     registry_id: str,
     dry_run: bool,
     only_soft_deleted: bool,
+    workers: int,
+    batch_size: int,
+    rate_limit: Optional[int],
+    checkpoint_file: Optional[str],
 ) -> None:
     """Delete metadata from datahub using a single urn or a combination of filters"""
 
@@ -247,6 +304,10 @@ def delete(
             include_removed=include_removed,
             aspect_name=aspect_name,
             only_soft_deleted=only_soft_deleted,
+            workers=workers,
+            batch_size=batch_size,
+            rate_limit=rate_limit,
+            checkpoint_file=checkpoint_file,
         )
 
     if not dry_run:
@@ -271,6 +332,215 @@ def _get_current_time() -> int:
     return int(time.time() * 1000.0)
 
 
+class _DeletionCheckpoint:
+    """
+    An append-only file of urns that have already been deleted, so that an
+    interrupted purge can be resumed without re-issuing those deletes.
+    """
+
+    def __init__(self, checkpoint_file: Optional[str]) -> None:
+        self.completed: Set[str] = set()
+        self._file: Optional[TextIO] = None
+        self._lock = threading.Lock()
+
+        if checkpoint_file:
+            if os.path.exists(checkpoint_file):
+                with open(checkpoint_file) as f:
+                    self.completed = {line.strip() for line in f if line.strip()}
+                logger.info(
+                    f"Loaded {len(self.completed)} already deleted urns from {checkpoint_file}"
+                )
+            self._file = open(checkpoint_file, "a")
+
+    def mark_completed(self, urns: List[str]) -> None:
+        if self._file is None:
+            return
+        with self._lock:
+            self._file.writelines(f"{urn}\n" for urn in urns)
+            self._file.flush()
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class _RateLimitingRequestHook(RequestHook):
+    """
+    Counts every request made by the emitter against the rate limit. Emitting a
+    batch can take several requests, e.g. when GMS doesn't support batch ingestion,
+    so limiting calls to emit_mcps wouldn't bound the request rate.
+    """
+
+    def __init__(self, rate_limiter: "RateLimiter") -> None:
+        self.rate_limiter = rate_limiter
+
+    def on_request(
+        self, url: str, payload_bytes: int, duration_sec: float, success: bool
+    ) -> None:
+        # Entering the limiter blocks this worker until the request fits in the
+        # limit, which holds back its next request.
+        with self.rate_limiter:
+            pass
+
+
+class _ConcurrentDeleter:
+    """
+    Deletes a stream of urns using a bounded pool of worker threads.
+
+    Urns are grouped into batches. Soft deletes of a batch are sent as a single
+    ingestProposalBatch request, or one request per urn if GMS doesn't support
+    batch ingestion. GMS doesn't have a batch hard-delete endpoint, so hard
+    deletes are still issued one urn at a time, but concurrently.
+    """
+
+    def __init__(
+        self,
+        soft: bool,
+        dry_run: bool,
+        aspect_name: Optional[str],
+        gms_host: str,
+        emitter: rest_emitter.DatahubRestEmitter,
+        checkpoint: _DeletionCheckpoint,
+        workers: int = _DEFAULT_DELETE_WORKERS,
+        batch_size: int = _DEFAULT_DELETE_BATCH_SIZE,
+        rate_limit: Optional[int] = None,
+    ) -> None:
+        self.soft = soft
+        self.dry_run = dry_run
+        self.aspect_name = aspect_name
+        self.gms_host = gms_host
+        self.emitter = emitter
+        self.checkpoint = checkpoint
+        self.workers = max(1, workers)
+        self.batch_size = max(1, batch_size)
+        self.rate_limiter: Optional["RateLimiter"] = None
+        if rate_limit:
+            from ratelimiter import RateLimiter
+
+            self.rate_limiter = RateLimiter(max_calls=rate_limit, period=1)
+            if soft:
+                self.emitter.add_request_hook(
+                    _RateLimitingRequestHook(self.rate_limiter)
+                )
+        self.num_skipped = 0
+
+        self._thread_local = threading.local()
+
+    def _get_session(self) -> sessions.Session:
+        # requests sessions aren't guaranteed to be thread-safe, so every worker gets its own.
+        if not hasattr(self._thread_local, "session"):
+            self._thread_local.session, _ = cli_utils.get_session_and_host()
+        return self._thread_local.session
+
+    def _rate_limited(self) -> ContextManager:
+        return self.rate_limiter or contextlib.nullcontext()
+
+    def _delete_batch(
+        self, urns: List[str], is_soft_deleted: bool, deletion_timestamp: int
+    ) -> DeletionResult:
+        batch_result = DeletionResult()
+        if self.soft and not self.dry_run:
+            if self.aspect_name:
+                raise click.UsageError(
+                    "Please provide --hard flag, as aspect values cannot be soft deleted."
+                )
+            # The emitter's request hook applies the rate limit to each request.
+            self.emitter.emit_mcps(
+                [
+                    MetadataChangeProposalWrapper(
+                        entityUrn=urn,
+                        aspect=StatusClass(removed=True),
+                        systemMetadata=SystemMetadataClass(
+                            runId="delete-run-id", lastObserved=deletion_timestamp
+                        ),
+                    )
+                    for urn in urns
+                ]
+            )
+            batch_result.num_entities = len(urns)
+            batch_result.num_records = UNKNOWN_NUM_RECORDS
+        else:
+            for urn in urns:
+                with self._rate_limited():
+                    one_result = _delete_one_urn(
+                        urn,
+                        soft=self.soft,
+                        dry_run=self.dry_run,
+                        aspect_name=self.aspect_name,
+                        cached_session_host=(self._get_session(), self.gms_host),
+                        cached_emitter=self.emitter,
+                        deletion_timestamp=deletion_timestamp,
+                        is_soft_deleted=is_soft_deleted,
+                    )
+                batch_result.merge(one_result)
+
+        if not self.dry_run:
+            self.checkpoint.mark_completed(urns)
+        batch_result.end()
+        return batch_result
+
+    def _batches(self, urns: Iterable[str]) -> Iterable[List[str]]:
+        batch: List[str] = []
+        for urn in urns:
+            if urn in self.checkpoint.completed:
+                self.num_skipped += 1
+                continue
+            batch.append(urn)
+            if len(batch) >= self.batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def delete(
+        self,
+        urns: Iterable[str],
+        num_urns: Optional[int] = None,
+        is_soft_deleted: bool = False,
+    ) -> DeletionResult:
+        deletion_result = DeletionResult()
+        deletion_timestamp = _get_current_time()
+        num_processed = 0
+
+        progress = progressbar.ProgressBar(
+            max_value=num_urns or progressbar.UnknownLength, redirect_stdout=True
+        )
+        progress.start()
+
+        def _collect(future: Future) -> None:
+            nonlocal num_processed
+            batch_result: DeletionResult = future.result()
+            deletion_result.merge(batch_result)
+            num_processed += batch_result.num_entities
+            progress.update(
+                min(num_processed + self.num_skipped, num_urns)
+                if num_urns
+                else num_processed
+            )
+
+        # Only a few batches are in flight at a time, so that the urns can be
+        # streamed without having to hold all of them in memory.
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            pending: Set[Future] = set()
+            for batch in self._batches(urns):
+                if len(pending) >= 2 * self.workers:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        _collect(future)
+                pending.add(
+                    executor.submit(
+                        self._delete_batch, batch, is_soft_deleted, deletion_timestamp
+                    )
+                )
+            for future in as_completed(pending):
+                _collect(future)
+
+        progress.finish()
+        deletion_result.end()
+        return deletion_result
+
+
 @telemetry.with_telemetry()
 def delete_with_filters(
     dry_run: bool,
@@ -283,86 +553,111 @@ def delete_with_filters(
     env: Optional[str] = None,
     platform: Optional[str] = None,
     only_soft_deleted: Optional[bool] = False,
+    workers: int = _DEFAULT_DELETE_WORKERS,
+    batch_size: int = _DEFAULT_DELETE_BATCH_SIZE,
+    rate_limit: Optional[int] = None,
+    checkpoint_file: Optional[str] = None,
 ) -> DeletionResult:
     session, gms_host = cli_utils.get_session_and_host()
     token = cli_utils.get_token()
 
     logger.info(f"datahub configured with {gms_host}")
-    emitter = rest_emitter.DatahubRestEmitter(gms_server=gms_host, token=token)
+    emitter = rest_emitter.DatahubRestEmitter(
+        gms_server=gms_host, token=token, pool_maxsize=workers
+    )
     batch_deletion_result = DeletionResult()
 
-    urns: List[str] = []
+    filters: Dict[str, Any] = dict(
+        env=env,
+        platform=platform,
+        search_query=search_query,
+        entity_type=entity_type,
+    )
+
+    num_urns = 0
     if not only_soft_deleted:
-        urns = list(
-            cli_utils.get_urns_by_filter(
-                env=env,
-                platform=platform,
-                search_query=search_query,
-                entity_type=entity_type,
-                include_removed=False,
-            )
+        num_urns = cli_utils.get_num_urns_by_filter(
+            **filters, include_removed=False, cached_session_host=(session, gms_host)
         )
 
-    soft_deleted_urns: List[str] = []
+    num_soft_deleted_urns = 0
     if include_removed or only_soft_deleted:
-        soft_deleted_urns = list(
-            cli_utils.get_urns_by_filter(
-                env=env,
-                platform=platform,
-                search_query=search_query,
-                entity_type=entity_type,
-                only_soft_deleted=True,
-            )
+        num_soft_deleted_urns = cli_utils.get_num_urns_by_filter(
+            **filters, only_soft_deleted=True, cached_session_host=(session, gms_host)
         )
 
     final_message = ""
-    if len(urns) > 0:
-        final_message = f"{len(urns)} "
-    if len(urns) > 0 and len(soft_deleted_urns) > 0:
+    if num_urns > 0:
+        final_message = f"{num_urns} "
+    if num_urns > 0 and num_soft_deleted_urns > 0:
         final_message += "and "
-    if len(soft_deleted_urns) > 0:
-        final_message = f"{len(soft_deleted_urns)} (soft-deleted) "
+    if num_soft_deleted_urns > 0:
+        final_message += f"{num_soft_deleted_urns} (soft-deleted) "
 
-    logger.info(
-        f"Filter matched {final_message} {entity_type} entities of {platform}. Sample: {choices(urns, k=min(5, len(urns)))}"
-    )
-    if len(urns) == 0 and len(soft_deleted_urns) == 0:
+    logger.info(f"Filter matched {final_message}{entity_type} entities of {platform}.")
+    if num_urns == 0 and num_soft_deleted_urns == 0:
         click.echo(
             f"No urns to delete. Maybe you want to change entity_type={entity_type} or platform={platform} to be something different?"
         )
         return DeletionResult(end_time=int(time.time() * 1000.0))
 
+    # Soft deletes skip entities that are already soft-deleted.
+    num_urns_to_delete = num_urns + (0 if soft else num_soft_deleted_urns)
+    if num_urns_to_delete == 0:
+        click.echo("All matching entities are already soft-deleted.")
+        return DeletionResult(end_time=int(time.time() * 1000.0))
+
     if not force and not dry_run:
         type_delete = "soft" if soft else "permanently"
         click.confirm(
-            f"This will {type_delete} delete {len(urns)} entities. Are you sure?",
+            f"This will {type_delete} delete {num_urns_to_delete} entities. Are you sure?",
             abort=True,
         )
 
-    if len(urns) > 0:
-        for urn in progressbar.progressbar(urns, redirect_stdout=True):
-            one_result = _delete_one_urn(
-                urn,
-                soft=soft,
-                aspect_name=aspect_name,
-                dry_run=dry_run,
+    checkpoint = _DeletionCheckpoint(checkpoint_file)
+    deleter = _ConcurrentDeleter(
+        soft=soft,
+        dry_run=dry_run,
+        aspect_name=aspect_name,
+        gms_host=gms_host,
+        emitter=emitter,
+        checkpoint=checkpoint,
+        workers=workers,
+        batch_size=batch_size,
+        rate_limit=rate_limit,
+    )
+    try:
+        # The scroll API pages with search_after on the urn, so deleting entities
+        # that have already been returned doesn't cause any to be skipped.
+        if num_urns > 0:
+            urns = cli_utils.scroll_urns_by_filter(
+                **filters,
+                include_removed=False,
                 cached_session_host=(session, gms_host),
-                cached_emitter=emitter,
             )
-            batch_deletion_result.merge(one_result)
-
-    if len(soft_deleted_urns) > 0 and not soft:
-        click.echo("Starting to delete soft-deleted URNs")
-        for urn in progressbar.progressbar(soft_deleted_urns, redirect_stdout=True):
-            one_result = _delete_one_urn(
-                urn,
-                soft=soft,
-                dry_run=dry_run,
+            batch_deletion_result.merge(deleter.delete(urns, num_urns=num_urns))
+
+        if num_soft_deleted_urns > 0 and not soft:
+            click.echo("Starting to delete soft-deleted URNs")
+            soft_deleted_urns = cli_utils.scroll_urns_by_filter(
+                **filters,
+                only_soft_deleted=True,
                 cached_session_host=(session, gms_host),
-                cached_emitter=emitter,
-                is_soft_deleted=True,
             )
-            batch_deletion_result.merge(one_result)
+            batch_deletion_result.merge(
+                deleter.delete(
+                    soft_deleted_urns,
+                    num_urns=num_soft_deleted_urns,
+                    is_soft_deleted=True,
+                )
+            )
+    finally:
+        checkpoint.close()
+
+    if deleter.num_skipped:
+        click.echo(
+            f"Skipped {deleter.num_skipped} urns that were already deleted according to {checkpoint_file}"
+        )
     batch_deletion_result.end()
 
     return batch_deletion_result
@@ -2,7 +2,7 @@ import re
 import unittest.mock
 from abc import ABC, abstractmethod
 from enum import auto
-from typing import IO, Any, ClassVar, Dict, List, Optional, Type, TypeVar
+from typing import IO, Any, ClassVar, Dict, List, Optional, Tuple, Type, TypeVar
 
 import pydantic
 from cached_property import cached_property
@@ -215,6 +215,74 @@ class OauthConfiguration(ConfigModel):
     )
 
 
+# Patterns made up of these characters match exactly the strings that start with them.
+_LITERAL_PREFIX_REGEX = re.compile(r"^[A-Za-z0-9 _-]+$")
+# Group references don't survive combining patterns into a single alternation.
+_GROUP_REFERENCE_REGEX = re.compile(r"\\[1-9]|\(\?P=|\(\?\(")
+# Inline global flags, e.g. (?i), apply to the whole alternation once combined.
+# Python 3.11 rejects them there, but older versions only warn.
+_INLINE_GLOBAL_FLAGS_REGEX = re.compile(r"\(\?[aiLmsux]+\)")
+# Max number of AllowDenyPattern.allowed() results remembered per pattern.
+_DEFAULT_MEMO_MAX_SIZE = 10000
+
+
+class _CompiledPatterns:
+    """
+    Matches a string against a list of regexes with re.match semantics, i.e. it
+    returns True if any of the regexes matches at the start of the string.
+
+    Literal patterns become a str.startswith check and the remaining patterns are
+    combined into a single alternation, so each match is a constant number of calls
+    regardless of how many patterns there are.
+    """
+
+    def __init__(self, patterns: List[str], flags: int) -> None:
+        self._ignore_case = bool(flags & re.IGNORECASE)
+
+        literals = [p for p in patterns if _LITERAL_PREFIX_REGEX.match(p)]
+        others = [p for p in patterns if not _LITERAL_PREFIX_REGEX.match(p)]
+        self._literal_prefixes: Tuple[str, ...] = tuple(
+            p.lower() if self._ignore_case else p for p in literals
+        )
+        # Unicode case folding doesn't always agree with str.lower(), so non-ASCII
+        # strings are matched against the literal patterns as regexes.
+        self._literal_regexes = self._compile(literals, flags)
+        self._regexes = self._compile(others, flags)
+
+    @staticmethod
+    def _compile(patterns: List[str], flags: int) -> List["re.Pattern[str]"]:
+        if not patterns:
+            return []
+        combinable: List[str] = []
+        separate: List[str] = []
+        for p in patterns:
+            if _GROUP_REFERENCE_REGEX.search(p) or _INLINE_GLOBAL_FLAGS_REGEX.search(p):
+                separate.append(p)
+            else:
+                combinable.append(p)
+        if len(combinable) > 1:
+            try:
+                combined = re.compile("|".join(f"(?:{p})" for p in combinable), flags)
+            except re.error:
+                # e.g. duplicate group names.
+                separate = patterns
+            else:
+                return [combined] + [re.compile(p, flags) for p in separate]
+        return [re.compile(p, flags) for p in separate + combinable]
+
+    def matches(self, string: str) -> bool:
+        if self._literal_prefixes:
+            if not self._ignore_case:
+                if string.startswith(self._literal_prefixes):
+                    return True
+            elif string.isascii():
+                if string.lower().startswith(self._literal_prefixes):
+                    return True
+            elif any(regex.match(string) for regex in self._literal_regexes):
+                return True
+        return any(regex.match(string) for regex in self._regexes)
+
+
 class AllowDenyPattern(ConfigModel):
     """A class to store allow deny regexes"""
 
@@ -237,6 +305,23 @@ class AllowDenyPattern(ConfigModel):
         description="Whether to ignore case sensitivity during pattern matching.",
     )  # Name comparisons should default to ignoring case
 
+    # The compiled patterns, along with copies of the allow and deny lists and the
+    # ignoreCase value they were compiled from. Sources sometimes modify the lists
+    # after the config is parsed, in which case the patterns get recompiled.
+    _compiled: Optional[
+        Tuple[
+            List[str],
+            List[str],
+            Optional[bool],
+            _CompiledPatterns,
+            _CompiledPatterns,
+        ]
+    ] = pydantic.PrivateAttr(default=None)
+    _memo: Dict[str, bool] = pydantic.PrivateAttr(default_factory=dict)
+    # Max number of results remembered for names that were already checked.
+    # Set to 0 to disable the memo.
+    _memo_max_size: int = pydantic.PrivateAttr(default=_DEFAULT_MEMO_MAX_SIZE)
+
     @property
     def regex_flags(self) -> int:
         return re.IGNORECASE if self.ignoreCase else 0
@@ -245,15 +330,41 @@ class AllowDenyPattern(ConfigModel):
     def allow_all(cls) -> "AllowDenyPattern":
         return AllowDenyPattern()
 
-    def allowed(self, string: str) -> bool:
-        for deny_pattern in self.deny:
-            if re.match(deny_pattern, string, self.regex_flags):
-                return False
+    def _get_compiled(self) -> Tuple[_CompiledPatterns, _CompiledPatterns]:
+        compiled = self._compiled
+        # Comparing against copies also catches lists that were modified in place.
+        # That costs far less than matching the patterns, and mostly compares the
+        # strings by identity.
+        if (
+            compiled is None
+            or compiled[0] != self.allow
+            or compiled[1] != self.deny
+            or compiled[2] != self.ignoreCase
+        ):
+            compiled = (
+                list(self.allow),
+                list(self.deny),
+                self.ignoreCase,
+                _CompiledPatterns(self.allow, self.regex_flags),
+                _CompiledPatterns(self.deny, self.regex_flags),
+            )
+            self._compiled = compiled
+            self._memo = {}
+        return compiled[3], compiled[4]
 
-        return any(
-            re.match(allow_pattern, string, self.regex_flags)
-            for allow_pattern in self.allow
-        )
+    def allowed(self, string: str) -> bool:
+        allow, deny = self._get_compiled()
+        if self._memo_max_size <= 0:
+            return not deny.matches(string) and allow.matches(string)
+
+        memo = self._memo
+        result = memo.get(string)
+        if result is None:
+            result = not deny.matches(string) and allow.matches(string)
+            if len(memo) >= self._memo_max_size:
+                memo.clear()
+            memo[string] = result
+        return result
 
     def is_fully_specified_allow_list(self) -> bool:
         """
@@ -317,3 +428,8 @@ class LineageConfig(ConfigModel):
         default=False,
         description="When enabled, sql parser will run in isolated in a separate process. This can affect processing time but can protect from sql parser's mem leak.",
     )
+
+    sql_parser_cache_file: Optional[str] = Field(
+        default=None,
+        description="Path to a SQLite file used to cache sql parsing results across runs. If not set, results are only cached in memory for the duration of the run.",
+    )
@@ -1,4 +1,5 @@
 """Convenience functions for creating MCEs"""
+import functools
 import json
 import logging
 import os
@@ -362,8 +363,12 @@ def make_lineage_mce(
 
 
 def can_add_aspect(mce: MetadataChangeEventClass, AspectType: Type[Aspect]) -> bool:
-    SnapshotType = type(mce.proposedSnapshot)
+    return _can_add_aspect_to_snapshot(type(mce.proposedSnapshot), AspectType)
 
+
+@functools.lru_cache(maxsize=None)
+def _can_add_aspect_to_snapshot(SnapshotType: type, AspectType: Type[Aspect]) -> bool:
+    # Resolving the type hints is expensive, and the answer only depends on the types.
     constructor_annotations = get_type_hints(SnapshotType.__init__)
     aspect_list_union = typing_inspect.get_args(constructor_annotations["aspects"])[0]
 
@@ -3,7 +3,10 @@ import json
 from typing import TYPE_CHECKING, List, Optional, Tuple, Union
 
 from datahub.emitter.aspect import ASPECT_MAP, TIMESERIES_ASPECT_MAP
-from datahub.emitter.serialization_helper import post_json_transform, pre_json_transform
+from datahub.emitter.serialization_helper import (
+    codegen_to_restli_obj,
+    post_json_transform,
+)
 from datahub.metadata.schema_classes import (
     ChangeTypeClass,
     DictWrapper,
@@ -24,7 +27,7 @@ _ASPECT_CONTENT_TYPE = "application/json"
 
 
 def _make_generic_aspect(codegen_obj: DictWrapper) -> GenericAspectClass:
-    serialized = json.dumps(pre_json_transform(codegen_obj.to_obj()))
+    serialized = json.dumps(codegen_to_restli_obj(codegen_obj))
     return GenericAspectClass(
         value=serialized.encode(),
         contentType=_ASPECT_CONTENT_TYPE,
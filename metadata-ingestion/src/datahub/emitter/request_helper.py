@@ -26,3 +26,17 @@ def make_curl_command(
         url,
     ]
     return " ".join(shlex.quote(fragment) for fragment in fragments)
+
+
+class RequestHook:
+    """
+    Receives instrumentation for each request that the REST emitter makes.
+
+    Requests are only timed when at least one hook is registered with the
+    emitter, so instrumentation costs nothing when it isn't used.
+    """
+
+    def on_request(
+        self, url: str, payload_bytes: int, duration_sec: float, success: bool
+    ) -> None:
+        pass
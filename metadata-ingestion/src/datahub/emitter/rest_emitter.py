@@ -3,8 +3,9 @@ import functools
 import json
 import logging
 import os
+import time
 from json.decoder import JSONDecodeError
-from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
 
 import requests
 from requests.adapters import HTTPAdapter, Retry
@@ -13,8 +14,8 @@ from requests.exceptions import HTTPError, RequestException
 from datahub.cli.cli_utils import get_system_auth
 from datahub.configuration.common import ConfigurationError, OperationalError
 from datahub.emitter.mcp import MetadataChangeProposalWrapper
-from datahub.emitter.request_helper import make_curl_command
-from datahub.emitter.serialization_helper import pre_json_transform
+from datahub.emitter.request_helper import RequestHook, make_curl_command
+from datahub.emitter.serialization_helper import codegen_to_restli_obj
 from datahub.ingestion.api.closeable import Closeable
 from datahub.metadata.com.linkedin.pegasus2avro.mxe import (
     MetadataChangeEvent,
@@ -38,6 +39,12 @@ _DEFAULT_RETRY_METHODS = ["HEAD", "GET", "POST", "PUT", "DELETE", "OPTIONS", "TR
 _DEFAULT_RETRY_MAX_TIMES = int(
     os.getenv("DATAHUB_REST_EMITTER_DEFAULT_RETRY_MAX_TIMES", "3")
 )
+_DEFAULT_POOL_MAXSIZE = 100
+
+# Limits applied when splitting a list of MCPs into ingestProposalBatch requests.
+# The payload limit stays well below the default GMS max request size.
+_DEFAULT_BATCH_MAX_PROPOSALS = 200
+_DEFAULT_BATCH_MAX_PAYLOAD_BYTES = 10 * 1024 * 1024
 
 
 class DataHubRestEmitter(Closeable):
@@ -63,11 +70,16 @@ class DataHubRestEmitter(Closeable):
         ca_certificate_path: Optional[str] = None,
         server_telemetry_id: Optional[str] = None,
         disable_ssl_verification: bool = False,
+        pool_maxsize: Optional[int] = None,
     ):
         self._gms_server = gms_server
         self._token = token
         self.server_config: Dict[str, Any] = {}
         self.server_telemetry_id: str = ""
+        self._request_hooks: List[RequestHook] = []
+        # Servers that predate the ingestProposalBatch action only support
+        # ingesting one proposal per request.
+        self._batch_ingest_supported = True
 
         self._session = requests.Session()
 
@@ -129,11 +141,16 @@ class DataHubRestEmitter(Closeable):
                 method_whitelist=self._retry_methods,
             )
 
-        adapter = HTTPAdapter(
-            pool_connections=100, pool_maxsize=100, max_retries=retry_strategy
+        # Every thread that uses the emitter needs its own connection, so the
+        # pool should be at least as large as the number of threads. Otherwise
+        # connections get discarded after use instead of being kept alive.
+        self._adapter = HTTPAdapter(
+            pool_connections=100,
+            pool_maxsize=pool_maxsize or _DEFAULT_POOL_MAXSIZE,
+            max_retries=retry_strategy,
         )
-        self._session.mount("http://", adapter)
-        self._session.mount("https://", adapter)
+        self._session.mount("http://", self._adapter)
+        self._session.mount("https://", self._adapter)
 
         # Shim session.request to apply default timeout values.
         # Via https://stackoverflow.com/a/59317604.
@@ -202,8 +219,7 @@ class DataHubRestEmitter(Closeable):
     def emit_mce(self, mce: MetadataChangeEvent) -> None:
         url = f"{self._gms_server}/entities?action=ingest"
 
-        raw_mce_obj = mce.proposedSnapshot.to_obj()
-        mce_obj = pre_json_transform(raw_mce_obj)
+        mce_obj = codegen_to_restli_obj(mce.proposedSnapshot)
         snapshot_fqn = (
             f"com.linkedin.metadata.snapshot.{mce.proposedSnapshot.RECORD_SCHEMA.name}"
         )
@@ -226,16 +242,58 @@ class DataHubRestEmitter(Closeable):
     ) -> None:
         url = f"{self._gms_server}/aspects?action=ingestProposal"
 
-        mcp_obj = pre_json_transform(mcp.to_obj())
+        mcp_obj = _mcp_to_restli_obj(mcp)
         payload = json.dumps({"proposal": mcp_obj})
 
         self._emit_generic(url, payload)
 
+    def emit_mcps(
+        self,
+        mcps: Sequence[Union[MetadataChangeProposal, MetadataChangeProposalWrapper]],
+        max_batch_size: int = _DEFAULT_BATCH_MAX_PROPOSALS,
+        max_payload_bytes: int = _DEFAULT_BATCH_MAX_PAYLOAD_BYTES,
+    ) -> int:
+        """Emit many MCPs using the batch ingestion endpoint.
+
+        The MCPs are split into requests that respect both the maximum number of
+        proposals and the maximum payload size. Returns the number of requests made.
+        """
+        url = f"{self._gms_server}/aspects?action=ingestProposalBatch"
+
+        serialized = [json.dumps(_mcp_to_restli_obj(mcp)) for mcp in mcps]
+        requests_made = 0
+        emitted = 0
+        for chunk in _chunk_serialized_proposals(
+            serialized, max_batch_size, max_payload_bytes
+        ):
+            if not self._batch_ingest_supported:
+                break
+            payload = '{"proposals": [' + ", ".join(chunk) + "]}"
+            try:
+                self._emit_generic(url, payload)
+            except OperationalError as e:
+                if not _is_unsupported_action(e, "ingestProposalBatch"):
+                    raise
+                logger.info(
+                    "DataHub GMS does not support ingestProposalBatch; "
+                    "falling back to one request per proposal"
+                )
+                self._batch_ingest_supported = False
+                break
+            requests_made += 1
+            emitted += len(chunk)
+
+        # Emit whatever couldn't be sent in batches one proposal at a time.
+        url = f"{self._gms_server}/aspects?action=ingestProposal"
+        for item in serialized[emitted:]:
+            self._emit_generic(url, '{"proposal": ' + item + "}")
+            requests_made += 1
+        return requests_made
+
     def emit_usage(self, usageStats: UsageAggregation) -> None:
         url = f"{self._gms_server}/usageStats?action=batchIngest"
 
-        raw_usage_obj = usageStats.to_obj()
-        usage_obj = pre_json_transform(raw_usage_obj)
+        usage_obj = codegen_to_restli_obj(usageStats)
 
         snapshot = {
             "buckets": [
@@ -245,18 +303,41 @@ class DataHubRestEmitter(Closeable):
         payload = json.dumps(snapshot)
         self._emit_generic(url, payload)
 
+    def add_request_hook(self, hook: RequestHook) -> None:
+        self._request_hooks.append(hook)
+
     def _emit_generic(self, url: str, payload: str) -> None:
-        curl_command = make_curl_command(self._session, "POST", url, payload)
-        logger.debug(
-            "Attempting to emit to DataHub GMS; using curl equivalent to:\n%s",
-            curl_command,
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            # Rendering the curl command copies the whole payload, so only do it
+            # when it will actually be logged.
+            logger.debug(
+                "Attempting to emit to DataHub GMS; using curl equivalent to:\n%s",
+                make_curl_command(self._session, "POST", url, payload),
+            )
+
+        if not self._request_hooks:
+            self._post(url, payload)
+            return
+
+        start_time = time.perf_counter()
+        success = False
+        try:
+            self._post(url, payload)
+            success = True
+        finally:
+            duration_sec = time.perf_counter() - start_time
+            for hook in self._request_hooks:
+                hook.on_request(url, len(payload), duration_sec, success)
+
+    def _post(self, url: str, payload: str) -> None:
         try:
             response = self._session.post(url, data=payload)
             response.raise_for_status()
         except HTTPError as e:
             try:
                 info = response.json()
+                if isinstance(info, dict):
+                    info.setdefault("status", response.status_code)
                 raise OperationalError(
                     "Unable to emit metadata to DataHub GMS", info
                 ) from e
@@ -270,6 +351,22 @@ class DataHubRestEmitter(Closeable):
                 "Unable to emit metadata to DataHub GMS", {"message": str(e)}
             ) from e
 
+    def get_connection_stats(self) -> Dict[str, int]:
+        """Returns the number of requests made and connections opened across the connection pools."""
+
+        requests_made = 0
+        connections_opened = 0
+        pools = self._adapter.poolmanager.pools
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is not None:
+                requests_made += pool.num_requests
+                connections_opened += pool.num_connections
+        return {
+            "requests_made": requests_made,
+            "connections_opened": connections_opened,
+        }
+
     def __repr__(self) -> str:
         token_str = (
             f" with token: {self._token[:4]}**********{self._token[-4:]}"
@@ -284,5 +381,40 @@ class DataHubRestEmitter(Closeable):
         self._session.close()
 
 
+def _mcp_to_restli_obj(
+    mcp: Union[MetadataChangeProposal, MetadataChangeProposalWrapper]
+) -> Dict[str, Any]:
+    if isinstance(mcp, MetadataChangeProposalWrapper):
+        return codegen_to_restli_obj(mcp.make_mcp())
+    return codegen_to_restli_obj(mcp)
+
+
+def _is_unsupported_action(e: OperationalError, action: str) -> bool:
+    # Depending on the version, rest.li rejects unknown actions with a 404 or with
+    # a 400 whose message names the action.
+    status = e.info.get("status")
+    return status == 404 or (status == 400 and action in str(e.info.get("message", "")))
+
+
+def _chunk_serialized_proposals(
+    serialized: Sequence[str], max_batch_size: int, max_payload_bytes: int
+) -> Iterator[List[str]]:
+    chunk: List[str] = []
+    chunk_bytes = 0
+    for item in serialized:
+        # A single proposal larger than the limit still goes out on its own,
+        # so that GMS can report the error for it.
+        if chunk and (
+            len(chunk) >= max_batch_size or chunk_bytes + len(item) > max_payload_bytes
+        ):
+            yield chunk
+            chunk = []
+            chunk_bytes = 0
+        chunk.append(item)
+        chunk_bytes += len(item)
+    if chunk:
+        yield chunk
+
+
 """This class exists as a pass-through for backwards compatibility"""
 DatahubRestEmitter = DataHubRestEmitter
@@ -1,30 +1,19 @@
+import importlib
 import logging
 import os
 import platform
 import sys
-from typing import ContextManager, Optional
+from typing import Any, ContextManager, Dict, List, Optional, Tuple
 
 import click
 
 import datahub as datahub_package
-from datahub.cli.check_cli import check
 from datahub.cli.cli_utils import (
     DATAHUB_CONFIG_PATH,
     get_boolean_env_variable,
     make_shim_command,
     write_gms_config,
 )
-from datahub.cli.delete_cli import delete
-from datahub.cli.docker_cli import docker
-from datahub.cli.get_cli import get
-from datahub.cli.ingest_cli import ingest
-from datahub.cli.migrate import migrate
-from datahub.cli.put_cli import put
-from datahub.cli.specific.group_cli import group
-from datahub.cli.specific.user_cli import user
-from datahub.cli.state_cli import state
-from datahub.cli.telemetry import telemetry as telemetry_cli
-from datahub.cli.timeline_cli import timeline
 from datahub.configuration.common import should_show_stack_trace
 from datahub.telemetry import telemetry
 from datahub.utilities.logging_manager import configure_logging
@@ -35,8 +24,70 @@ _logging_configured: Optional[ContextManager] = None
 
 MAX_CONTENT_WIDTH = 120
 
+# Subcommands are only imported when they're invoked, since importing all of them
+# pulls in most of the library and dominates the CLI's startup time.
+# Maps the command name to the "module:attribute" it's defined in and, for commands
+# with optional dependencies, the suggestion to show if the import fails.
+_LAZY_SUBCOMMANDS: Dict[str, Tuple[str, Optional[str]]] = {
+    "check": ("datahub.cli.check_cli:check", None),
+    "docker": ("datahub.cli.docker_cli:docker", None),
+    "ingest": ("datahub.cli.ingest_cli:ingest", None),
+    "delete": ("datahub.cli.delete_cli:delete", None),
+    "get": ("datahub.cli.get_cli:get", None),
+    "put": ("datahub.cli.put_cli:put", None),
+    "state": ("datahub.cli.state_cli:state", None),
+    "telemetry": ("datahub.cli.telemetry:telemetry", None),
+    "migrate": ("datahub.cli.migrate:migrate", None),
+    "timeline": ("datahub.cli.timeline_cli:timeline", None),
+    "user": ("datahub.cli.specific.user_cli:user", None),
+    "group": ("datahub.cli.specific.group_cli:group", None),
+    "lite": (
+        "datahub.cli.lite_cli:lite",
+        "run `pip install 'acryl-datahub[datahub-lite]'`",
+    ),
+    "actions": (
+        "datahub_actions.cli.actions:actions",
+        "run `pip install acryl-datahub-actions`",
+    ),
+}
+
+
+class LazyGroup(click.Group):
+    """A click group that imports its lazy subcommands on first use."""
+
+    def __init__(
+        self,
+        *args: Any,
+        lazy_subcommands: Optional[Dict[str, Tuple[str, Optional[str]]]] = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        return sorted({*super().list_commands(ctx), *self.lazy_subcommands})
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        if cmd_name in self.lazy_subcommands and cmd_name not in self.commands:
+            self.add_command(self._load_lazy_command(cmd_name), cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def _load_lazy_command(self, cmd_name: str) -> click.Command:
+        import_path, install_suggestion = self.lazy_subcommands[cmd_name]
+        module_name, attr_name = import_path.split(":")
+        try:
+            module = importlib.import_module(module_name)
+        except ImportError as e:
+            if install_suggestion is None:
+                raise
+            logger.debug(f"Failed to load {cmd_name} command: {e}")
+            return make_shim_command(cmd_name, install_suggestion)
+        return getattr(module, attr_name)
+
 
 @click.group(
+    cls=LazyGroup,
+    lazy_subcommands=_LAZY_SUBCOMMANDS,
     context_settings=dict(
         # Avoid truncation of help text.
         # See https://github.com/pallets/click/issues/486.
@@ -142,40 +193,6 @@ def init() -> None:
     click.echo(f"Written to {DATAHUB_CONFIG_PATH}")
 
 
-datahub.add_command(check)
-datahub.add_command(docker)
-datahub.add_command(ingest)
-datahub.add_command(delete)
-datahub.add_command(get)
-datahub.add_command(put)
-datahub.add_command(state)
-datahub.add_command(telemetry_cli)
-datahub.add_command(migrate)
-datahub.add_command(timeline)
-datahub.add_command(user)
-datahub.add_command(group)
-
-try:
-    from datahub.cli.lite_cli import lite
-
-    datahub.add_command(lite)
-except ImportError as e:
-    logger.debug(f"Failed to load datahub lite command: {e}")
-    datahub.add_command(
-        make_shim_command("lite", "run `pip install 'acryl-datahub[datahub-lite]'`")
-    )
-
-try:
-    from datahub_actions.cli.actions import actions
-
-    datahub.add_command(actions)
-except ImportError as e:
-    logger.debug(f"Failed to load datahub actions framework: {e}")
-    datahub.add_command(
-        make_shim_command("actions", "run `pip install acryl-datahub-actions`")
-    )
-
-
 def main(**kwargs):
     # This wrapper prevents click from suppressing errors.
     try:
@@ -19,3 +19,10 @@ class Transformer:
     @abstractmethod
     def create(cls, config_dict: dict, ctx: PipelineContext) -> "Transformer":
         pass
+
+    def close(self) -> None:
+        """
+        Releases any state the transformer holds on to. Called on the thread that ran
+        the transformer, once the pipeline no longer needs it.
+        """
+        pass
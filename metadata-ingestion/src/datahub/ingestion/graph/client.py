@@ -1,11 +1,28 @@
+import collections
 import json
 import logging
 import textwrap
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from enum import Enum
 from json.decoder import JSONDecodeError
-from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Type, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    OrderedDict,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
 
 from avro.schema import RecordSchema
 from deprecated import deprecated
@@ -18,7 +35,11 @@ from datahub.configuration.common import ConfigModel, GraphError, OperationalErr
 from datahub.emitter.aspect import TIMESERIES_ASPECT_MAP
 from datahub.emitter.mce_builder import Aspect, make_data_platform_urn
 from datahub.emitter.mcp import MetadataChangeProposalWrapper
-from datahub.emitter.rest_emitter import DatahubRestEmitter
+from datahub.emitter.rest_emitter import (
+    _DEFAULT_BATCH_MAX_PAYLOAD_BYTES,
+    _DEFAULT_BATCH_MAX_PROPOSALS,
+    DatahubRestEmitter,
+)
 from datahub.emitter.serialization_helper import post_json_transform
 from datahub.ingestion.source.state.checkpoint import Checkpoint
 from datahub.metadata.schema_classes import (
@@ -31,11 +52,14 @@ from datahub.metadata.schema_classes import (
     DomainsClass,
     GlobalTagsClass,
     GlossaryTermsClass,
+    MetadataChangeEventClass,
+    MetadataChangeProposalClass,
     OwnershipClass,
     SchemaMetadataClass,
     StatusClass,
     SystemMetadataClass,
     TelemetryClientIdClass,
+    _Aspect,
 )
 from datahub.utilities.urns.urn import Urn, guess_entity_type
 
@@ -50,6 +74,9 @@ logger = logging.getLogger(__name__)
 
 telemetry_enabled = get_boolean_env_variable("DATAHUB_TELEMETRY_ENABLED", True)
 
+_DEFAULT_ASPECT_CACHE_MAX_SIZE = 10000
+_BATCH_GET_CHUNK_SIZE = 100
+
 
 class DatahubClientConfig(ConfigModel):
     """Configuration class for holding connectivity to datahub gms"""
@@ -91,9 +118,47 @@ def _graphql_entity_type(entity_type: str) -> str:
     return entity_type
 
 
+class _LazyAspectBag(Mapping[str, _Aspect]):
+    """The aspects of an entity, deserialized into aspect objects when first accessed."""
+
+    def __init__(self, raw_aspects: Dict[str, Dict]) -> None:
+        self._raw_aspects: Dict[str, Dict] = {}
+        for aspect_name, aspect_json in raw_aspects.items():
+            if aspect_name not in ASPECT_NAME_MAP:
+                logger.warning(f"Ignoring unknown aspect type {aspect_name}")
+                continue
+            self._raw_aspects[aspect_name] = aspect_json
+        self._aspects: Dict[str, _Aspect] = {}
+
+    def __getitem__(self, aspect_name: str) -> _Aspect:
+        aspect = self._aspects.get(aspect_name)
+        if aspect is None:
+            post_json_obj = post_json_transform(self._raw_aspects[aspect_name])
+            aspect = ASPECT_NAME_MAP[aspect_name].from_obj(post_json_obj["value"])
+            self._aspects[aspect_name] = aspect
+        return aspect
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._raw_aspects)
+
+    def __len__(self) -> int:
+        return len(self._raw_aspects)
+
+
 class DataHubGraph(DatahubRestEmitter):
     def __init__(self, config: DatahubClientConfig) -> None:
         self.config = config
+
+        # Prefetched aspects, keyed by (urn, aspect name). Values are the serialized
+        # aspect, or None if the entity didn't have the aspect.
+        self._aspect_cache: OrderedDict[
+            Tuple[str, str], Optional[dict]
+        ] = collections.OrderedDict()
+        self._aspect_cache_lock = threading.Lock()
+        # Bumped whenever emitting evicts cached aspects, so that a prefetch that was
+        # in flight at the time doesn't cache what it read before the write.
+        self._aspect_cache_generation = 0
+
         super().__init__(
             gms_server=self.config.server,
             token=self.config.token,
@@ -178,6 +243,19 @@ class DataHubGraph(DatahubRestEmitter):
                 'Cannot get a timeseries aspect using "get_aspect". Use "get_latest_timeseries_value" instead.'
             )
 
+        if version == 0:
+            with self._aspect_cache_lock:
+                key = (entity_urn, aspect)
+                if key in self._aspect_cache:
+                    # A prefetched aspect is only served once, since the caller may
+                    # go on to write a new version of it.
+                    aspect_obj = self._aspect_cache.pop(key)
+                    return (
+                        aspect_type.from_obj(aspect_obj)
+                        if aspect_obj is not None
+                        else None
+                    )
+
         url: str = f"{self._gms_server}/aspects/{Urn.url_encode(entity_urn)}?aspect={aspect}&version={version}"
         response = self._session.get(url)
         if response.status_code == 404:
@@ -431,6 +509,225 @@ class DataHubGraph(DatahubRestEmitter):
 
         return result
 
+    def _get_entities_v2_batch(
+        self, entity_urns: List[str], aspects: Optional[List[str]] = None
+    ) -> Dict[str, Dict]:
+        """
+        Fetches the given aspects for a batch of entities in a single request,
+        returning the raw entity responses keyed by urn.
+        """
+
+        # Urn lists quickly exceed URL length limits, so we tunnel the query
+        # through a POST body, which rest.li decodes as a regular GET.
+        query = f"ids=List({','.join(Urn.url_encode(urn) for urn in entity_urns)})"
+        if aspects is not None:
+            query = f"{query}&aspects=List({','.join(aspects)})"
+        response = self._session.post(
+            f"{self._gms_server}/entitiesV2",
+            data=query,
+            headers={
+                "X-HTTP-Method-Override": "GET",
+                "Content-Type": "application/x-www-form-urlencoded",
+            },
+        )
+        response.raise_for_status()
+        return {
+            entity_response["urn"]: entity_response
+            for entity_response in response.json().get("results", {}).values()
+        }
+
+    def get_entities_raw(
+        self, entity_urns: Iterable[str], aspects: Optional[List[str]] = None
+    ) -> Dict[str, Dict]:
+        """
+        Batch version of `get_entity_raw`.
+
+        The entities are fetched in chunks using the server's batch-get endpoint, with up
+        to `max_threads` chunks in flight at once.
+
+        :param entity_urns: The urns of the entities
+        :param aspects: The names of the aspects to fetch. Defaults to all aspects.
+        :return: A map of urn to the raw entity response. Entities that the server did
+            not return are omitted.
+        :raises HttpError: if any of the HTTP responses is not a 200
+        """
+        if aspects is not None:
+            assert aspects, "if provided, aspects must be a non-empty list"
+
+        urns = list(dict.fromkeys(entity_urns))
+        chunks = [
+            urns[i : i + _BATCH_GET_CHUNK_SIZE]
+            for i in range(0, len(urns), _BATCH_GET_CHUNK_SIZE)
+        ]
+        if len(chunks) <= 1:
+            return self._get_entities_v2_batch(chunks[0], aspects) if chunks else {}
+
+        result: Dict[str, Dict] = {}
+        with ThreadPoolExecutor(
+            max_workers=min(self.config.max_threads, len(chunks))
+        ) as executor:
+            for entity_responses in executor.map(
+                lambda chunk: self._get_entities_v2_batch(chunk, aspects), chunks
+            ):
+                result.update(entity_responses)
+        return result
+
+    def get_entities_semityped(
+        self, entity_urns: Iterable[str], aspects: Optional[List[str]] = None
+    ) -> Dict[str, Mapping[str, _Aspect]]:
+        """Batch version of `get_entity_semityped` (experimental).
+
+        The aspects are only deserialized into aspect objects when they are first
+        accessed, so fetching many entities doesn't pay for aspects that are never used.
+
+        Warning: Do not use this method to determine if an entity exists! The server
+        returns entities even if they don't actually exist in DataHub.
+
+        :param entity_urns: The urns of the entities
+        :param aspects: The names of the aspects to fetch. Defaults to all aspects.
+        :returns: A map of urn to a mapping of aspect name to aspect value. If an aspect
+            is not found, it will not be present in the mapping.
+        """
+
+        return {
+            urn: _LazyAspectBag(entity_response.get("aspects", {}))
+            for urn, entity_response in self.get_entities_raw(
+                entity_urns, aspects
+            ).items()
+        }
+
+    def get_aspects_batch(
+        self, entity_urns: Iterable[str], aspect_type: Type[Aspect]
+    ) -> Dict[str, Optional[Aspect]]:
+        """
+        Batch version of `get_aspect`, for the latest version of an aspect.
+
+        :param entity_urns: The urns of the entities
+        :param aspect_type: The type class of the aspect being requested
+        :return: A map of urn to the aspect, or None if the entity has no such aspect.
+        """
+
+        urns = list(entity_urns)
+        entities = self.get_entities_semityped(urns, [aspect_type.ASPECT_NAME])
+        return {
+            urn: entities[urn].get(aspect_type.ASPECT_NAME)  # type: ignore
+            if urn in entities
+            else None
+            for urn in urns
+        }
+
+    def prefetch_aspects(
+        self, entity_urns: Iterable[str], aspect_type: Type[Aspect]
+    ) -> None:
+        """
+        Fetches an aspect for many entities using batch requests and caches the results,
+        so that the next get_aspect call for each of these entities doesn't go to the server.
+
+        Each cached aspect is served once, after which get_aspect goes back to the server.
+        Writes made through other emitters don't evict cached aspects, so callers should
+        prefetch right before a batch of reads, and call drop_prefetched_aspects after it.
+        Failures are logged and ignored, in which case get_aspect falls back to fetching
+        each aspect individually.
+        """
+
+        aspect_name = aspect_type.ASPECT_NAME
+        with self._aspect_cache_lock:
+            generation = self._aspect_cache_generation
+            urns_to_fetch = list(
+                {
+                    urn: None
+                    for urn in entity_urns
+                    if (urn, aspect_name) not in self._aspect_cache
+                }
+            )
+        if not urns_to_fetch:
+            return
+
+        try:
+            entity_responses = self.get_entities_raw(urns_to_fetch, [aspect_name])
+        except Exception as e:
+            logger.warning(f"Failed to prefetch {aspect_name} aspects: {e}")
+            return
+
+        with self._aspect_cache_lock:
+            if generation != self._aspect_cache_generation:
+                # Something was emitted while fetching, so the results may be stale.
+                return
+            for urn in urns_to_fetch:
+                aspect_json = (
+                    entity_responses.get(urn, {}).get("aspects", {}).get(aspect_name)
+                )
+                self._aspect_cache[(urn, aspect_name)] = (
+                    post_json_transform(aspect_json)["value"]
+                    if aspect_json is not None
+                    else None
+                )
+                self._aspect_cache.move_to_end((urn, aspect_name))
+            while len(self._aspect_cache) > _DEFAULT_ASPECT_CACHE_MAX_SIZE:
+                self._aspect_cache.popitem(last=False)
+
+    def drop_prefetched_aspects(
+        self, entity_urns: Iterable[str], aspect_type: Type[Aspect]
+    ) -> None:
+        """Drops prefetched aspects that weren't read by get_aspect."""
+
+        aspect_name = aspect_type.ASPECT_NAME
+        with self._aspect_cache_lock:
+            for urn in entity_urns:
+                self._aspect_cache.pop((urn, aspect_name), None)
+
+    def _evict_cached_aspects(
+        self, urn: str, aspect_names: Optional[Iterable[str]] = None
+    ) -> None:
+        with self._aspect_cache_lock:
+            self._aspect_cache_generation += 1
+            if aspect_names is None:
+                keys = [key for key in self._aspect_cache if key[0] == urn]
+            else:
+                keys = [(urn, aspect_name) for aspect_name in aspect_names]
+            for key in keys:
+                self._aspect_cache.pop(key, None)
+
+    def emit_mce(self, mce: MetadataChangeEventClass) -> None:
+        try:
+            super().emit_mce(mce)
+        finally:
+            self._evict_cached_aspects(mce.proposedSnapshot.urn)
+
+    def emit_mcp(
+        self, mcp: Union[MetadataChangeProposalClass, MetadataChangeProposalWrapper]
+    ) -> None:
+        try:
+            super().emit_mcp(mcp)
+        finally:
+            self._evict_mcp_aspects([mcp])
+
+    def emit_mcps(
+        self,
+        mcps: Sequence[
+            Union[MetadataChangeProposalClass, MetadataChangeProposalWrapper]
+        ],
+        max_batch_size: int = _DEFAULT_BATCH_MAX_PROPOSALS,
+        max_payload_bytes: int = _DEFAULT_BATCH_MAX_PAYLOAD_BYTES,
+    ) -> int:
+        try:
+            return super().emit_mcps(mcps, max_batch_size, max_payload_bytes)
+        finally:
+            self._evict_mcp_aspects(mcps)
+
+    def _evict_mcp_aspects(
+        self,
+        mcps: Sequence[
+            Union[MetadataChangeProposalClass, MetadataChangeProposalWrapper]
+        ],
+    ) -> None:
+        for mcp in mcps:
+            if mcp.entityUrn is None:
+                continue
+            self._evict_cached_aspects(
+                mcp.entityUrn, [mcp.aspectName] if mcp.aspectName else None
+            )
+
     @property
     def _search_endpoint(self):
         return f"{self.config.server}/entities?action=search"
@@ -3,11 +3,13 @@ import itertools
 import logging
 import os
 import platform
+import queue
 import shutil
 import sys
+import threading
 import time
 from dataclasses import dataclass
-from typing import Any, Dict, Iterable, Iterator, List, Optional, cast
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, cast
 
 import click
 import humanfriendly
@@ -20,7 +22,12 @@ from datahub.configuration.common import (
     PipelineExecutionError,
 )
 from datahub.ingestion.api.committable import CommitPolicy
-from datahub.ingestion.api.common import EndOfStream, PipelineContext, RecordEnvelope
+from datahub.ingestion.api.common import (
+    EndOfStream,
+    PipelineContext,
+    RecordEnvelope,
+    WorkUnit,
+)
 from datahub.ingestion.api.pipeline_run_listener import PipelineRunListener
 from datahub.ingestion.api.report import Report
 from datahub.ingestion.api.sink import Sink, SinkReport, WriteCallback
@@ -35,6 +42,7 @@ from datahub.ingestion.sink.file import FileSink, FileSinkConfig
 from datahub.ingestion.sink.sink_registry import sink_registry
 from datahub.ingestion.source.source_registry import source_registry
 from datahub.ingestion.transformer.transform_registry import transform_registry
+from datahub.ingestion.transformer.transformer_chain import TransformerChain
 from datahub.metadata.schema_classes import MetadataChangeProposalClass
 from datahub.telemetry import stats, telemetry
 from datahub.utilities.global_warning_util import (
@@ -156,6 +164,23 @@ class CliReport(Report):
         return super().compute_stats()
 
 
+@dataclass
+class _WorkUnitBoundary:
+    workunit: WorkUnit
+    is_start: bool
+
+
+@dataclass
+class _StageFailure:
+    exception: BaseException
+
+
+# Marks the end of the items produced by a pipeline stage.
+_END_OF_STAGE = object()
+
+_STAGE_POLL_INTERVAL_SEC = 0.5
+
+
 class Pipeline:
     config: PipelineConfig
     ctx: PipelineContext
@@ -163,6 +188,7 @@ class Pipeline:
     extractor: Extractor
     sink: Sink[ConfigModel, SinkReport]
     transformers: List[Transformer]
+    transformer_chain: TransformerChain
 
     def __init__(
         self,
@@ -243,6 +269,7 @@ class Pipeline:
                 logger.debug(
                     f"Transformer type:{transformer_type},{transformer_class} configured"
                 )
+        self.transformer_chain = TransformerChain(self.transformers)
 
     def _configure_reporting(
         self, report_to: Optional[str], no_default_report: bool
@@ -356,50 +383,13 @@ class Pipeline:
                     self.ctx, self.config.failure_log.log_config
                 )
             )
-            for wu in itertools.islice(
-                self.source.get_workunits(),
-                self.preview_workunits if self.preview_mode else None,
-            ):
-                try:
-                    if self._time_to_print():
-                        self.pretty_print_summary(currently_running=True)
-                except Exception as e:
-                    logger.warning(f"Failed to print summary {e}")
-
-                if not self.dry_run:
-                    self.sink.handle_work_unit_start(wu)
+            if self.config.execution.pipelined:
+                self._run_pipelined(callback)
+            else:
                 try:
-                    record_envelopes = self.extractor.get_records(wu)
-                    for record_envelope in self.transform(record_envelopes):
-                        if not self.dry_run:
-                            self.sink.write_record_async(record_envelope, callback)
-
-                except RuntimeError:
-                    raise
-                except SystemExit:
-                    raise
-                except Exception as e:
-                    logger.error(
-                        "Failed to process some records. Continuing.", exc_info=e
-                    )
-
-                self.extractor.close()
-                if not self.dry_run:
-                    self.sink.handle_work_unit_end(wu)
-            self.source.close()
-            # no more data is coming, we need to let the transformers produce any additional records if they are holding on to state
-            for record_envelope in self.transform(
-                [
-                    RecordEnvelope(
-                        record=EndOfStream(), metadata={"workunit_id": "end-of-stream"}
-                    )
-                ]
-            ):
-                if not self.dry_run and not isinstance(
-                    record_envelope.record, EndOfStream
-                ):
-                    # TODO: propagate EndOfStream and other control events to sinks, to allow them to flush etc.
-                    self.sink.write_record_async(record_envelope, callback)
+                    self._run_sequential(callback)
+                finally:
+                    self.transformer_chain.close()
 
             self.sink.close()
             self.process_commits()
@@ -416,16 +406,67 @@ class Pipeline:
 
             self._notify_reporters_on_ingestion_completion()
 
+    def _end_of_stream_records(self) -> Iterable[RecordEnvelope]:
+        # no more data is coming, we need to let the transformers produce any additional records if they are holding on to state
+        for record_envelope in self.transform(
+            [
+                RecordEnvelope(
+                    record=EndOfStream(), metadata={"workunit_id": "end-of-stream"}
+                )
+            ]
+        ):
+            if not isinstance(record_envelope.record, EndOfStream):
+                yield record_envelope
+
+    def _print_summary_if_needed(self) -> None:
+        try:
+            if self._time_to_print():
+                self.pretty_print_summary(currently_running=True)
+        except Exception as e:
+            logger.warning(f"Failed to print summary {e}")
+
+    def _run_sequential(self, callback: WriteCallback) -> None:
+        for wu in itertools.islice(
+            self.source.get_workunits(),
+            self.preview_workunits if self.preview_mode else None,
+        ):
+            self._print_summary_if_needed()
+
+            if not self.dry_run:
+                self.sink.handle_work_unit_start(wu)
+            try:
+                record_envelopes = self.extractor.get_records(wu)
+                for record_envelope in self.transform(record_envelopes):
+                    if not self.dry_run:
+                        self.sink.write_record_async(record_envelope, callback)
+
+            except RuntimeError:
+                raise
+            except SystemExit:
+                raise
+            except Exception as e:
+                logger.error("Failed to process some records. Continuing.", exc_info=e)
+
+            self.extractor.close()
+            if not self.dry_run:
+                self.sink.handle_work_unit_end(wu)
+        self.source.close()
+
+        for record_envelope in self._end_of_stream_records():
+            if not self.dry_run:
+                # TODO: propagate EndOfStream and other control events to sinks, to allow them to flush etc.
+                self.sink.write_record_async(record_envelope, callback)
+
+    def _run_pipelined(self, callback: WriteCallback) -> None:
+        _PipelinedExecution(self, callback).run()
+
     def transform(self, records: Iterable[RecordEnvelope]) -> Iterable[RecordEnvelope]:
         """
         Transforms the given sequence of records by passing the records through the transformers
         :param records: the records to transform
         :return: the transformed records
         """
-        for transformer in self.transformers:
-            records = transformer.transform(records)
-
-        return records
+        return self.transformer_chain.transform(records)
 
     def process_commits(self) -> None:
         """
@@ -599,3 +640,144 @@ class Pipeline:
                 "report": self.sink.get_report().as_obj(),
             },
         }
+
+
+class _PipelinedExecution:
+    """
+    Runs the source, the extractor and transformers, and the sink on separate threads.
+
+    The stages are connected by bounded queues, so a slow stage applies backpressure
+    to the ones before it. Each stage is a single thread that processes items in
+    order, so records reach the sink in the same order as in sequential mode.
+    The sink stage runs on the calling thread.
+    """
+
+    def __init__(self, pipeline: Pipeline, callback: WriteCallback) -> None:
+        self.pipeline = pipeline
+        self.callback = callback
+        self.workunit_queue: "queue.Queue[Any]" = queue.Queue(
+            maxsize=pipeline.config.execution.max_queued_workunits
+        )
+        self.record_queue: "queue.Queue[Any]" = queue.Queue(
+            maxsize=pipeline.config.execution.max_queued_records
+        )
+        self.stop_event = threading.Event()
+
+    def _put(self, q: "queue.Queue[Any]", item: Any) -> bool:
+        while not self.stop_event.is_set():
+            try:
+                q.put(item, timeout=_STAGE_POLL_INTERVAL_SEC)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def _get(self, q: "queue.Queue[Any]") -> Any:
+        while not self.stop_event.is_set():
+            try:
+                return q.get(timeout=_STAGE_POLL_INTERVAL_SEC)
+            except queue.Empty:
+                pass
+        return _END_OF_STAGE
+
+    def _run_stage(self, stage: Callable[[], None], output: "queue.Queue[Any]") -> None:
+        try:
+            stage()
+        except BaseException as e:
+            self._put(output, _StageFailure(e))
+        else:
+            self._put(output, _END_OF_STAGE)
+
+    def _source_stage(self) -> None:
+        pipeline = self.pipeline
+        for wu in itertools.islice(
+            pipeline.source.get_workunits(),
+            pipeline.preview_workunits if pipeline.preview_mode else None,
+        ):
+            if not self._put(self.workunit_queue, wu):
+                return
+
+    def _transform_workunit(self, wu: WorkUnit) -> bool:
+        pipeline = self.pipeline
+        if not self._put(self.record_queue, _WorkUnitBoundary(wu, is_start=True)):
+            return False
+        try:
+            for record_envelope in pipeline.transform(
+                pipeline.extractor.get_records(wu)
+            ):
+                if not self._put(self.record_queue, record_envelope):
+                    return False
+        except RuntimeError:
+            raise
+        except SystemExit:
+            raise
+        except Exception as e:
+            logger.error("Failed to process some records. Continuing.", exc_info=e)
+        pipeline.extractor.close()
+        return self._put(self.record_queue, _WorkUnitBoundary(wu, is_start=False))
+
+    def _transform_stage(self) -> None:
+        # The transformers' state can only be released on the thread that used it.
+        try:
+            while True:
+                item = self._get(self.workunit_queue)
+                if item is _END_OF_STAGE:
+                    break
+                elif isinstance(item, _StageFailure):
+                    raise item.exception
+                elif not self._transform_workunit(item):
+                    return
+
+            if self.stop_event.is_set():
+                return
+            self.pipeline.source.close()
+            for record_envelope in self.pipeline._end_of_stream_records():
+                if not self._put(self.record_queue, record_envelope):
+                    return
+        finally:
+            self.pipeline.transformer_chain.close()
+
+    def _sink_stage(self) -> None:
+        pipeline = self.pipeline
+        while True:
+            item = self._get(self.record_queue)
+            if item is _END_OF_STAGE:
+                break
+            elif isinstance(item, _StageFailure):
+                raise item.exception
+            elif isinstance(item, _WorkUnitBoundary):
+                if item.is_start:
+                    pipeline._print_summary_if_needed()
+                if pipeline.dry_run:
+                    continue
+                if item.is_start:
+                    pipeline.sink.handle_work_unit_start(item.workunit)
+                else:
+                    pipeline.sink.handle_work_unit_end(item.workunit)
+            elif not pipeline.dry_run:
+                pipeline.sink.write_record_async(item, self.callback)
+
+    def run(self) -> None:
+        threads = [
+            threading.Thread(
+                target=self._run_stage,
+                args=(self._source_stage, self.workunit_queue),
+                name="pipeline-source",
+                daemon=True,
+            ),
+            threading.Thread(
+                target=self._run_stage,
+                args=(self._transform_stage, self.record_queue),
+                name="pipeline-transform",
+                daemon=True,
+            ),
+        ]
+        for thread in threads:
+            thread.start()
+
+        try:
+            self._sink_stage()
+        finally:
+            self.stop_event.set()
+            for thread in threads:
+                thread.join()
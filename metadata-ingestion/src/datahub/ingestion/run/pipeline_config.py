@@ -3,6 +3,7 @@ import logging
 import uuid
 from typing import Any, Dict, List, Optional
 
+import pydantic
 from pydantic import Field, root_validator, validator
 
 from datahub.cli.cli_utils import get_url_and_token
@@ -37,6 +38,21 @@ class FailureLoggingConfig(ConfigModel):
     log_config: Optional[FileSinkConfig] = None
 
 
+class PipelineExecutionConfig(ConfigModel):
+    pipelined: bool = Field(
+        False,
+        description="When enabled, the source, the extractor and transformers, and the sink each run on their own thread, connected by bounded queues.",
+    )
+    max_queued_workunits: pydantic.PositiveInt = Field(
+        100,
+        description="Maximum number of work units buffered between the source and the transformers in pipelined mode.",
+    )
+    max_queued_records: pydantic.PositiveInt = Field(
+        1000,
+        description="Maximum number of records buffered between the transformers and the sink in pipelined mode.",
+    )
+
+
 class PipelineConfig(ConfigModel):
     # Once support for discriminated unions gets merged into Pydantic, we can
     # simplify this configuration and validation.
@@ -50,6 +66,7 @@ class PipelineConfig(ConfigModel):
     datahub_api: Optional[DatahubClientConfig] = None
     pipeline_name: Optional[str] = None
     failure_log: FailureLoggingConfig = FailureLoggingConfig()
+    execution: PipelineExecutionConfig = PipelineExecutionConfig()
 
     _raw_dict: Optional[
         dict
@@ -1,6 +1,6 @@
 import logging
 import os
-from typing import Union
+from typing import List, Tuple, Union
 
 from datahub.emitter.mcp import MetadataChangeProposalWrapper
 from datahub.ingestion.api.common import RecordEnvelope
@@ -18,11 +18,17 @@ logger = logging.getLogger(__name__)
 class DataHubLiteSinkConfig(LiteLocalConfig):
     type: str = "duckdb"
     config: dict = {"file": os.path.expanduser("~/.datahub/lite/datahub.duckdb")}
+    write_batch_size: int = 1000
 
 
 class DataHubLiteSink(Sink[DataHubLiteSinkConfig, SinkReport]):
+    _batch: List[Tuple[RecordEnvelope, WriteCallback]]
+
     def __post_init__(self) -> None:
-        self.datahub_lite = get_datahub_lite(self.config.dict())
+        self.datahub_lite = get_datahub_lite(
+            self.config.dict(exclude={"write_batch_size"})
+        )
+        self._batch = []
 
     def write_record_async(
         self,
@@ -41,8 +47,37 @@ class DataHubLiteSink(Sink[DataHubLiteSinkConfig, SinkReport]):
             self.report.report_warning(f"datahub-local does not support {type(record)}")
             return
 
+        self._batch.append((record_envelope, write_callback))
+        if len(self._batch) >= self.config.write_batch_size:
+            self._flush()
+
+    def _flush(self) -> None:
+        batch = self._batch
+        self._batch = []
+        if not batch:
+            return
+
+        try:
+            self.datahub_lite.write_batch(
+                [record_envelope.record for record_envelope, _ in batch]
+            )
+        except Exception as e:
+            # Fall back to writing records one at a time, so that failures are
+            # attributed to the records that caused them.
+            logger.debug(f"Failed to write a batch of {len(batch)} records: {e}")
+            for record_envelope, write_callback in batch:
+                self._write_one(record_envelope, write_callback)
+        else:
+            for record_envelope, write_callback in batch:
+                self.report.report_record_written(record_envelope)
+                if write_callback:
+                    write_callback.on_success(record_envelope, success_metadata={})
+
+    def _write_one(
+        self, record_envelope: RecordEnvelope, write_callback: WriteCallback
+    ) -> None:
         try:
-            self.datahub_lite.write(record)
+            self.datahub_lite.write(record_envelope.record)
             self.report.report_record_written(record_envelope)
         except Exception as e:
             self.report.report_failure(f"{record_envelope.metadata}: {type(e)}: {e}")
@@ -53,5 +88,6 @@ class DataHubLiteSink(Sink[DataHubLiteSinkConfig, SinkReport]):
                 write_callback.on_success(record_envelope, success_metadata={})
 
     def close(self):
+        self._flush()
         if self.datahub_lite:
             self.datahub_lite.close()
@@ -2,12 +2,16 @@ import concurrent.futures
 import contextlib
 import functools
 import logging
+import threading
+import time
 from concurrent.futures import ThreadPoolExecutor
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import timedelta
 from enum import auto
 from threading import BoundedSemaphore
-from typing import Union, cast
+from typing import Dict, List, Optional, Tuple, Union, cast
+
+import pydantic
 
 from datahub.cli.cli_utils import set_env_variables_override_config
 from datahub.configuration.common import (
@@ -16,7 +20,8 @@ from datahub.configuration.common import (
     OperationalError,
 )
 from datahub.emitter.mcp import MetadataChangeProposalWrapper
-from datahub.emitter.rest_emitter import DatahubRestEmitter
+from datahub.emitter.request_helper import RequestHook
+from datahub.emitter.rest_emitter import _DEFAULT_POOL_MAXSIZE, DatahubRestEmitter
 from datahub.ingestion.api.common import RecordEnvelope, WorkUnit
 from datahub.ingestion.api.sink import Sink, SinkReport, WriteCallback
 from datahub.ingestion.api.workunit import MetadataWorkUnit
@@ -26,6 +31,8 @@ from datahub.metadata.com.linkedin.pegasus2avro.mxe import (
     MetadataChangeProposal,
 )
 from datahub.metadata.com.linkedin.pegasus2avro.usage import UsageAggregation
+from datahub.telemetry.stats import calculate_percentiles, discretize
+from datahub.utilities.lossy_collections import LossyList
 from datahub.utilities.server_config_util import set_gms_config
 
 logger = logging.getLogger(__name__)
@@ -34,23 +41,91 @@ logger = logging.getLogger(__name__)
 class SyncOrAsync(ConfigEnum):
     SYNC = auto()
     ASYNC = auto()
+    ASYNC_BATCH = auto()
 
 
 class DatahubRestSinkConfig(DatahubClientConfig):
     max_pending_requests: int = 1000
     mode: SyncOrAsync = SyncOrAsync.ASYNC
 
+    # Only used when mode is ASYNC_BATCH.
+    max_per_batch: pydantic.PositiveInt = 100
+    max_batch_wait_sec: pydantic.PositiveFloat = 5.0
+
 
 @dataclass
 class DataHubRestSinkReport(SinkReport):
     gms_version: str = ""
     pending_requests: int = 0
+    batches_written: int = 0
+    batch_requests: int = 0
+    write_latency_p50_ms: Optional[float] = None
+    write_latency_p99_ms: Optional[float] = None
+    # Maps a payload size, rounded down to a power of two bytes, to a request count.
+    request_payload_size_histogram: Dict[int, int] = field(default_factory=dict)
+    http_requests_made: int = 0
+    http_connections_opened: int = 0
+    requests_per_connection: Optional[float] = None
+
+    _write_latencies_ms: LossyList[float] = field(
+        default_factory=lambda: LossyList(max_elements=10000)
+    )
+    # Requests and writes are reported from the sink's worker threads.
+    _lock: threading.Lock = field(default_factory=threading.Lock)
 
     def compute_stats(self) -> None:
         super().compute_stats()
+        with self._lock:
+            write_latencies_ms = list(self._write_latencies_ms)
+        percentiles = calculate_percentiles(write_latencies_ms, [50, 99])
+        if percentiles:
+            self.write_latency_p50_ms = round(percentiles[50], 2)
+            self.write_latency_p99_ms = round(percentiles[99], 2)
+        if self.http_connections_opened:
+            self.requests_per_connection = round(
+                self.http_requests_made / self.http_connections_opened, 2
+            )
 
     def report_write_latency(self, delta: timedelta) -> None:
-        pass
+        with self._lock:
+            self._write_latencies_ms.append(delta.total_seconds() * 1000)
+
+    def report_request_payload_size(self, payload_bytes: int) -> None:
+        bucket = discretize(payload_bytes)
+        with self._lock:
+            self.request_payload_size_histogram[bucket] = (
+                self.request_payload_size_histogram.get(bucket, 0) + 1
+            )
+
+    def report_pending_requests(self, delta: int) -> None:
+        with self._lock:
+            self.pending_requests += delta
+
+    def report_batch_written(self, requests_made: int) -> None:
+        with self._lock:
+            self.batches_written += 1
+            self.batch_requests += requests_made
+
+    def report_connection_stats(
+        self, requests_made: int, connections_opened: int
+    ) -> None:
+        with self._lock:
+            self.http_requests_made = requests_made
+            self.http_connections_opened = connections_opened
+
+
+class _ReportingRequestHook(RequestHook):
+    def __init__(self, report: DataHubRestSinkReport, emitter: DatahubRestEmitter):
+        self.report = report
+        self.emitter = emitter
+
+    def on_request(
+        self, url: str, payload_bytes: int, duration_sec: float, success: bool
+    ) -> None:
+        # Latency is sampled per HTTP request, so a batch of records counts once.
+        self.report.report_write_latency(timedelta(seconds=duration_sec))
+        self.report.report_request_payload_size(payload_bytes)
+        self.report.report_connection_stats(**self.emitter.get_connection_stats())
 
 
 class BoundedExecutor:
@@ -84,10 +159,19 @@ class BoundedExecutor:
         self.executor.shutdown(wait)
 
 
+_BatchItem = Tuple[RecordEnvelope, WriteCallback]
+
+
 class DatahubRestSink(Sink[DatahubRestSinkConfig, DataHubRestSinkReport]):
     emitter: DatahubRestEmitter
     treat_errors_as_warnings: bool = False
 
+    _batch: List[_BatchItem]
+    _batch_started_at: float
+    _batch_lock: threading.Lock
+    _batch_flusher: threading.Thread
+    _batch_shutdown: threading.Event
+
     def __post_init__(self) -> None:
         self.emitter = DatahubRestEmitter(
             self.config.server,
@@ -99,7 +183,10 @@ class DatahubRestSink(Sink[DatahubRestSinkConfig, DataHubRestSinkReport]):
             extra_headers=self.config.extra_headers,
             ca_certificate_path=self.config.ca_certificate_path,
             disable_ssl_verification=self.config.disable_ssl_verification,
+            # Each worker thread keeps its own keep-alive connection.
+            pool_maxsize=max(_DEFAULT_POOL_MAXSIZE, self.config.max_threads),
         )
+        self.emitter.add_request_hook(_ReportingRequestHook(self.report, self.emitter))
         try:
             gms_config = self.emitter.test_connection()
         except Exception as exc:
@@ -122,6 +209,18 @@ class DatahubRestSink(Sink[DatahubRestSinkConfig, DataHubRestSinkReport]):
             bound=self.config.max_pending_requests,
         )
 
+        self._batch = []
+        self._batch_started_at = 0.0
+        self._batch_lock = threading.Lock()
+        self._batch_shutdown = threading.Event()
+        if self.config.mode == SyncOrAsync.ASYNC_BATCH:
+            self._batch_flusher = threading.Thread(
+                target=self._flush_stale_batches,
+                name="datahub-rest-batch-flusher",
+                daemon=True,
+            )
+            self._batch_flusher.start()
+
     def handle_work_unit_start(self, workunit: WorkUnit) -> None:
         if isinstance(workunit, MetadataWorkUnit):
             mwu: MetadataWorkUnit = cast(MetadataWorkUnit, workunit)
@@ -136,7 +235,7 @@ class DatahubRestSink(Sink[DatahubRestSinkConfig, DataHubRestSinkReport]):
         write_callback: WriteCallback,
         future: concurrent.futures.Future,
     ) -> None:
-        self.report.pending_requests -= 1
+        self.report.report_pending_requests(-1)
         if future.cancelled():
             self.report.report_failure({"error": "future was cancelled"})
             write_callback.on_failure(
@@ -145,39 +244,45 @@ class DatahubRestSink(Sink[DatahubRestSinkConfig, DataHubRestSinkReport]):
         elif future.done():
             e = future.exception()
             if not e:
-                start_time, end_time = future.result()
                 self.report.report_record_written(record_envelope)
-                self.report.report_write_latency(end_time - start_time)
                 write_callback.on_success(record_envelope, {})
-            elif isinstance(e, OperationalError):
-                # only OperationalErrors should be ignored
-                # trim exception stacktraces in all cases when reporting
-                if "stackTrace" in e.info:
-                    with contextlib.suppress(Exception):
-                        e.info["stackTrace"] = "\n".join(
-                            e.info["stackTrace"].split("\n")[:3]
-                        )
-                        e.info["message"] = e.info.get("message", "").split("\n")[0][
-                            :200
-                        ]
-
-                # Include information about the entity that failed.
-                record = record_envelope.record
-                if isinstance(record, MetadataChangeProposalWrapper):
-                    entity_id = record.entityUrn
-                    e.info["id"] = entity_id
-                elif isinstance(record, MetadataChangeEvent):
-                    entity_id = record.proposedSnapshot.urn
-                    e.info["id"] = entity_id
-
-                if not self.treat_errors_as_warnings:
-                    self.report.report_failure({"error": e.message, "info": e.info})
-                else:
-                    self.report.report_warning({"warning": e.message, "info": e.info})
-                write_callback.on_failure(record_envelope, e, e.info)
             else:
-                self.report.report_failure({"e": e})
-                write_callback.on_failure(record_envelope, Exception(e), {})
+                self._report_write_failure(record_envelope, write_callback, e)
+
+    def _report_write_failure(
+        self,
+        record_envelope: RecordEnvelope,
+        write_callback: WriteCallback,
+        e: BaseException,
+    ) -> None:
+        if isinstance(e, OperationalError):
+            # only OperationalErrors should be ignored
+            # The info dict is copied, so that the exception itself isn't modified.
+            info = dict(e.info)
+
+            # trim exception stacktraces in all cases when reporting
+            if "stackTrace" in info:
+                with contextlib.suppress(Exception):
+                    info["stackTrace"] = "\n".join(info["stackTrace"].split("\n")[:3])
+                    info["message"] = info.get("message", "").split("\n")[0][:200]
+
+            # Include information about the entity that failed.
+            record = record_envelope.record
+            if isinstance(record, MetadataChangeProposalWrapper):
+                entity_id = record.entityUrn
+                info["id"] = entity_id
+            elif isinstance(record, MetadataChangeEvent):
+                entity_id = record.proposedSnapshot.urn
+                info["id"] = entity_id
+
+            if not self.treat_errors_as_warnings:
+                self.report.report_failure({"error": e.message, "info": info})
+            else:
+                self.report.report_warning({"warning": e.message, "info": info})
+            write_callback.on_failure(record_envelope, e, info)
+        else:
+            self.report.report_failure({"e": e})
+            write_callback.on_failure(record_envelope, Exception(e), {})
 
     def write_record_async(
         self,
@@ -192,23 +297,119 @@ class DatahubRestSink(Sink[DatahubRestSinkConfig, DataHubRestSinkReport]):
         write_callback: WriteCallback,
     ) -> None:
         record = record_envelope.record
-        if self.config.mode == SyncOrAsync.ASYNC:
+        if self.config.mode == SyncOrAsync.ASYNC_BATCH and isinstance(
+            record, (MetadataChangeProposal, MetadataChangeProposalWrapper)
+        ):
+            self._add_to_batch(record_envelope, write_callback)
+        elif self.config.mode != SyncOrAsync.SYNC:
+            # Counted before submitting, since the request may finish right away.
+            self.report.report_pending_requests(1)
             write_future = self.executor.submit(self.emitter.emit, record)
             write_future.add_done_callback(
                 functools.partial(
                     self._write_done_callback, record_envelope, write_callback
                 )
             )
-            self.report.pending_requests += 1
         else:
             # execute synchronously
             try:
-                (start, end) = self.emitter.emit(record)
+                self.emitter.emit(record)
                 write_callback.on_success(record_envelope, success_metadata={})
             except Exception as e:
                 write_callback.on_failure(record_envelope, e, failure_metadata={})
 
+    def _add_to_batch(
+        self, record_envelope: RecordEnvelope, write_callback: WriteCallback
+    ) -> None:
+        full_batch = None
+        with self._batch_lock:
+            if not self._batch:
+                self._batch_started_at = time.monotonic()
+            self._batch.append((record_envelope, write_callback))
+            if len(self._batch) >= self.config.max_per_batch:
+                full_batch = self._take_batch()
+
+        if full_batch:
+            self._submit_batch(full_batch)
+
+    def _take_batch(self) -> List[_BatchItem]:
+        # Must be called with the batch lock held.
+        batch = self._batch
+        self._batch = []
+        return batch
+
+    def _flush_stale_batches(self) -> None:
+        wait_sec = self.config.max_batch_wait_sec
+        while not self._batch_shutdown.wait(timeout=wait_sec / 2):
+            stale_batch = None
+            with self._batch_lock:
+                if (
+                    self._batch
+                    and time.monotonic() - self._batch_started_at >= wait_sec
+                ):
+                    stale_batch = self._take_batch()
+            if stale_batch:
+                self._submit_batch(stale_batch)
+
+    def _emit_batch(
+        self, batch: List[_BatchItem]
+    ) -> Tuple[int, List[Optional[Exception]]]:
+        """
+        Emits a batch. Returns the number of batch requests made, and the error of
+        each record, or None for the records that were written.
+        """
+
+        records = [record_envelope.record for record_envelope, _ in batch]
+        errors: List[Optional[Exception]] = [None] * len(records)
+        requests_made = 0
+        try:
+            requests_made = self.emitter.emit_mcps(records)
+        except OperationalError as e:
+            # GMS applies a batch record by record rather than atomically, so some
+            # of the records may have been written. Writes are idempotent, so retry
+            # the records one at a time to find out which of them actually fail.
+            logger.debug(f"Batch write failed, retrying record by record: {e}")
+            for i, record in enumerate(records):
+                try:
+                    self.emitter.emit_mcp(record)
+                except Exception as record_error:
+                    errors[i] = record_error
+        return requests_made, errors
+
+    def _batch_done_callback(
+        self, batch: List[_BatchItem], future: concurrent.futures.Future
+    ) -> None:
+        if future.cancelled() or future.exception():
+            self.report.report_batch_written(0)
+            for record_envelope, write_callback in batch:
+                self._write_done_callback(record_envelope, write_callback, future)
+            return
+
+        requests_made, errors = future.result()
+        self.report.report_batch_written(requests_made)
+        for (record_envelope, write_callback), error in zip(batch, errors):
+            self.report.report_pending_requests(-1)
+            if error is None:
+                self.report.report_record_written(record_envelope)
+                write_callback.on_success(record_envelope, {})
+            else:
+                self._report_write_failure(record_envelope, write_callback, error)
+
+    def _submit_batch(self, batch: List[_BatchItem]) -> None:
+        self.report.report_pending_requests(len(batch))
+        write_future = self.executor.submit(self._emit_batch, batch)
+        write_future.add_done_callback(
+            functools.partial(self._batch_done_callback, batch)
+        )
+
     def close(self):
+        if self.config.mode == SyncOrAsync.ASYNC_BATCH:
+            self._batch_shutdown.set()
+            self._batch_flusher.join()
+            with self._batch_lock:
+                remaining = self._take_batch()
+            if remaining:
+                self._submit_batch(remaining)
         self.executor.shutdown(wait=True)
 
     def __repr__(self) -> str:
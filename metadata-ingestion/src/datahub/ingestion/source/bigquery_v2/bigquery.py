@@ -328,16 +328,16 @@ class BigqueryV2Source(StatefulIngestionSourceBase, TestableSource):
         project_ids: List[str],
         report: BigQueryV2Report,
     ) -> CapabilityReport:
-        lineage_extractor = BigqueryLineageExtractor(connection_conf, report)
-        for project_id in project_ids:
-            try:
-                logger.info(f"Lineage capability test for project {project_id}")
-                lineage_extractor.test_capability(project_id)
-            except Exception as e:
-                return CapabilityReport(
-                    capable=False,
-                    failure_reason=f"Lineage capability test failed with: {e}",
-                )
+        with BigqueryLineageExtractor(connection_conf, report) as lineage_extractor:
+            for project_id in project_ids:
+                try:
+                    logger.info(f"Lineage capability test for project {project_id}")
+                    lineage_extractor.test_capability(project_id)
+                except Exception as e:
+                    return CapabilityReport(
+                        capable=False,
+                        failure_reason=f"Lineage capability test failed with: {e}",
+                    )
 
         return CapabilityReport(capable=True)
 
@@ -1174,6 +1174,10 @@ class BigqueryV2Source(StatefulIngestionSourceBase, TestableSource):
             entityUrn=dataset_urn, aspect=schema_metadata
         ).as_workunit()
 
+    def close(self) -> None:
+        self.lineage_extractor.close()
+        super().close()
+
     def get_report(self) -> BigQueryV2Report:
         return self.report
 
@@ -10,6 +10,7 @@ import pydantic
 from datahub.ingestion.source.sql.sql_generic_profiler import ProfilingSqlReport
 from datahub.utilities.lossy_collections import LossyDict, LossyList
 from datahub.utilities.perf_timer import PerfTimer
+from datahub.utilities.sql_parser_cache import SqlParsingCacheReport
 from datahub.utilities.stats_collections import TopKDict, int_top_k_dict
 
 logger: logging.Logger = logging.getLogger(__name__)
@@ -27,6 +28,9 @@ class BigQueryV2Report(ProfilingSqlReport):
     num_lineage_entries_sql_parser_failure: TopKDict[str, int] = field(
         default_factory=int_top_k_dict
     )
+    sql_parsing_cache: SqlParsingCacheReport = field(
+        default_factory=SqlParsingCacheReport
+    )
     num_skipped_lineage_entries_other: TopKDict[str, int] = field(
         default_factory=int_top_k_dict
     )
@@ -12,6 +12,7 @@ from google.cloud.logging_v2.client import Client as GCPLoggingClient
 from ratelimiter import RateLimiter
 
 from datahub.emitter import mce_builder
+from datahub.ingestion.api.closeable import Closeable
 from datahub.ingestion.source.bigquery_v2.bigquery_audit import (
     AuditLogEntry,
     BigQueryAuditMetadata,
@@ -38,6 +39,7 @@ from datahub.metadata.schema_classes import (
 from datahub.utilities import memory_footprint
 from datahub.utilities.bigquery_sql_parser import BigQuerySQLParser
 from datahub.utilities.perf_timer import PerfTimer
+from datahub.utilities.sql_parser_cache import SqlParsingResultCache
 
 logger: logging.Logger = logging.getLogger(__name__)
 
@@ -49,7 +51,7 @@ class LineageEdge:
     type: str = DatasetLineageTypeClass.TRANSFORMED
 
 
-class BigqueryLineageExtractor:
+class BigqueryLineageExtractor(Closeable):
     BQ_FILTER_RULE_TEMPLATE_V2 = """
 resource.type=("bigquery_project")
 AND
@@ -88,6 +90,22 @@ timestamp < "{end_time}"
     def __init__(self, config: BigQueryV2Config, report: BigQueryV2Report):
         self.config = config
         self.report = report
+        self._sql_parsing_cache: Optional[SqlParsingResultCache] = None
+
+    @property
+    def sql_parsing_cache(self) -> SqlParsingResultCache:
+        # Created on first use, so that extractors that never parse SQL, e.g. the
+        # one used to test the connection, don't open the cache file.
+        if self._sql_parsing_cache is None:
+            self._sql_parsing_cache = SqlParsingResultCache(
+                self.report.sql_parsing_cache, self.config.sql_parser_cache_file
+            )
+        return self._sql_parsing_cache
+
+    def close(self) -> None:
+        if self._sql_parsing_cache is not None:
+            self._sql_parsing_cache.close()
+            self._sql_parsing_cache = None
 
     def error(self, log: logging.Logger, key: str, reason: str) -> None:
         self.report.report_warning(key, reason)
@@ -485,14 +503,13 @@ timestamp < "{end_time}"
                 # in the references. There is no distinction between direct/base objects accessed. So doing sql parsing
                 # to ensure we only use direct objects accessed for lineage
                 try:
-                    parser = BigQuerySQLParser(
+                    tables, _ = self.sql_parsing_cache.get_tables_columns(
+                        BigQuerySQLParser,
                         e.query,
-                        self.config.sql_parser_use_external_process,
+                        use_external_process=self.config.sql_parser_use_external_process,
                         use_raw_names=self.config.lineage_sql_parser_use_raw_names,
                     )
-                    referenced_objs = set(
-                        map(lambda x: x.split(".")[-1], parser.get_tables())
-                    )
+                    referenced_objs = set(map(lambda x: x.split(".")[-1], tables))
                 except Exception as ex:
                     logger.debug(
                         f"Sql Parser failed on query: {e.query}. It won't cause any issue except table/view lineage can't be detected reliably. The error was {ex}."
@@ -521,12 +538,12 @@ timestamp < "{end_time}"
 
         parsed_tables = set()
         try:
-            parser = BigQuerySQLParser(
+            tables, _ = self.sql_parsing_cache.get_tables_columns(
+                BigQuerySQLParser,
                 view.view_definition,
-                self.config.sql_parser_use_external_process,
+                use_external_process=self.config.sql_parser_use_external_process,
                 use_raw_names=self.config.lineage_sql_parser_use_raw_names,
             )
-            tables = parser.get_tables()
         except Exception as ex:
             logger.debug(
                 f"View {view.name} definination sql parsing failed on query: {view.view_definition}. "
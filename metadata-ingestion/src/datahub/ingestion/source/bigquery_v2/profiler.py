@@ -223,10 +223,8 @@ WHERE
                 self.config.env,
             )
             # We don't add to the profiler state if we only do table level profiling as it always happens
-            if self.state_handler and not request.profile_table_level_only:
-                self.state_handler.add_to_state(
-                    dataset_urn, int(datetime.now().timestamp() * 1000)
-                )
+            if not request.profile_table_level_only:
+                self.add_to_profiling_state(dataset_urn, request.table)
 
             yield MetadataChangeProposalWrapper(
                 entityUrn=dataset_urn, aspect=profile
@@ -7,12 +7,14 @@ import dataclasses
 import functools
 import logging
 import threading
+import time
 import traceback
 import unittest.mock
 import uuid
 from typing import (
     Any,
     Callable,
+    Deque,
     Dict,
     Iterable,
     Iterator,
@@ -43,7 +45,14 @@ from sqlalchemy.exc import ProgrammingError
 from typing_extensions import Concatenate, ParamSpec
 
 from datahub.emitter.mce_builder import get_sys_time
-from datahub.ingestion.source.ge_profiling_config import GEProfilingConfig
+from datahub.ingestion.source.ge_profiling_config import (
+    GEProfilingConfig,
+    ProfilerEngine,
+)
+from datahub.ingestion.source.native_data_profiler import (
+    NativeDatasetProfiler,
+    get_columns_to_profile,
+)
 from datahub.ingestion.source.profiling.common import (
     Cardinality,
     convert_to_cardinality,
@@ -268,39 +277,12 @@ class _SingleDatasetProfiler(BasicDatasetProfilerBase):
     query_combiner: SQLAlchemyQueryCombiner
 
     def _get_columns_to_profile(self) -> List[str]:
-        if not self.config.any_field_level_metrics_enabled():
-            return []
-
-        # Compute columns to profile
-        columns_to_profile: List[str] = []
-        # Compute ignored columns
-        ignored_columns: List[str] = []
-        for col in self.dataset.get_table_columns():
-            # We expect the allow/deny patterns to specify '<table_pattern>.<column_pattern>'
-            if not self.config._allow_deny_patterns.allowed(
-                f"{self.dataset_name}.{col}"
-            ):
-                ignored_columns.append(col)
-            else:
-                columns_to_profile.append(col)
-        if ignored_columns:
-            self.report.report_dropped(
-                f"The profile of columns by pattern {self.dataset_name}({', '.join(sorted(ignored_columns))})"
-            )
-
-        if self.config.max_number_of_fields_to_profile is not None:
-            if len(columns_to_profile) > self.config.max_number_of_fields_to_profile:
-                columns_being_dropped = columns_to_profile[
-                    self.config.max_number_of_fields_to_profile :
-                ]
-                columns_to_profile = columns_to_profile[
-                    : self.config.max_number_of_fields_to_profile
-                ]
-                if self.config.report_dropped_profiles:
-                    self.report.report_dropped(
-                        f"The max_number_of_fields_to_profile={self.config.max_number_of_fields_to_profile} reached. Profile of columns {self.dataset_name}({', '.join(sorted(columns_being_dropped))})"
-                    )
-        return columns_to_profile
+        return get_columns_to_profile(
+            self.dataset.get_table_columns(),
+            self.dataset_name,
+            self.config,
+            self.report,
+        )
 
     @_run_with_query_combiner
     def _get_column_type(self, column_spec: _SingleColumnSpec, column: str) -> None:
@@ -688,6 +670,26 @@ class GEContext:
     datasource_name: str
 
 
+@dataclasses.dataclass
+class _RunningProfileRequest:
+    start_time: float
+    connection: Optional[Connection] = None
+
+
+def _cancel_running_query(connection: Connection) -> bool:
+    # The pool's connection proxy forwards attribute lookups to the DB-API
+    # connection. Only some drivers (e.g. psycopg2) support cancellation.
+    try:
+        cancel = getattr(connection.connection, "cancel", None)
+        if cancel is None:
+            return False
+        cancel()
+        return True
+    except Exception as e:
+        logger.debug(f"Failed to cancel running profiling query: {e}")
+        return False
+
+
 @dataclasses.dataclass
 class DatahubGEProfiler:
     report: SQLSourceReport
@@ -698,6 +700,11 @@ class DatahubGEProfiler:
     base_engine: Engine
     platform: str  # passed from parent source config
 
+    # Profile requests that are currently being worked on, keyed by the id of the request.
+    _running_requests: Dict[int, _RunningProfileRequest]
+    _running_requests_lock: threading.Lock
+    _thread_local: threading.local
+
     # The actual value doesn't matter, it just matters that we use it consistently throughout.
     _datasource_name_base: str = "my_sqlalchemy_datasource"
 
@@ -713,6 +720,10 @@ class DatahubGEProfiler:
         self.times_taken = []
         self.total_row_count = 0
 
+        self._running_requests = {}
+        self._running_requests_lock = threading.Lock()
+        self._thread_local = threading.local()
+
         # TRICKY: The call to `.engine` is quite important here. Connection.connect()
         # returns a "branched" connection, which does not actually use a new underlying
         # DB-API object from the connection pool. Engine.connect() does what we want to
@@ -739,6 +750,12 @@ class DatahubGEProfiler:
     @contextlib.contextmanager
     def _ge_context(self) -> Iterator[GEContext]:
         with self.base_engine.connect() as conn:
+            running_request: Optional[_RunningProfileRequest] = getattr(
+                self._thread_local, "running_request", None
+            )
+            if running_request is not None:
+                running_request.connection = conn
+
             data_context = BaseDataContext(
                 project_config=DataContextConfig(
                     # The datasource will be added via add_datasource().
@@ -800,24 +817,15 @@ class DatahubGEProfiler:
                     "great_expectations.dataset.sqlalchemy_dataset.SqlAlchemyDataset._get_column_quantiles_bigquery",
                     _get_column_quantiles_bigquery_patch,
                 ):
-                    async_profiles = collections.deque(
-                        async_executor.submit(
-                            self._generate_profile_from_request,
-                            query_combiner,
-                            request,
-                            platform=platform,
-                            profiler_args=profiler_args,
-                        )
-                        for request in requests
+                    yield from self._generate_profiles_from_requests(
+                        async_executor,
+                        query_combiner,
+                        requests,
+                        max_workers,
+                        platform=platform,
+                        profiler_args=profiler_args,
                     )
 
-                    # Avoid using as_completed so that the results are yielded in the
-                    # same order as the requests.
-                    # for async_profile in concurrent.futures.as_completed(async_profiles):
-                    while len(async_profiles) > 0:
-                        async_profile = async_profiles.popleft()
-                        yield async_profile.result()
-
                     total_time_taken = timer.elapsed_seconds()
 
                     logger.info(
@@ -853,6 +861,124 @@ class DatahubGEProfiler:
 
                     self.report.report_from_query_combiner(query_combiner.report)
 
+    def _generate_profiles_from_requests(
+        self,
+        async_executor: concurrent.futures.ThreadPoolExecutor,
+        query_combiner: SQLAlchemyQueryCombiner,
+        requests: List[GEProfilerRequest],
+        max_workers: int,
+        platform: Optional[str] = None,
+        profiler_args: Optional[Dict] = None,
+    ) -> Iterable[Tuple[GEProfilerRequest, Optional[DatasetProfileClass]]]:
+        max_pending_requests = self.config.max_pending_profile_requests
+        if max_pending_requests is None and self.config.profile_in_completion_order:
+            max_pending_requests = 2 * max(max_workers, 1)
+        timeout = self.config.profile_table_timeout_sec
+
+        remaining_requests = iter(requests)
+        # Requests that have been submitted but not yet yielded, in submission order.
+        pending: Deque[
+            Tuple[concurrent.futures.Future, GEProfilerRequest]
+        ] = collections.deque()
+
+        while True:
+            while max_pending_requests is None or len(pending) < max_pending_requests:
+                request = next(remaining_requests, None)
+                if request is None:
+                    break
+                future = async_executor.submit(
+                    self._generate_profile_from_request,
+                    query_combiner,
+                    request,
+                    platform=platform,
+                    profiler_args=profiler_args,
+                )
+                pending.append((future, request))
+
+            if not pending:
+                break
+
+            if not self.config.profile_in_completion_order:
+                # Yield in the same order as the requests, so only the oldest request
+                # needs to be waited on.
+                future, request = pending.popleft()
+                yield self._wait_for_profile(future, request, timeout)
+                continue
+
+            done, _ = concurrent.futures.wait(
+                [future for future, _ in pending],
+                timeout=self._get_wait_timeout(
+                    (request for _, request in pending), timeout
+                ),
+                return_when=concurrent.futures.FIRST_COMPLETED,
+            )
+            still_pending: Deque[
+                Tuple[concurrent.futures.Future, GEProfilerRequest]
+            ] = collections.deque()
+            for future, request in pending:
+                if future in done:
+                    yield future.result()
+                elif timeout is not None and self._check_timed_out(request, timeout):
+                    yield request, None
+                else:
+                    still_pending.append((future, request))
+            pending = still_pending
+
+    def _wait_for_profile(
+        self,
+        future: concurrent.futures.Future,
+        request: GEProfilerRequest,
+        timeout: Optional[float],
+    ) -> Tuple[GEProfilerRequest, Optional[DatasetProfileClass]]:
+        if timeout is None:
+            return future.result()
+        while True:
+            try:
+                return future.result(timeout=self._get_wait_timeout([request], timeout))
+            except concurrent.futures.TimeoutError:
+                if self._check_timed_out(request, timeout):
+                    return request, None
+
+    def _get_wait_timeout(
+        self, requests: Iterable[GEProfilerRequest], timeout: Optional[float]
+    ) -> Optional[float]:
+        if timeout is None:
+            return None
+
+        with self._running_requests_lock:
+            start_times = [
+                self._running_requests[id(request)].start_time
+                for request in requests
+                if id(request) in self._running_requests
+            ]
+        if not start_times:
+            return timeout
+        return max(0.0, min(start_times) + timeout - time.perf_counter())
+
+    def _check_timed_out(self, request: GEProfilerRequest, timeout: float) -> bool:
+        with self._running_requests_lock:
+            running_request = self._running_requests.get(id(request))
+            if (
+                running_request is None
+                or time.perf_counter() - running_request.start_time < timeout
+            ):
+                return False
+            # The worker will keep running until its current query returns, so we stop
+            # tracking it here to make sure that we only report the timeout once.
+            del self._running_requests[id(request)]
+
+        cancelled = running_request.connection is not None and _cancel_running_query(
+            running_request.connection
+        )
+        logger.warning(
+            f"Profiling {request.pretty_name} timed out after {timeout} seconds"
+            + ("; cancelled its running query" if cancelled else "")
+        )
+        self.report.report_warning(
+            request.pretty_name, f"Profiling timed out after {timeout} seconds"
+        )
+        return True
+
     def _generate_profile_from_request(
         self,
         query_combiner: SQLAlchemyQueryCombiner,
@@ -860,13 +986,22 @@ class DatahubGEProfiler:
         platform: Optional[str] = None,
         profiler_args: Optional[Dict] = None,
     ) -> Tuple[GEProfilerRequest, Optional[DatasetProfileClass]]:
-        return request, self._generate_single_profile(
-            query_combiner=query_combiner,
-            pretty_name=request.pretty_name,
-            platform=platform,
-            profiler_args=profiler_args,
-            **request.batch_kwargs,
-        )
+        running_request = _RunningProfileRequest(start_time=time.perf_counter())
+        with self._running_requests_lock:
+            self._running_requests[id(request)] = running_request
+        self._thread_local.running_request = running_request
+        try:
+            return request, self._generate_single_profile(
+                query_combiner=query_combiner,
+                pretty_name=request.pretty_name,
+                platform=platform,
+                profiler_args=profiler_args,
+                **request.batch_kwargs,
+            )
+        finally:
+            self._thread_local.running_request = None
+            with self._running_requests_lock:
+                self._running_requests.pop(id(request), None)
 
     def _drop_trino_temp_table(self, temp_dataset: Dataset) -> None:
         schema = temp_dataset._table.schema
@@ -894,6 +1029,13 @@ class DatahubGEProfiler:
             f"Received single profile request for {pretty_name} for {schema}, {table}, {custom_sql}"
         )
 
+        if (
+            self.config.profiler_engine == ProfilerEngine.NATIVE
+            and custom_sql is None
+            and table is not None
+        ):
+            return self._generate_native_profile(pretty_name, schema, table, partition)
+
         ge_config = {
             "schema": schema,
             "table": table,
@@ -1037,6 +1179,48 @@ class DatahubGEProfiler:
                 if self.base_engine.engine.name == "trino":
                     self._drop_trino_temp_table(batch)
 
+    def _generate_native_profile(
+        self,
+        pretty_name: str,
+        schema: Optional[str],
+        table: str,
+        partition: Optional[str],
+    ) -> Optional[DatasetProfileClass]:
+        with self.base_engine.connect() as conn, PerfTimer() as timer:
+            running_request: Optional[_RunningProfileRequest] = getattr(
+                self._thread_local, "running_request", None
+            )
+            if running_request is not None:
+                running_request.connection = conn
+
+            try:
+                logger.info(f"Profiling {pretty_name}")
+                profile = NativeDatasetProfiler(
+                    conn,
+                    pretty_name,
+                    schema,
+                    table,
+                    partition,
+                    self.config,
+                    self.report,
+                ).generate_dataset_profile()
+
+                time_taken = timer.elapsed_seconds()
+                logger.info(
+                    f"Finished profiling {pretty_name}; took {time_taken:.3f} seconds"
+                )
+                self.times_taken.append(time_taken)
+                if profile.rowCount is not None:
+                    self.total_row_count += profile.rowCount
+
+                return profile
+            except Exception as e:
+                if not self.config.catch_exceptions:
+                    raise e
+                logger.exception(f"Encountered exception while profiling {pretty_name}")
+                self.report.report_warning(pretty_name, f"Profiling exception {e}")
+                return None
+
     def _get_ge_dataset(
         self,
         ge_context: GEContext,
@@ -1,12 +1,13 @@
 import datetime
 import logging
 import os
+from enum import auto
 from typing import Any, Dict, List, Optional
 
 import pydantic
 from pydantic.fields import Field
 
-from datahub.configuration.common import AllowDenyPattern, ConfigModel
+from datahub.configuration.common import AllowDenyPattern, ConfigEnum, ConfigModel
 
 _PROFILING_FLAGS_TO_REPORT = {
     "turn_off_expensive_profiling_metrics",
@@ -18,10 +19,19 @@ _PROFILING_FLAGS_TO_REPORT = {
 logger = logging.getLogger(__name__)
 
 
+class ProfilerEngine(ConfigEnum):
+    GREAT_EXPECTATIONS = auto()
+    NATIVE = auto()
+
+
 class GEProfilingConfig(ConfigModel):
     enabled: bool = Field(
         default=False, description="Whether profiling should be done."
     )
+    profiler_engine: ProfilerEngine = Field(
+        default=ProfilerEngine.GREAT_EXPECTATIONS,
+        description="*This feature is still experimental.* The engine used to profile tables. `native` computes all column statistics of a table in a single aggregate query, using approximate functions where the warehouse has them, instead of issuing Great Expectations queries per column. It does not support histograms, and only computes medians and quantiles on warehouses with a percentile aggregate. Profiling requests with custom SQL always use Great Expectations.",
+    )
     limit: Optional[int] = Field(
         default=None,
         description="Max number of documents to profile. By default, profiles all documents.",
@@ -105,6 +115,11 @@ class GEProfilingConfig(ConfigModel):
         description="Profile table only if it has been updated since these many number of days. If set to `null`, no constraint of last modified time for tables to profile. Supported only in `snowflake` and `BigQuery`.",
     )
 
+    max_profile_age_days: Optional[pydantic.PositiveFloat] = Field(
+        default=None,
+        description="With stateful ingestion, tables whose last altered time, row count and size haven't changed since their last profile are not profiled again. This forces tables to be re-profiled once their last profile is older than this many days. If set to `null`, unchanged tables are never re-profiled. Supported only in `snowflake`, `BigQuery` and `redshift`.",
+    )
+
     profile_table_size_limit: Optional[int] = Field(
         default=5,
         description="Profile tables only if their size is less then specified GBs. If set to `null`, no limit on the size of tables to profile. Supported only in `snowflake` and `BigQuery`",
@@ -130,6 +145,21 @@ class GEProfilingConfig(ConfigModel):
         description="Number of worker threads to use for profiling. Set to 1 to disable.",
     )
 
+    profile_in_completion_order: bool = Field(
+        default=False,
+        description="Emit each table's profile as soon as it is done, instead of in the order the tables were requested. This keeps a single slow table from holding back the profiles of all other tables.",
+    )
+
+    max_pending_profile_requests: Optional[pydantic.PositiveInt] = Field(
+        default=None,
+        description="Maximum number of tables that are submitted to the profiling thread pool at a time. Defaults to twice `max_workers` when `profile_in_completion_order` is enabled, and no limit otherwise.",
+    )
+
+    profile_table_timeout_sec: Optional[pydantic.PositiveFloat] = Field(
+        default=None,
+        description="Maximum number of seconds to spend profiling a single table. Tables that take longer are skipped, and their running query is cancelled if the database driver supports it. Otherwise, the worker thread stays busy until the query returns, so a timed out table still holds on to one of `max_workers` threads.",
+    )
+
     # The query combiner enables us to combine multiple queries into a single query,
     # reducing the number of round-trips to the database and speeding up profiling.
     query_combiner_enabled: bool = Field(
@@ -0,0 +1,207 @@
+import copy
+import glob
+import hashlib
+import json
+import logging
+import multiprocessing
+import pathlib
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import lkml
+import lkml.simple
+
+from datahub.ingestion.api.closeable import Closeable
+from datahub.ingestion.api.report import Report
+from datahub.utilities.persistent_cache import PersistentCacheTable
+
+logger = logging.getLogger(__name__)
+
+# Patch lkml to support the local_dependency and remote_dependency keywords.
+# This lives here so that it also applies in the worker processes that parse files.
+lkml.simple.PLURAL_KEYS = (
+    *lkml.simple.PLURAL_KEYS,
+    "local_dependency",
+    "remote_dependency",
+)
+
+# Bump the version whenever the parsed representation changes, e.g. with the lkml
+# patch above, so that results cached by older versions are ignored.
+_CACHE_TABLE_NAME = "lookml_parse_results_v1"
+
+# Below this many files, starting worker processes costs more than it saves.
+_MIN_FILES_FOR_PARALLEL_PARSING = 50
+
+# Parse results are the parsed file, or an error message if parsing failed.
+_ParseResult = Tuple[Optional[dict], Optional[str]]
+
+
+@dataclass
+class LookMLFileCacheReport(Report):
+    files_preloaded: int = 0
+    disk_hits: int = 0
+    files_parsed: int = 0
+    parse_failures: int = 0
+
+
+def _parse_lookml(raw_file_content: str) -> _ParseResult:
+    try:
+        return lkml.load(raw_file_content), None
+    except Exception as e:
+        return None, f"{type(e).__name__}: {e}"
+
+
+def _content_hash(raw_file_content: str) -> str:
+    return hashlib.sha256(raw_file_content.encode("utf-8")).hexdigest()
+
+
+class LookMLFileCache(Closeable):
+    """
+    Reads and parses LookML files once per run, and resolves include globs once per run.
+
+    Files can be preloaded up front, in which case the files that aren't cached yet are
+    parsed in parallel by a pool of worker processes. If a cache file is configured,
+    parse results are also stored in a SQLite table keyed on a hash of the file content,
+    so unchanged files are not parsed again in later runs. Any error with the cache file
+    disables it, and files are then only cached in memory.
+    """
+
+    def __init__(
+        self,
+        report: LookMLFileCacheReport,
+        cache_file: Optional[str] = None,
+        max_workers: int = 1,
+    ) -> None:
+        self.report = report
+        self.max_workers = max_workers
+        # Keyed on the resolved path of the file.
+        self._files: Dict[str, Tuple[str, _ParseResult]] = {}
+        self._globs: Dict[str, List[str]] = {}
+
+        self._disk_cache: Optional[PersistentCacheTable] = (
+            PersistentCacheTable(cache_file, _CACHE_TABLE_NAME) if cache_file else None
+        )
+
+    def _lookup(self, key: str) -> Optional[dict]:
+        if self._disk_cache is None:
+            return None
+        value = self._disk_cache.get(key)
+        if value is None:
+            return None
+        try:
+            parsed = json.loads(value)
+        except ValueError as e:
+            logger.debug(f"Ignoring unreadable cached LookML parse result: {e}")
+            return None
+        self.report.disk_hits += 1
+        return parsed
+
+    def _store(self, path: str, raw_file_content: str, result: _ParseResult) -> None:
+        self._files[path] = (raw_file_content, result)
+        self.report.files_parsed += 1
+        parsed, error = result
+        if error is not None:
+            self.report.parse_failures += 1
+        elif self._disk_cache is not None:
+            self._disk_cache.set(_content_hash(raw_file_content), json.dumps(parsed))
+
+    def preload(self, paths: Iterable[str]) -> None:
+        """
+        Reads and parses the given files, so that later loads don't have to.
+
+        Files that can't be read are skipped here; loading them reports the error.
+        """
+
+        to_parse: List[Tuple[str, str]] = []
+        for path in paths:
+            path = str(pathlib.Path(path).resolve())
+            if path in self._files:
+                continue
+            try:
+                with open(path, "r") as file:
+                    raw_file_content = file.read()
+            except OSError as e:
+                logger.debug(f"Unable to preload {path}: {e}")
+                continue
+            self.report.files_preloaded += 1
+
+            parsed = self._lookup(_content_hash(raw_file_content))
+            if parsed is not None:
+                self._files[path] = (raw_file_content, (parsed, None))
+            else:
+                to_parse.append((path, raw_file_content))
+
+        if not to_parse:
+            return
+        logger.info(f"Parsing {len(to_parse)} LookML files")
+        if self.max_workers > 1 and len(to_parse) >= _MIN_FILES_FOR_PARALLEL_PARSING:
+            # The source can run alongside transformer and sink threads, and forking
+            # a multi-threaded process can deadlock on locks held at fork time.
+            with ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            ) as executor:
+                results: Iterable[_ParseResult] = executor.map(
+                    _parse_lookml,
+                    [raw_file_content for _, raw_file_content in to_parse],
+                    chunksize=max(1, len(to_parse) // (self.max_workers * 4)),
+                )
+                for (path, raw_file_content), result in zip(to_parse, results):
+                    self._store(path, raw_file_content, result)
+        else:
+            for path, raw_file_content in to_parse:
+                self._store(path, raw_file_content, _parse_lookml(raw_file_content))
+
+    def load(self, path: str) -> Tuple[str, dict]:
+        """
+        Returns the raw content and the parsed LookML of a file.
+
+        The parsed LookML is a fresh copy, so callers are free to modify it.
+        Raises an exception if the file could not be read or parsed.
+        """
+
+        path = str(pathlib.Path(path).resolve())
+        if path not in self._files:
+            with open(path, "r") as file:
+                raw_file_content = file.read()
+            parsed = self._lookup(_content_hash(raw_file_content))
+            if parsed is not None:
+                self._files[path] = (raw_file_content, (parsed, None))
+            else:
+                self._store(path, raw_file_content, _parse_lookml(raw_file_content))
+
+        raw_file_content, (parsed, error) = self._files[path]
+        if error is not None:
+            raise ValueError(error)
+        assert parsed is not None
+        return raw_file_content, copy.deepcopy(parsed)
+
+    def glob_files(self, glob_expr: str) -> List[str]:
+        """
+        Returns the resolved paths of the files matching an include glob, with or
+        without the `.lkml` extension. Results are cached, since many files of a
+        project tend to include the same globs.
+        """
+
+        if glob_expr not in self._globs:
+            self._globs[glob_expr] = [
+                str(p.resolve())
+                for p in [
+                    pathlib.Path(p)
+                    for p in sorted(
+                        glob.glob(glob_expr, recursive=True)
+                        + glob.glob(f"{glob_expr}.lkml", recursive=True)
+                    )
+                ]
+                # We don't want to match directories. The '**' glob can be used to
+                # recurse into directories.
+                if p.is_file()
+            ]
+        return list(self._globs[glob_expr])
+
+    def close(self) -> None:
+        self._files.clear()
+        self._globs.clear()
+        if self._disk_cache is not None:
+            self._disk_cache.close()
@@ -1,5 +1,4 @@
 import copy
-import glob
 import itertools
 import logging
 import pathlib
@@ -21,7 +20,6 @@ from typing import (
 )
 
 import lkml
-import lkml.simple
 import pydantic
 from looker_sdk.error import SDKError
 from looker_sdk.sdk.api40.models import DBConnection
@@ -63,6 +61,10 @@ from datahub.ingestion.source.looker.looker_lib_wrapper import (
     LookerAPIConfig,
     TransportOptionsConfig,
 )
+from datahub.ingestion.source.looker.lookml_file_cache import (
+    LookMLFileCache,
+    LookMLFileCacheReport,
+)
 from datahub.ingestion.source.state.entity_removal_state import GenericCheckpointState
 from datahub.ingestion.source.state.stale_entity_removal_handler import (
     StaleEntityRemovalHandler,
@@ -95,18 +97,15 @@ from datahub.utilities.source_helpers import (
     auto_status_aspect,
 )
 from datahub.utilities.sql_parser import SQLParser
+from datahub.utilities.sql_parser_cache import (
+    SqlParsingCacheReport,
+    SqlParsingResultCache,
+)
 
 logger = logging.getLogger(__name__)
 
 _BASE_PROJECT_NAME = "__BASE"
 
-# Patch lkml to support the local_dependency and remote_dependency keywords.
-lkml.simple.PLURAL_KEYS = (
-    *lkml.simple.PLURAL_KEYS,
-    "local_dependency",
-    "remote_dependency",
-)
-
 _EXPLORE_FILE_EXTENSION = ".explore.lkml"
 _VIEW_FILE_EXTENSION = ".view.lkml"
 _MODEL_FILE_EXTENSION = ".model.lkml"
@@ -246,6 +245,18 @@ class LookMLSourceConfig(
         False,
         description="When enabled, sql parsing will be executed in a separate process to prevent memory leaks.",
     )
+    sql_parser_cache_file: Optional[str] = Field(
+        None,
+        description="Path to a SQLite file used to cache sql parsing results of derived tables across runs. If not set, results are only cached in memory for the duration of the run.",
+    )
+    lookml_parse_cache_file: Optional[str] = Field(
+        None,
+        description="Path to a SQLite file used to cache parsed LookML files across runs, keyed on a hash of the file content. If not set, files are only cached in memory for the duration of the run.",
+    )
+    max_lookml_parse_workers: pydantic.PositiveInt = Field(
+        4,
+        description="Number of processes used to parse the LookML files of the project(s) up front. Set to 1 to parse files on the main process.",
+    )
     stateful_ingestion: Optional[StatefulStaleMetadataRemovalConfig] = Field(
         default=None, description=""
     )
@@ -324,6 +335,12 @@ class LookMLSourceReport(StaleEntityRemovalSourceReport):
     query_parse_attempts: int = 0
     query_parse_failures: int = 0
     query_parse_failure_views: List[str] = dataclass_field(default_factory=LossyList)
+    sql_parsing_cache: SqlParsingCacheReport = dataclass_field(
+        default_factory=SqlParsingCacheReport
+    )
+    lookml_file_cache: LookMLFileCacheReport = dataclass_field(
+        default_factory=LookMLFileCacheReport
+    )
     _looker_api: Optional[LookerAPI] = None
 
     def report_models_scanned(self) -> None:
@@ -362,6 +379,7 @@ class LookerModel:
         base_projects_folders: Dict[str, pathlib.Path],
         path: str,
         reporter: LookMLSourceReport,
+        file_cache: LookMLFileCache,
     ) -> "LookerModel":
         logger.debug(f"Loading model from {path}")
         connection = looker_model_dict["connection"]
@@ -373,6 +391,7 @@ class LookerModel:
             base_projects_folders,
             path,
             reporter,
+            file_cache,
             seen_so_far=set(),
             traversal_path=pathlib.Path(path).stem,
         )
@@ -386,10 +405,9 @@ class LookerModel:
         ]
         for included_file in explore_files:
             try:
-                with open(included_file, "r") as file:
-                    parsed = lkml.load(file)
-                    included_explores = parsed.get("explores", [])
-                    explores.extend(included_explores)
+                _, parsed = file_cache.load(included_file)
+                included_explores = parsed.get("explores", [])
+                explores.extend(included_explores)
             except Exception as e:
                 reporter.report_warning(
                     path, f"Failed to load {included_file} due to {e}"
@@ -411,6 +429,7 @@ class LookerModel:
         base_projects_folder: Dict[str, pathlib.Path],
         path: str,
         reporter: LookMLSourceReport,
+        file_cache: LookMLFileCache,
         seen_so_far: Set[str],
         traversal_path: str = "",  # a cosmetic parameter to aid debugging
     ) -> List[ProjectInclude]:
@@ -476,19 +495,7 @@ class LookerModel:
                 glob_expr = str(pathlib.Path(path).parent / inc)
             # "**" matches an arbitrary number of directories in LookML
             # we also resolve these paths to absolute paths so we can de-dup effectively later on
-            included_files = [
-                str(p.resolve())
-                for p in [
-                    pathlib.Path(p)
-                    for p in sorted(
-                        glob.glob(glob_expr, recursive=True)
-                        + glob.glob(f"{glob_expr}.lkml", recursive=True)
-                    )
-                ]
-                # We don't want to match directories. The '**' glob can be used to
-                # recurse into directories.
-                if p.is_file()
-            ]
+            included_files = file_cache.glob_files(glob_expr)
             logger.debug(
                 f"traversal_path={traversal_path}, included_files = {included_files}, seen_so_far: {seen_so_far}"
             )
@@ -516,24 +523,24 @@ class LookerModel:
                     f"Will be loading {included_file}, traversed here via {traversal_path}"
                 )
                 try:
-                    with open(included_file, "r") as file:
-                        parsed = lkml.load(file)
-                        seen_so_far.add(included_file)
-                        if "includes" in parsed:  # we have more includes to resolve!
-                            resolved.extend(
-                                LookerModel.resolve_includes(
-                                    parsed["includes"],
-                                    resolved_project_name,
-                                    root_project_name,
-                                    base_projects_folder,
-                                    included_file,
-                                    reporter,
-                                    seen_so_far,
-                                    traversal_path=traversal_path
-                                    + "."
-                                    + pathlib.Path(included_file).stem,
-                                )
+                    _, parsed = file_cache.load(included_file)
+                    seen_so_far.add(included_file)
+                    if "includes" in parsed:  # we have more includes to resolve!
+                        resolved.extend(
+                            LookerModel.resolve_includes(
+                                parsed["includes"],
+                                resolved_project_name,
+                                root_project_name,
+                                base_projects_folder,
+                                included_file,
+                                reporter,
+                                file_cache,
+                                seen_so_far,
+                                traversal_path=traversal_path
+                                + "."
+                                + pathlib.Path(included_file).stem,
                             )
+                        )
                 except Exception as e:
                     reporter.report_warning(
                         path, f"Failed to load {included_file} due to {e}"
@@ -568,6 +575,7 @@ class LookerViewFile:
         base_projects_folder: Dict[str, pathlib.Path],
         raw_file_content: str,
         reporter: LookMLSourceReport,
+        file_cache: LookMLFileCache,
     ) -> "LookerViewFile":
         logger.debug(f"Loading view file at {absolute_file_path}")
         includes = looker_view_file_dict.get("includes", [])
@@ -581,6 +589,7 @@ class LookerViewFile:
             base_projects_folder,
             absolute_file_path,
             reporter,
+            file_cache,
             seen_so_far=seen_so_far,
         )
         logger.debug(
@@ -615,11 +624,13 @@ class LookerViewFileLoader:
         root_project_name: Optional[str],
         base_projects_folder: Dict[str, pathlib.Path],
         reporter: LookMLSourceReport,
+        file_cache: LookMLFileCache,
     ) -> None:
         self.viewfile_cache: Dict[str, LookerViewFile] = {}
         self._root_project_name = root_project_name
         self._base_projects_folder = base_projects_folder
         self.reporter = reporter
+        self._file_cache = file_cache
 
     def is_view_seen(self, path: str) -> bool:
         return path in self.viewfile_cache
@@ -644,27 +655,21 @@ class LookerViewFileLoader:
             return self.viewfile_cache[path]
 
         try:
-            with open(path, "r") as file:
-                raw_file_content = file.read()
-        except Exception as e:
-            self.reporter.report_failure(path, f"failed to load view file: {e}")
-            return None
-        try:
-            with open(path, "r") as file:
-                logger.debug(f"Loading viewfile {path}")
-                parsed = lkml.load(file)
-                looker_viewfile = LookerViewFile.from_looker_dict(
-                    absolute_file_path=path,
-                    looker_view_file_dict=parsed,
-                    project_name=project_name,
-                    root_project_name=self._root_project_name,
-                    base_projects_folder=self._base_projects_folder,
-                    raw_file_content=raw_file_content,
-                    reporter=reporter,
-                )
-                logger.debug(f"adding viewfile for path {path} to the cache")
-                self.viewfile_cache[path] = looker_viewfile
-                return looker_viewfile
+            logger.debug(f"Loading viewfile {path}")
+            raw_file_content, parsed = self._file_cache.load(path)
+            looker_viewfile = LookerViewFile.from_looker_dict(
+                absolute_file_path=path,
+                looker_view_file_dict=parsed,
+                project_name=project_name,
+                root_project_name=self._root_project_name,
+                base_projects_folder=self._base_projects_folder,
+                raw_file_content=raw_file_content,
+                reporter=reporter,
+                file_cache=self._file_cache,
+            )
+            logger.debug(f"adding viewfile for path {path} to the cache")
+            self.viewfile_cache[path] = looker_viewfile
+            return looker_viewfile
         except Exception as e:
             self.reporter.report_failure(path, f"failed to load view file: {e}")
             return None
@@ -978,10 +983,24 @@ class LookerView:
 
     @classmethod
     def _get_sql_info(
-        cls, sql: str, sql_parser_path: str, use_external_process: bool = True
+        cls,
+        sql: str,
+        sql_parser_path: str,
+        use_external_process: bool = True,
+        sql_parsing_cache: Optional[SqlParsingResultCache] = None,
     ) -> SQLInfo:
         parser_cls = cls._import_sql_parser_cls(sql_parser_path)
 
+        if sql_parsing_cache is not None:
+            try:
+                sql_table_names, column_names = sql_parsing_cache.get_tables_columns(
+                    parser_cls, sql, use_external_process=use_external_process
+                )
+            except Exception as e:
+                logger.warning(f"Sql parser failed on {sql} with {e}")
+                return SQLInfo(table_names=[], column_names=[])
+            return cls._clean_sql_info(sql_table_names, column_names)
+
         try:
             parser_instance: SQLParser = parser_cls(
                 sql, use_external_process=use_external_process
@@ -1003,6 +1022,12 @@ class LookerView:
             logger.warning(f"Sql parser failed on {sql} with {e}")
             column_names = []
 
+        return cls._clean_sql_info(sql_table_names, column_names)
+
+    @classmethod
+    def _clean_sql_info(
+        cls, sql_table_names: List[str], column_names: List[str]
+    ) -> SQLInfo:
         logger.debug(f"Column names parsed = {column_names}")
         # Drop table names with # in them
         sql_table_names = [t for t in sql_table_names if "#" not in t]
@@ -1085,6 +1110,7 @@ class LookerView:
         extract_col_level_lineage: bool = False,
         populate_sql_logic_in_descriptions: bool = False,
         process_isolation_for_sql_parsing: bool = False,
+        sql_parsing_cache: Optional[SqlParsingResultCache] = None,
     ) -> Optional["LookerView"]:
         view_name = looker_view["name"]
         logger.debug(f"Handling view {view_name} in model {model_name}")
@@ -1164,6 +1190,7 @@ class LookerView:
                         view_logic,
                         fields,
                         use_external_process=process_isolation_for_sql_parsing,
+                        sql_parsing_cache=sql_parsing_cache,
                     )
 
             elif "explore_source" in derived_table:
@@ -1232,6 +1259,7 @@ class LookerView:
         sql_query: str,
         fields: List[ViewField],
         use_external_process: bool,
+        sql_parsing_cache: Optional[SqlParsingResultCache] = None,
     ) -> Tuple[List[ViewField], List[str]]:
         sql_table_names: List[str] = []
 
@@ -1245,7 +1273,7 @@ class LookerView:
             try:
                 # test if parsing works
                 sql_info: SQLInfo = cls._get_sql_info(
-                    sql_query, sql_parser_path, use_external_process
+                    sql_query, sql_parser_path, use_external_process, sql_parsing_cache
                 )
                 if not sql_info.table_names:
                     raise Exception("Failed to find any tables")
@@ -1272,7 +1300,7 @@ class LookerView:
             # Get the list of tables in the query
         try:
             sql_info = cls._get_sql_info(
-                sql_query, sql_parser_path, use_external_process
+                sql_query, sql_parser_path, use_external_process, sql_parsing_cache
             )
             sql_table_names = sql_info.table_names
             column_names = sql_info.column_names
@@ -1463,6 +1491,14 @@ class LookMLSource(StatefulIngestionSourceBase):
         super().__init__(config, ctx)
         self.source_config = config
         self.reporter = LookMLSourceReport()
+        self.sql_parsing_cache = SqlParsingResultCache(
+            self.reporter.sql_parsing_cache, self.source_config.sql_parser_cache_file
+        )
+        self.lookml_file_cache = LookMLFileCache(
+            self.reporter.lookml_file_cache,
+            self.source_config.lookml_parse_cache_file,
+            max_workers=self.source_config.max_lookml_parse_workers,
+        )
         if self.source_config.api:
             self.looker_client = LookerAPI(self.source_config.api)
             self.reporter._looker_api = self.looker_client
@@ -1482,17 +1518,17 @@ class LookMLSource(StatefulIngestionSourceBase):
         )
 
     def _load_model(self, path: str) -> LookerModel:
-        with open(path, "r") as file:
-            logger.debug(f"Loading model from file {path}")
-            parsed = lkml.load(file)
-            looker_model = LookerModel.from_looker_dict(
-                parsed,
-                _BASE_PROJECT_NAME,
-                self.source_config.project_name,
-                self.base_projects_folder,
-                path,
-                self.reporter,
-            )
+        logger.debug(f"Loading model from file {path}")
+        _, parsed = self.lookml_file_cache.load(path)
+        looker_model = LookerModel.from_looker_dict(
+            parsed,
+            _BASE_PROJECT_NAME,
+            self.source_config.project_name,
+            self.base_projects_folder,
+            path,
+            self.reporter,
+            self.lookml_file_cache,
+        )
         return looker_model
 
     def _platform_names_have_2_parts(self, platform: str) -> bool:
@@ -1949,6 +1985,7 @@ class LookMLSource(StatefulIngestionSourceBase):
             self.source_config.project_name,
             self.base_projects_folder,
             self.reporter,
+            self.lookml_file_cache,
         )
 
         # some views can be mentioned by multiple 'include' statements and can be included via different connections.
@@ -1963,6 +2000,18 @@ class LookMLSource(StatefulIngestionSourceBase):
         )
         model_suffix_len = len(".model")
 
+        # Parse all the files that includes can refer to up front, in parallel.
+        self.lookml_file_cache.preload(
+            str(path)
+            for project_folder in self.base_projects_folder.values()
+            for extension in (
+                _MODEL_FILE_EXTENSION,
+                _VIEW_FILE_EXTENSION,
+                _EXPLORE_FILE_EXTENSION,
+            )
+            for path in sorted(project_folder.glob(f"**/*{extension}"))
+        )
+
         for file_path in model_files:
             self.reporter.report_models_scanned()
             model_name = file_path.stem[:-model_suffix_len]
@@ -2091,6 +2140,7 @@ class LookMLSource(StatefulIngestionSourceBase):
                                 self.source_config.extract_column_level_lineage,
                                 self.source_config.populate_sql_logic_for_missing_descriptions,
                                 process_isolation_for_sql_parsing=self.source_config.process_isolation_for_sql_parsing,
+                                sql_parsing_cache=self.sql_parsing_cache,
                             )
                         except Exception as e:
                             self.reporter.report_warning(
@@ -2170,4 +2220,6 @@ class LookMLSource(StatefulIngestionSourceBase):
         return self.reporter
 
     def close(self):
+        self.sql_parsing_cache.close()
+        self.lookml_file_cache.close()
         self.prepare_for_commit()
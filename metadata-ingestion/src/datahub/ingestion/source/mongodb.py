@@ -192,7 +192,8 @@ def construct_schema_pymongo(
         aggregations.append({"$limit": sample_size})
         documents = collection.aggregate(aggregations, allowDiskUse=True)
 
-    return construct_schema(list(documents), delimiter)
+    # Documents are streamed from the cursor, rather than loaded into memory up front.
+    return construct_schema(documents, delimiter)
 
 
 @platform_name("MongoDB")
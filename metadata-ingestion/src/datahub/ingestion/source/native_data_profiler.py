@@ -0,0 +1,504 @@
+import dataclasses
+import enum
+import logging
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple
+
+import sqlalchemy as sa
+from sqlalchemy.engine import Connection
+from sqlalchemy.sql.elements import ColumnElement
+from sqlalchemy.sql.expression import FromClause
+
+from datahub.emitter.mce_builder import get_sys_time
+from datahub.ingestion.source.ge_profiling_config import GEProfilingConfig
+from datahub.ingestion.source.profiling.common import (
+    Cardinality,
+    convert_to_cardinality,
+)
+from datahub.metadata.schema_classes import (
+    DatasetFieldProfileClass,
+    DatasetProfileClass,
+    PartitionSpecClass,
+    QuantileClass,
+    ValueFrequencyClass,
+)
+
+if TYPE_CHECKING:
+    from datahub.ingestion.source.sql.sql_common import SQLSourceReport
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+_QUANTILES = [0.05, 0.25, 0.5, 0.75, 0.95]
+
+_TRINO_LIKE_DIALECTS = {"trino", "presto", "awsathena"}
+_SPARK_LIKE_DIALECTS = {"databricks", "spark", "hive"}
+
+
+class _ColumnKind(enum.Enum):
+    NUMERIC = enum.auto()
+    STRING = enum.auto()
+    DATETIME = enum.auto()
+    OTHER = enum.auto()
+
+
+def _get_column_kind(type_: Any) -> _ColumnKind:
+    if isinstance(type_, sa.types.Boolean):
+        return _ColumnKind.OTHER
+    if isinstance(type_, (sa.types.Integer, sa.types.Numeric)):
+        return _ColumnKind.NUMERIC
+    if isinstance(type_, sa.types.String):
+        return _ColumnKind.STRING
+    if isinstance(type_, (sa.types.Date, sa.types.DateTime, sa.types.Time)):
+        return _ColumnKind.DATETIME
+    return _ColumnKind.OTHER
+
+
+def get_columns_to_profile(
+    all_columns: Sequence[str],
+    dataset_name: str,
+    config: GEProfilingConfig,
+    report: "SQLSourceReport",
+) -> List[str]:
+    if not config.any_field_level_metrics_enabled():
+        return []
+
+    # Compute columns to profile
+    columns_to_profile: List[str] = []
+    # Compute ignored columns
+    ignored_columns: List[str] = []
+    for col in all_columns:
+        # We expect the allow/deny patterns to specify '<table_pattern>.<column_pattern>'
+        if not config._allow_deny_patterns.allowed(f"{dataset_name}.{col}"):
+            ignored_columns.append(col)
+        else:
+            columns_to_profile.append(col)
+    if ignored_columns:
+        report.report_dropped(
+            f"The profile of columns by pattern {dataset_name}({', '.join(sorted(ignored_columns))})"
+        )
+
+    if config.max_number_of_fields_to_profile is not None:
+        if len(columns_to_profile) > config.max_number_of_fields_to_profile:
+            columns_being_dropped = columns_to_profile[
+                config.max_number_of_fields_to_profile :
+            ]
+            columns_to_profile = columns_to_profile[
+                : config.max_number_of_fields_to_profile
+            ]
+            if config.report_dropped_profiles:
+                report.report_dropped(
+                    f"The max_number_of_fields_to_profile={config.max_number_of_fields_to_profile} reached. Profile of columns {dataset_name}({', '.join(sorted(columns_being_dropped))})"
+                )
+    return columns_to_profile
+
+
+@dataclasses.dataclass
+class _ColumnSpec:
+    column: str
+    kind: _ColumnKind
+    column_profile: DatasetFieldProfileClass
+
+    stats: Dict[str, Any] = dataclasses.field(default_factory=dict)
+    cardinality: Optional[Cardinality] = None
+
+
+@dataclasses.dataclass
+class NativeDatasetProfiler:
+    """
+    Profiles a table without Great Expectations.
+
+    All column statistics are compiled into a single aggregate query, using the
+    warehouse's approximate functions where it has them. Value frequencies and
+    sample values for all columns take at most one more query each. If the
+    aggregate query fails, e.g. because a function isn't supported for one of
+    the column types, we fall back to one query per column so that a single
+    column can't fail the whole profile.
+
+    Histograms are not supported by this profiler.
+    """
+
+    conn: Connection
+    dataset_name: str
+    schema: Optional[str]
+    table: str
+    partition: Optional[str]
+    config: GEProfilingConfig
+    report: "SQLSourceReport"
+
+    @property
+    def _dialect(self) -> str:
+        return self.conn.dialect.name.lower()
+
+    def _quote(self, column: str) -> str:
+        return self.conn.dialect.identifier_preparer.quote(column)
+
+    def _get_source(self) -> FromClause:
+        if self._dialect == "bigquery" and self.schema:
+            # The table name is "dataset.table", so this becomes `project.dataset.table`.
+            source: FromClause = sa.table(f"{self.schema}.{self.table}")
+        else:
+            source = sa.table(self.table, schema=self.schema)
+
+        if self.config.limit or self.config.offset:
+            source = (
+                sa.select([sa.text("*")])
+                .select_from(source)
+                .limit(self.config.limit)
+                .offset(self.config.offset)
+                .alias("profiled")
+            )
+        return source
+
+    def _unique_count(self, column: str) -> ColumnElement:
+        if self._dialect == "redshift":
+            return sa.literal_column(
+                f"APPROXIMATE COUNT(DISTINCT {self._quote(column)})"
+            )
+        elif self._dialect in {"bigquery", "snowflake"}:
+            return sa.func.APPROX_COUNT_DISTINCT(sa.column(column))
+        elif self._dialect in _TRINO_LIKE_DIALECTS:
+            return sa.func.approx_distinct(sa.column(column))
+        elif self._dialect in _SPARK_LIKE_DIALECTS:
+            return sa.func.approx_count_distinct(sa.column(column))
+        return sa.func.count(sa.distinct(sa.column(column)))
+
+    def _percentile(self, column: str, quantile: float) -> Optional[ColumnElement]:
+        # Percentiles are passed as literals, since most warehouses require them to be constants.
+        if self._dialect == "snowflake":
+            return sa.func.APPROX_PERCENTILE(
+                sa.column(column), sa.literal_column(str(quantile))
+            )
+        elif self._dialect == "bigquery":
+            return sa.literal_column(
+                f"APPROX_QUANTILES({self._quote(column)}, 100)[OFFSET({round(quantile * 100)})]"
+            )
+        elif self._dialect in _TRINO_LIKE_DIALECTS:
+            return sa.func.approx_percentile(
+                sa.column(column), sa.literal_column(str(quantile))
+            )
+        elif self._dialect in _SPARK_LIKE_DIALECTS:
+            return sa.func.percentile_approx(
+                sa.column(column), sa.literal_column(str(quantile))
+            )
+        elif self._dialect == "postgresql":
+            return sa.func.percentile_cont(
+                sa.literal_column(str(quantile))
+            ).within_group(sa.column(column))
+        # Other warehouses either don't have a percentile aggregate, or (like Redshift)
+        # don't allow several of them with different orderings in the same query.
+        return None
+
+    def _median(self, column: str) -> Optional[ColumnElement]:
+        if self._dialect == "snowflake":
+            return sa.func.median(sa.column(column))
+        return self._percentile(column, 0.5)
+
+    def _stdev(self, column: str) -> Optional[ColumnElement]:
+        if self._dialect == "mssql":
+            return sa.func.stdev(sa.column(column))
+        elif self._dialect == "sqlite":
+            return None
+        return sa.func.stddev_samp(sa.column(column))
+
+    def _get_column_aggregates(
+        self, column_spec: _ColumnSpec
+    ) -> List[Tuple[str, ColumnElement]]:
+        column = column_spec.column
+        aggregates: List[Tuple[str, Optional[ColumnElement]]] = [
+            ("nonnull_count", sa.func.count(sa.column(column))),
+            ("unique_count", self._unique_count(column)),
+        ]
+        if column_spec.kind in {_ColumnKind.NUMERIC, _ColumnKind.DATETIME}:
+            if self.config.include_field_min_value:
+                aggregates.append(("min", sa.func.min(sa.column(column))))
+            if self.config.include_field_max_value:
+                aggregates.append(("max", sa.func.max(sa.column(column))))
+        if column_spec.kind == _ColumnKind.NUMERIC:
+            if self.config.include_field_mean_value:
+                aggregates.append(("mean", sa.func.avg(sa.column(column))))
+            if self.config.include_field_median_value:
+                aggregates.append(("median", self._median(column)))
+            if self.config.include_field_stddev_value:
+                aggregates.append(("stdev", self._stdev(column)))
+            if self.config.include_field_quantiles:
+                aggregates.extend(
+                    (f"quantile_{i}", self._percentile(column, quantile))
+                    for i, quantile in enumerate(_QUANTILES)
+                )
+        return [(stat, agg) for stat, agg in aggregates if agg is not None]
+
+    def _get_row_count_estimate(self) -> Optional[int]:
+        if not (
+            self.config.profile_table_row_count_estimate_only
+            and self._dialect == "postgresql"
+            and self.schema
+        ):
+            return None
+        return int(
+            self.conn.execute(
+                sa.text(
+                    "SELECT c.reltuples AS estimate FROM pg_class c JOIN pg_namespace n ON n.oid = c.relnamespace WHERE c.relname = :table AND n.nspname = :schema"
+                ),
+                table=self.table,
+                schema=self.schema,
+            ).scalar()
+        )
+
+    def _compute_aggregates(
+        self, source: FromClause, column_specs: List[_ColumnSpec]
+    ) -> Optional[int]:
+        row_count = self._get_row_count_estimate()
+
+        selected: List[ColumnElement] = []
+        targets: List[Tuple[Optional[_ColumnSpec], str]] = []
+        if row_count is None:
+            selected.append(sa.func.count().label("row_count"))
+            targets.append((None, "row_count"))
+        for i, column_spec in enumerate(column_specs):
+            for stat, aggregate in self._get_column_aggregates(column_spec):
+                selected.append(aggregate.label(f"c{i}_{stat}"))
+                targets.append((column_spec, stat))
+
+        if not selected:
+            return row_count
+
+        try:
+            row = self.conn.execute(sa.select(selected).select_from(source)).fetchone()
+        except Exception as e:
+            if not column_specs:
+                raise
+            logger.debug(
+                f"Combined profiling query for {self.dataset_name} failed, profiling columns one at a time: {e}"
+            )
+            return self._compute_aggregates_per_column(source, column_specs, row_count)
+
+        for (column_spec, stat), value in zip(targets, row):
+            if column_spec is None:
+                row_count = value
+            else:
+                column_spec.stats[stat] = value
+        return row_count
+
+    def _compute_aggregates_per_column(
+        self,
+        source: FromClause,
+        column_specs: List[_ColumnSpec],
+        row_count: Optional[int],
+    ) -> Optional[int]:
+        if row_count is None:
+            row_count = self.conn.execute(
+                sa.select([sa.func.count()]).select_from(source)
+            ).scalar()
+
+        for column_spec in column_specs:
+            aggregates = self._get_column_aggregates(column_spec)
+            try:
+                row = self.conn.execute(
+                    sa.select(
+                        [aggregate.label(stat) for stat, aggregate in aggregates]
+                    ).select_from(source)
+                ).fetchone()
+            except Exception as e:
+                logger.debug(
+                    f"Caught exception while attempting to profile column {column_spec.column}. {e}"
+                )
+                self.report.report_warning(
+                    "Profiling - Unable to get column statistics",
+                    f"{self.dataset_name}.{column_spec.column}",
+                )
+                continue
+            for (stat, _), value in zip(aggregates, row):
+                column_spec.stats[stat] = value
+        return row_count
+
+    def _wants_value_frequencies(self, column_spec: _ColumnSpec) -> bool:
+        if not self.config.include_field_distinct_value_frequencies:
+            return False
+        if column_spec.kind == _ColumnKind.NUMERIC:
+            return column_spec.cardinality in {
+                Cardinality.ONE,
+                Cardinality.TWO,
+                Cardinality.VERY_FEW,
+            }
+        return column_spec.cardinality in {
+            Cardinality.ONE,
+            Cardinality.TWO,
+            Cardinality.VERY_FEW,
+            Cardinality.FEW,
+        }
+
+    def _value_frequencies_query(
+        self, source: FromClause, index: int, column: str
+    ) -> Any:
+        return (
+            sa.select(
+                [
+                    sa.literal_column(str(index)).label("column_index"),
+                    sa.cast(sa.column(column), sa.String).label("value"),
+                    sa.func.count().label("frequency"),
+                ]
+            )
+            .select_from(source)
+            .where(sa.column(column).isnot(None))
+            .group_by(sa.column(column))
+        )
+
+    def _compute_value_frequencies(
+        self, source: FromClause, column_specs: List[_ColumnSpec]
+    ) -> None:
+        indexed_specs = {
+            i: column_spec
+            for i, column_spec in enumerate(column_specs)
+            if self._wants_value_frequencies(column_spec)
+        }
+        if not indexed_specs:
+            return
+
+        frequencies: Dict[int, List[Tuple[Any, int]]] = {i: [] for i in indexed_specs}
+        queries = [
+            self._value_frequencies_query(source, i, column_spec.column)
+            for i, column_spec in indexed_specs.items()
+        ]
+        try:
+            query = queries[0] if len(queries) == 1 else sa.union_all(*queries)
+            for index, value, frequency in self.conn.execute(query):
+                frequencies[int(index)].append((value, frequency))
+        except Exception as e:
+            logger.debug(
+                f"Combined value frequencies query for {self.dataset_name} failed, querying columns one at a time: {e}"
+            )
+            for i, column_spec in indexed_specs.items():
+                try:
+                    frequencies[i] = [
+                        (value, frequency)
+                        for _, value, frequency in self.conn.execute(
+                            self._value_frequencies_query(source, i, column_spec.column)
+                        )
+                    ]
+                except Exception as e:
+                    logger.debug(
+                        f"Caught exception while attempting to get value frequencies for column {column_spec.column}. {e}"
+                    )
+                    frequencies[i] = []
+                    self.report.report_warning(
+                        "Profiling - Unable to get column value frequencies",
+                        f"{self.dataset_name}.{column_spec.column}",
+                    )
+
+        for i, column_spec in indexed_specs.items():
+            column_spec.column_profile.distinctValueFrequencies = [
+                ValueFrequencyClass(value=str(value), frequency=frequency)
+                for value, frequency in sorted(frequencies[i], key=lambda x: str(x[0]))
+            ]
+
+    def _compute_sample_values(
+        self, source: FromClause, column_specs: List[_ColumnSpec]
+    ) -> None:
+        if not self.config.include_field_sample_values or not column_specs:
+            return
+
+        try:
+            rows = self.conn.execute(
+                sa.select(
+                    [sa.column(column_spec.column) for column_spec in column_specs]
+                )
+                .select_from(source)
+                .limit(self.config.field_sample_values_limit)
+            ).fetchall()
+        except Exception as e:
+            logger.debug(
+                f"Caught exception while attempting to get sample values for {self.dataset_name}. {e}"
+            )
+            self.report.report_warning(
+                "Profiling - Unable to get column sample values", self.dataset_name
+            )
+            return
+
+        for i, column_spec in enumerate(column_specs):
+            column_spec.column_profile.sampleValues = [
+                str(row[i]) for row in rows if row[i] is not None
+            ]
+
+    def _fill_column_profile(
+        self, column_spec: _ColumnSpec, row_count: Optional[int]
+    ) -> None:
+        column_profile = column_spec.column_profile
+        stats = column_spec.stats
+
+        non_null_count: Optional[int] = stats.get("nonnull_count")
+        unique_count: Optional[int] = stats.get("unique_count")
+
+        if non_null_count is not None and row_count is not None:
+            null_count = max(0, row_count - non_null_count)
+            if self.config.include_field_null_count:
+                column_profile.nullCount = null_count
+                if row_count > 0:
+                    # Sometimes this value is bigger than 1 because of the approx queries
+                    column_profile.nullProportion = min(1, null_count / row_count)
+
+        pct_unique: Optional[float] = None
+        if unique_count is not None:
+            if non_null_count is not None and non_null_count > 0:
+                pct_unique = float(unique_count) / non_null_count
+            if self.config.include_field_distinct_count:
+                column_profile.uniqueCount = unique_count
+                if pct_unique is not None:
+                    # Sometimes this value is bigger than 1 because of the approx queries
+                    column_profile.uniqueProportion = min(1, pct_unique)
+        column_spec.cardinality = convert_to_cardinality(unique_count, pct_unique)
+
+        for stat in ["min", "max", "mean", "median", "stdev"]:
+            if stats.get(stat) is not None:
+                setattr(column_profile, stat, str(stats[stat]))
+
+        quantile_values = [stats.get(f"quantile_{i}") for i in range(len(_QUANTILES))]
+        if column_spec.cardinality in {
+            Cardinality.FEW,
+            Cardinality.MANY,
+            Cardinality.VERY_MANY,
+        } and all(value is not None for value in quantile_values):
+            column_profile.quantiles = [
+                QuantileClass(quantile=str(quantile), value=str(value))
+                for quantile, value in zip(_QUANTILES, quantile_values)
+            ]
+
+    def generate_dataset_profile(self) -> DatasetProfileClass:
+        profile = DatasetProfileClass(timestampMillis=get_sys_time())
+        if self.partition:
+            profile.partitionSpec = PartitionSpecClass(partition=self.partition)
+        profile.fieldProfiles = []
+
+        all_columns = [
+            (column["name"], column["type"])
+            for column in sa.inspect(self.conn).get_columns(
+                self.table, schema=self.schema
+            )
+        ]
+        profile.columnCount = len(all_columns)
+        columns_to_profile = set(
+            get_columns_to_profile(
+                [name for name, _ in all_columns],
+                self.dataset_name,
+                self.config,
+                self.report,
+            )
+        )
+
+        column_specs: List[_ColumnSpec] = []
+        for column, type_ in all_columns:
+            column_profile = DatasetFieldProfileClass(fieldPath=column)
+            profile.fieldProfiles.append(column_profile)
+            if column in columns_to_profile:
+                column_specs.append(
+                    _ColumnSpec(column, _get_column_kind(type_), column_profile)
+                )
+
+        source = self._get_source()
+        row_count = self._compute_aggregates(source, column_specs)
+        profile.rowCount = row_count
+
+        for column_spec in column_specs:
+            self._fill_column_profile(column_spec, row_count)
+        self._compute_value_frequencies(source, column_specs)
+        self._compute_sample_values(source, column_specs)
+
+        return profile
@@ -160,6 +160,8 @@ class PowerBiDashboardSourceReport(StaleEntityRemovalSourceReport):
     filtered_dashboards: List[str] = dataclass_field(default_factory=list)
     filtered_charts: List[str] = dataclass_field(default_factory=list)
     number_of_workspaces: int = 0
+    m_query_expressions_resolved: int = 0
+    m_query_cache_hits: int = 0
 
     def report_dashboards_scanned(self, count: int = 1) -> None:
         self.dashboards_scanned += count
@@ -350,6 +352,13 @@ class PowerBiDashboardSourceConfig(
         description="Whether PowerBI native query should be parsed to extract lineage",
     )
 
+    # Number of processes used to parse the M-Query expressions of a workspace
+    m_query_parse_workers: pydantic.PositiveInt = pydantic.Field(
+        default=1,
+        description="Number of processes used to parse the M-Query expressions of the tables of a workspace up front. "
+        "Parsing is CPU bound, so using more processes can considerably speed up lineage extraction for large workspaces.",
+    )
+
     # convert PowerBI dataset URN to lower-case
     convert_urns_to_lowercase: bool = pydantic.Field(
         default=False,
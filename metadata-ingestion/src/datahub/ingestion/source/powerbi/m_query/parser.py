@@ -1,7 +1,14 @@
+import collections
 import functools
+import hashlib
 import importlib.resources as pkg_resource
+import itertools
+import json
 import logging
-from typing import Dict, List
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, OrderedDict, Tuple
 
 import lark
 from lark import Lark, Tree
@@ -15,6 +22,8 @@ from datahub.ingestion.source.powerbi.rest_api_wrapper.data_classes import Table
 
 logger = logging.getLogger(__name__)
 
+_DEFAULT_CACHE_MAX_SIZE = 10000
+
 
 @functools.lru_cache(maxsize=1)
 def get_lark_parser() -> Lark:
@@ -94,3 +103,155 @@ def get_upstream_tables(
         logger.debug(f"Stack trace for {table.full_name}:", exc_info=e)
 
     return []
+
+
+@dataclass
+class _ResolvedUpstreams:
+    table_full_name: str
+    upstream_tables: List[resolver.DataPlatformTable]
+    # Warnings reported while resolving, as (key, reason). The keys start with the
+    # full name of the table, which is replaced when the warnings are replayed.
+    warnings: List[Tuple[str, str]]
+
+
+def _resolve_upstreams(
+    table: Table, native_query_enabled: bool, parameters: Dict[str, str]
+) -> _ResolvedUpstreams:
+    # Warnings go to a report of their own, so that they can be replayed for all the
+    # tables with the same expression.
+    reporter = PowerBiDashboardSourceReport()
+    upstream_tables = get_upstream_tables(
+        table,
+        reporter,
+        native_query_enabled=native_query_enabled,
+        parameters=parameters,
+    )
+    return _ResolvedUpstreams(
+        table_full_name=table.full_name,
+        upstream_tables=upstream_tables,
+        warnings=[
+            (key, reason)
+            for key, reasons in reporter.warnings.items()
+            for reason in reasons
+        ],
+    )
+
+
+class MQueryUpstreamsCache:
+    """
+    Memoizes the upstream tables resolved from the M-Query expressions of tables.
+
+    Parsing an expression can take seconds, and the same expressions are often found
+    in many tables, e.g. in copies of a dataset. Results are keyed on a hash of the
+    expression, the dataset parameters and whether native queries are parsed. Warnings
+    are stored with the result and reported again for every table that shares it.
+
+    Tables can be preloaded, in which case the expressions that aren't cached yet are
+    parsed in parallel by a pool of worker processes.
+    """
+
+    def __init__(
+        self,
+        reporter: PowerBiDashboardSourceReport,
+        max_workers: int = 1,
+        max_size: int = _DEFAULT_CACHE_MAX_SIZE,
+    ) -> None:
+        self.reporter = reporter
+        self.max_workers = max_workers
+        self.max_size = max_size
+        self._cache: OrderedDict[str, _ResolvedUpstreams] = collections.OrderedDict()
+
+    @staticmethod
+    def _make_key(
+        expression: str, native_query_enabled: bool, parameters: Dict[str, str]
+    ) -> str:
+        key_parts = [
+            str(native_query_enabled),
+            json.dumps(parameters, sort_keys=True),
+            expression,
+        ]
+        return hashlib.sha256("\n".join(key_parts).encode("utf-8")).hexdigest()
+
+    def _add(self, key: str, result: _ResolvedUpstreams) -> None:
+        self._cache[key] = result
+        self.reporter.m_query_expressions_resolved += 1
+        if len(self._cache) > self.max_size:
+            self._cache.popitem(last=False)
+
+    def preload(
+        self,
+        tables: Iterable[Tuple[Table, Dict[str, str]]],
+        native_query_enabled: bool = True,
+    ) -> None:
+        """
+        Resolves the upstream tables of the given (table, parameters) pairs, so that
+        later lookups don't have to.
+        """
+
+        to_resolve: Dict[str, Tuple[Table, Dict[str, str]]] = {}
+        for table, parameters in tables:
+            if table.expression is None:
+                continue
+            key = self._make_key(table.expression, native_query_enabled, parameters)
+            if key not in self._cache and key not in to_resolve:
+                # Don't send the dataset, and all its tables, to the worker processes.
+                to_resolve[key] = (
+                    Table(
+                        name=table.name,
+                        full_name=table.full_name,
+                        expression=table.expression,
+                    ),
+                    parameters,
+                )
+
+        if self.max_workers <= 1 or len(to_resolve) <= 1:
+            # Expressions are resolved on demand instead.
+            return
+        logger.info(f"Parsing {len(to_resolve)} M-Query expressions")
+        try:
+            # Forking a multi-threaded process can deadlock on locks held at fork
+            # time, and the source may run alongside transformer and sink threads.
+            with ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            ) as executor:
+                results = executor.map(
+                    _resolve_upstreams,
+                    [table for table, _ in to_resolve.values()],
+                    itertools.repeat(native_query_enabled),
+                    [parameters for _, parameters in to_resolve.values()],
+                )
+                for key, result in zip(to_resolve.keys(), results):
+                    self._add(key, result)
+        except Exception as e:
+            # The remaining expressions are resolved on demand instead.
+            logger.warning(f"Failed to parse M-Query expressions in parallel: {e}")
+
+    def get_upstream_tables(
+        self,
+        table: Table,
+        native_query_enabled: bool = True,
+        parameters: Dict[str, str] = {},
+    ) -> List[resolver.DataPlatformTable]:
+        if table.expression is None:
+            logger.debug(f"Expression is none for table {table.full_name}")
+            return []
+
+        parameters = parameters or {}
+        key = self._make_key(table.expression, native_query_enabled, parameters)
+        result = self._cache.get(key)
+        if result is None:
+            result = _resolve_upstreams(table, native_query_enabled, parameters)
+            self._add(key, result)
+        else:
+            self._cache.move_to_end(key)
+            self.reporter.m_query_cache_hits += 1
+
+        for warning_key, reason in result.warnings:
+            if warning_key.startswith(result.table_full_name):
+                warning_key = (
+                    table.full_name + warning_key[len(result.table_full_name) :]
+                )
+            self.reporter.report_warning(warning_key, reason)
+        # Copy the list so that callers can't modify the cached result.
+        return list(result.upstream_tables)
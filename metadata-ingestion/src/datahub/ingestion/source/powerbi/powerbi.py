@@ -112,6 +112,9 @@ class Mapper:
         self.__dataplatform_instance_resolver = dataplatform_instance_resolver
         self.processed_datasets: Set[powerbi_data_classes.PowerBIDataset] = set()
         self.workspace_key: PlatformKey
+        self.__m_query_cache = parser.MQueryUpstreamsCache(
+            reporter, max_workers=config.m_query_parse_workers
+        )
 
     @staticmethod
     def urn_to_lowercase(value: str, flag: bool) -> str:
@@ -180,9 +183,9 @@ class Mapper:
         parameters = table.dataset.parameters if table.dataset else {}
 
         upstreams: List[UpstreamClass] = []
-        upstream_tables: List[resolver.DataPlatformTable] = parser.get_upstream_tables(
-            table, self.__reporter, parameters=parameters
-        )
+        upstream_tables: List[
+            resolver.DataPlatformTable
+        ] = self.__m_query_cache.get_upstream_tables(table, parameters=parameters)
         logger.debug(
             f"PowerBI virtual table {table.full_name} and it's upstream dataplatform tables = {upstream_tables}"
         )
@@ -289,6 +292,35 @@ class Mapper:
 
         return schema_metadata
 
+    def is_dataset_allowed(self, dataset: powerbi_data_classes.PowerBIDataset) -> bool:
+        return any(
+            [
+                self.__config.filter_dataset_endorsements.allowed(tag)
+                for tag in (dataset.tags or [""])
+            ]
+        )
+
+    def preload_lineage(self, workspace: powerbi_data_classes.Workspace) -> None:
+        """
+        Resolves the upstream tables of the datasets used by the workspace's dashboards
+        and reports up front, so that their M-Query expressions are parsed in parallel.
+        """
+        datasets = {
+            tile.dataset
+            for dashboard in workspace.dashboards
+            for tile in dashboard.tiles
+            if tile.dataset is not None
+        }
+        datasets.update(
+            report.dataset for report in workspace.reports if report.dataset is not None
+        )
+        self.__m_query_cache.preload(
+            (table, dataset.parameters or {})
+            for dataset in datasets
+            if self.is_dataset_allowed(dataset)
+            for table in dataset.tables
+        )
+
     def to_datahub_dataset(
         self,
         dataset: Optional[powerbi_data_classes.PowerBIDataset],
@@ -302,12 +334,7 @@ class Mapper:
         dataset_mcps: List[MetadataChangeProposalWrapper] = []
         if dataset is None:
             return dataset_mcps
-        if not any(
-            [
-                self.__config.filter_dataset_endorsements.allowed(tag)
-                for tag in (dataset.tags or [""])
-            ]
-        ):
+        if not self.is_dataset_allowed(dataset):
             logger.debug(
                 "Returning empty dataset_mcps as no dataset tag matched with filter_dataset_endorsements"
             )
@@ -1167,6 +1194,8 @@ class PowerBiDashboardSource(StatefulIngestionSourceBase):
             for workunit in workspace_workunits:
                 # Return workunit to Datahub Ingestion framework
                 yield workunit
+        if self.source_config.extract_lineage:
+            self.mapper.preload_lineage(workspace)
         for dashboard in workspace.dashboards:
             try:
                 # Fetch PowerBi users for dashboards
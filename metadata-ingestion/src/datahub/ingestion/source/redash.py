@@ -3,7 +3,7 @@ import math
 import sys
 from dataclasses import dataclass, field
 from multiprocessing.pool import ThreadPool
-from typing import Dict, Iterable, List, Optional, Set, Type
+from typing import Dict, Iterable, List, Optional, Set, Type, Union
 
 import dateutil.parser as dp
 from packaging import version
@@ -396,12 +396,38 @@ class RedashSource(Source):
             logger.warning(f"Sql parser failed on {sql} with {e}")
             return []
 
+        return cls._remove_quotes(sql_table_names)
+
+    @staticmethod
+    def _remove_quotes(sql_table_names: List[str]) -> List[str]:
         # Remove quotes from table names
         sql_table_names = [t.replace('"', "") for t in sql_table_names]
         sql_table_names = [t.replace("`", "") for t in sql_table_names]
 
         return sql_table_names
 
+    def _parse_sql_table_names_batch(
+        self, queries: List[str]
+    ) -> Dict[str, Union[List[str], Exception]]:
+        """
+        Parses many queries at once, so that parsers that support it can parse them
+        concurrently. Returns the table names of each query, or the exception
+        raised while parsing it.
+        """
+
+        parser_cls = self._import_sql_parser_cls(self.sql_parser_path)
+        unique_queries = list(dict.fromkeys(queries))
+        sql_table_names: Dict[str, Union[List[str], Exception]] = {}
+        for sql, result in zip(unique_queries, parser_cls.parse_batch(unique_queries)):
+            if isinstance(result, Exception):
+                sql_table_names[sql] = result
+                continue
+            try:
+                sql_table_names[sql] = self._remove_quotes(result.get_tables())
+            except Exception as e:
+                sql_table_names[sql] = e
+        return sql_table_names
+
     def _get_chart_data_source(self, data_source_id: Optional[int] = None) -> Dict:
         url = f"/api/data_sources/{data_source_id}"
         resp = self.client._get(url).json()
@@ -447,7 +473,10 @@ class RedashSource(Source):
         return builder.make_dataset_urn(platform, full_dataset_name, self.config.env)
 
     def _get_datasource_urns(
-        self, data_source: Dict, sql_query_data: Dict = {}
+        self,
+        data_source: Dict,
+        sql_query_data: Dict = {},
+        parsed_sql_table_names: Optional[Dict[str, Union[List[str], Exception]]] = None,
     ) -> Optional[List[str]]:
         platform = self._get_platform_based_on_datasource(data_source)
         database_name = self._get_database_name_based_on_datasource(data_source)
@@ -462,9 +491,16 @@ class RedashSource(Source):
             if self.parse_table_names_from_sql and data_source_syntax == "sql":
                 dataset_urns = list()
                 try:
-                    sql_table_names = self._get_sql_table_names(
-                        query, self.sql_parser_path
-                    )
+                    parsed = (parsed_sql_table_names or {}).get(query)
+                    if isinstance(parsed, Exception):
+                        logger.warning(f"Sql parser failed on {query} with {parsed}")
+                        sql_table_names = []
+                    elif parsed is not None:
+                        sql_table_names = parsed
+                    else:
+                        sql_table_names = self._get_sql_table_names(
+                            query, self.sql_parser_path
+                        )
                 except Exception as e:
                     self.report.queries_problem_parsing.add(str(query_id))
                     self.error(
@@ -683,7 +719,12 @@ class RedashSource(Source):
 
         return chart_type
 
-    def _get_chart_snapshot(self, query_data: Dict, viz_data: Dict) -> ChartSnapshot:
+    def _get_chart_snapshot(
+        self,
+        query_data: Dict,
+        viz_data: Dict,
+        parsed_sql_table_names: Optional[Dict[str, Union[List[str], Exception]]] = None,
+    ) -> ChartSnapshot:
         viz_id = viz_data["id"]
         chart_urn = f"urn:li:chart:({self.platform},{viz_id})"
         chart_snapshot = ChartSnapshot(
@@ -711,7 +752,9 @@ class RedashSource(Source):
         data_source = self._get_chart_data_source(data_source_id)
         data_source_type = data_source.get("type")
 
-        datasource_urns = self._get_datasource_urns(data_source, query_data)
+        datasource_urns = self._get_datasource_urns(
+            data_source, query_data, parsed_sql_table_names
+        )
 
         if datasource_urns is None:
             self.report.charts_no_input.add(chart_urn)
@@ -743,6 +786,7 @@ class RedashSource(Source):
             queries_response = self.client.queries(
                 page=current_page, page_size=self.config.page_size
             )
+            query_datas: List[Dict] = []
             for query_response in queries_response["results"]:
                 chart_name = query_response["name"]
                 self.report.report_item_scanned()
@@ -754,10 +798,25 @@ class RedashSource(Source):
                 query_id = query_response["id"]
                 query_data = self.client._get(f"/api/queries/{query_id}").json()
                 logger.debug(query_data)
+                query_datas.append(query_data)
+
+            # Parse the SQL of all of the charts on the page at once.
+            parsed_sql_table_names = None
+            if self.parse_table_names_from_sql:
+                parsed_sql_table_names = self._parse_sql_table_names_batch(
+                    [
+                        query_data.get("query", "")
+                        for query_data in query_datas
+                        if query_data.get("visualizations")
+                    ]
+                )
 
+            for query_data in query_datas:
                 # In Redash, chart is called visualization
                 for visualization in query_data.get("visualizations", []):
-                    chart_snapshot = self._get_chart_snapshot(query_data, visualization)
+                    chart_snapshot = self._get_chart_snapshot(
+                        query_data, visualization, parsed_sql_table_names
+                    )
                     mce = MetadataChangeEvent(proposedSnapshot=chart_snapshot)
                     wu = MetadataWorkUnit(id=chart_snapshot.urn, mce=mce)
                     self.report.report_workunit(wu)
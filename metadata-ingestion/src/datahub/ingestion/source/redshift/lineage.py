@@ -21,6 +21,7 @@ from datahub.ingestion.source.redshift.redshift_schema import (
     RedshiftDataDictionary,
     RedshiftSchema,
     RedshiftTable,
+    RedshiftTableIndex,
     RedshiftView,
 )
 from datahub.ingestion.source.redshift.report import RedshiftReport
@@ -188,7 +189,7 @@ class RedshiftLineageExtractor:
         database: str,
         lineage_type: LineageCollectorType,
         connection: redshift_connector.Connection,
-        all_tables: Dict[str, Dict[str, List[Union[RedshiftView, RedshiftTable]]]],
+        table_index: RedshiftTableIndex,
     ) -> None:
         """
         This method generate table level lineage based with the given query.
@@ -228,7 +229,7 @@ class RedshiftLineageExtractor:
                 target.upstreams.update(
                     self._get_upstream_lineages(
                         sources=sources,
-                        all_tables=all_tables,
+                        table_index=table_index,
                         alias_db_name=alias_db_name,
                         raw_db_name=raw_db_name,
                     )
@@ -296,7 +297,7 @@ class RedshiftLineageExtractor:
     def _get_upstream_lineages(
         self,
         sources: List[LineageDataset],
-        all_tables: Dict[str, Dict[str, List[Union[RedshiftView, RedshiftTable]]]],
+        table_index: RedshiftTableIndex,
         alias_db_name: str,
         raw_db_name: str,
     ) -> List[LineageDataset]:
@@ -311,11 +312,7 @@ class RedshiftLineageExtractor:
 
                 # Filtering out tables which does not exist in Redshift
                 # It was deleted in the meantime or query parser did not capture well the table name
-                if (
-                    db not in all_tables
-                    or schema not in all_tables[db]
-                    or not any(table == t.name for t in all_tables[db][schema])
-                ):
+                if not table_index.contains(db, schema, table):
                     self.warn(
                         logger,
                         "missing-table",
@@ -330,7 +327,7 @@ class RedshiftLineageExtractor:
         self,
         database: str,
         connection: redshift_connector.Connection,
-        all_tables: Dict[str, Dict[str, List[Union[RedshiftView, RedshiftTable]]]],
+        table_index: RedshiftTableIndex,
     ) -> None:
         populate_calls: List[Tuple[str, LineageCollectorType]] = []
 
@@ -397,7 +394,7 @@ class RedshiftLineageExtractor:
                 database=database,
                 lineage_type=lineage_type,
                 connection=connection,
-                all_tables=all_tables,
+                table_index=table_index,
             )
 
         self.report.lineage_mem_size[self.config.database] = humanfriendly.format_size(
@@ -1,6 +1,5 @@
 import dataclasses
 import logging
-from datetime import datetime
 from typing import Dict, Iterable, List, Optional, Union, cast
 
 from datahub.emitter.mce_builder import make_dataset_urn_with_platform_instance
@@ -15,6 +14,7 @@ from datahub.ingestion.source.redshift.redshift_schema import (
 from datahub.ingestion.source.redshift.report import RedshiftReport
 from datahub.ingestion.source.sql.sql_generic_profiler import (
     GenericProfiler,
+    ProfilingEligibility,
     TableProfilerRequest,
 )
 from datahub.ingestion.source.state.profiling_state_handler import ProfilingHandler
@@ -95,10 +95,8 @@ class RedshiftProfiler(GenericProfiler):
                 )
 
                 # We don't add to the profiler state if we only do table level profiling as it always happens
-                if self.state_handler and not request.profile_table_level_only:
-                    self.state_handler.add_to_state(
-                        dataset_urn, int(datetime.now().timestamp() * 1000)
-                    )
+                if not request.profile_table_level_only:
+                    self.add_to_profiling_state(dataset_urn, request.table)
 
                 yield wrap_aspect_as_workunit(
                     "dataset",
@@ -116,17 +114,15 @@ class RedshiftProfiler(GenericProfiler):
         skip_profiling = False
         profile_table_level_only = self.config.profiling.profile_table_level_only
         dataset_name = f"{db_name}.{schema_name}.{table.name}".lower()
-        if not self.is_dataset_eligible_for_profiling(
+        eligibility = self.get_profiling_eligibility(
             dataset_name, table.last_altered, table.size_in_bytes, table.rows_count
-        ):
+        )
+        if eligibility == ProfilingEligibility.TABLE_LEVEL_ONLY:
             # Profile only table level if dataset is filtered from profiling
             # due to size limits alone
-            if self.is_dataset_eligible_for_profiling(
-                dataset_name, table.last_altered, 0, 0
-            ):
-                profile_table_level_only = True
-            else:
-                skip_profiling = True
+            profile_table_level_only = True
+        elif eligibility == ProfilingEligibility.NOT_ELIGIBLE:
+            skip_profiling = True
 
         if len(table.columns) == 0:
             skip_profiling = True
@@ -44,6 +44,7 @@ from datahub.ingestion.source.redshift.redshift_schema import (
     RedshiftDataDictionary,
     RedshiftSchema,
     RedshiftTable,
+    RedshiftTableIndex,
     RedshiftView,
 )
 from datahub.ingestion.source.redshift.report import RedshiftReport
@@ -331,6 +332,7 @@ class RedshiftSource(StatefulIngestionSourceBase, TestableSource):
 
         self.db_tables: Dict[str, Dict[str, List[RedshiftTable]]] = {}
         self.db_views: Dict[str, Dict[str, List[RedshiftView]]] = {}
+        self.table_index = RedshiftTableIndex()
         self.db_schemas: Dict[str, Dict[str, RedshiftSchema]] = {}
 
     @classmethod
@@ -399,8 +401,6 @@ class RedshiftSource(StatefulIngestionSourceBase, TestableSource):
 
         yield from self.process_schemas(connection, database)
 
-        all_tables = self.get_all_tables()
-
         if (
             self.config.store_last_lineage_extraction_timestamp
             or self.config.store_last_usage_extraction_timestamp
@@ -413,12 +413,12 @@ class RedshiftSource(StatefulIngestionSourceBase, TestableSource):
 
         if self.config.include_table_lineage or self.config.include_copy_lineage:
             yield from self.extract_lineage(
-                connection=connection, all_tables=all_tables, database=database
+                connection=connection, table_index=self.table_index, database=database
             )
 
         if self.config.include_usage_statistics:
             yield from self.extract_usage(
-                connection=connection, all_tables=all_tables, database=database
+                connection=connection, table_index=self.table_index, database=database
             )
 
         if self.config.profiling.enabled:
@@ -771,6 +771,7 @@ class RedshiftSource(StatefulIngestionSourceBase, TestableSource):
                         f"{database}.{schema}.{table.name}"
                     ):
                         self.db_tables[database][schema].append(table)
+                        self.table_index.add(database, schema, table)
         for schema in views:
             if self.config.schema_pattern.allowed(f"{database}.{schema}"):
                 self.db_views[database][schema] = []
@@ -779,28 +780,13 @@ class RedshiftSource(StatefulIngestionSourceBase, TestableSource):
                         f"{database}.{schema}.{view.name}"
                     ):
                         self.db_views[database][schema].append(view)
-
-    def get_all_tables(
-        self,
-    ) -> Dict[str, Dict[str, List[Union[RedshiftView, RedshiftTable]]]]:
-        all_tables: Dict[
-            str, Dict[str, List[Union[RedshiftView, RedshiftTable]]]
-        ] = defaultdict(dict)
-        for db in set().union(self.db_tables, self.db_views):
-            tables = self.db_tables.get(db, {})
-            views = self.db_views.get(db, {})
-            for schema in set().union(tables, views):
-                all_tables[db][schema] = [
-                    *tables.get(schema, []),
-                    *views.get(schema, []),
-                ]
-        return all_tables
+                        self.table_index.add(database, schema, view)
 
     def extract_usage(
         self,
         connection: redshift_connector.Connection,
         database: str,
-        all_tables: Dict[str, Dict[str, List[Union[RedshiftView, RedshiftTable]]]],
+        table_index: RedshiftTableIndex,
     ) -> Iterable[MetadataWorkUnit]:
         if (
             self.config.store_last_usage_extraction_timestamp
@@ -821,7 +807,7 @@ class RedshiftSource(StatefulIngestionSourceBase, TestableSource):
                 connection=connection,
                 report=self.report,
             )
-            yield from usage_extractor.generate_usage(all_tables=all_tables)
+            yield from usage_extractor.generate_usage(table_index=table_index)
 
             self.report.usage_extraction_sec[database] = round(
                 timer.elapsed_seconds(), 2
@@ -831,7 +817,7 @@ class RedshiftSource(StatefulIngestionSourceBase, TestableSource):
         self,
         connection: redshift_connector.Connection,
         database: str,
-        all_tables: Dict[str, Dict[str, List[Union[RedshiftView, RedshiftTable]]]],
+        table_index: RedshiftTableIndex,
     ) -> Iterable[MetadataWorkUnit]:
         if (
             self.config.store_last_lineage_extraction_timestamp
@@ -853,7 +839,7 @@ class RedshiftSource(StatefulIngestionSourceBase, TestableSource):
 
         with PerfTimer() as timer:
             self.lineage_extractor.populate_lineage(
-                database=database, connection=connection, all_tables=all_tables
+                database=database, connection=connection, table_index=table_index
             )
 
             self.report.lineage_extraction_sec[f"{database}"] = round(
@@ -1,7 +1,7 @@
 import logging
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Dict, Iterable, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple, Union
 
 import redshift_connector
 
@@ -46,6 +46,48 @@ class RedshiftView(BaseTable):
     rows_count: Optional[int] = None
 
 
+class RedshiftTableIndex:
+    """
+    Hashed index of the ingested tables and views, keyed by (database, schema, name).
+
+    Usage and lineage extraction check every event against it, so lookups must not
+    depend on the number of tables in a schema.
+    """
+
+    def __init__(self) -> None:
+        self._objects: Dict[
+            Tuple[str, str, str], Union[RedshiftTable, RedshiftView]
+        ] = {}
+
+    @classmethod
+    def from_tables(
+        cls,
+        all_tables: Dict[str, Dict[str, List[Union[RedshiftView, RedshiftTable]]]],
+    ) -> "RedshiftTableIndex":
+        index = cls()
+        for database, schemas in all_tables.items():
+            for schema, tables in schemas.items():
+                for table in tables:
+                    index.add(database, schema, table)
+        return index
+
+    def add(
+        self, database: str, schema: str, table: Union[RedshiftTable, RedshiftView]
+    ) -> None:
+        self._objects[(database, schema, table.name)] = table
+
+    def get(
+        self, database: str, schema: str, name: str
+    ) -> Optional[Union[RedshiftTable, RedshiftView]]:
+        return self._objects.get((database, schema, name))
+
+    def contains(self, database: str, schema: str, name: str) -> bool:
+        return (database, schema, name) in self._objects
+
+    def __len__(self) -> int:
+        return len(self._objects)
+
+
 @dataclass
 class RedshiftSchema:
     name: str
@@ -2,7 +2,7 @@ import collections
 import logging
 import time
 from datetime import datetime
-from typing import Dict, Iterable, List, Optional, Union
+from typing import Dict, Iterable, Optional
 
 import pydantic.error_wrappers
 import redshift_connector
@@ -14,10 +14,7 @@ from datahub.configuration.time_window_config import get_time_bucket
 from datahub.emitter.mcp import MetadataChangeProposalWrapper
 from datahub.ingestion.api.workunit import MetadataWorkUnit
 from datahub.ingestion.source.redshift.config import RedshiftConfig
-from datahub.ingestion.source.redshift.redshift_schema import (
-    RedshiftTable,
-    RedshiftView,
-)
+from datahub.ingestion.source.redshift.redshift_schema import RedshiftTableIndex
 from datahub.ingestion.source.redshift.report import RedshiftReport
 from datahub.ingestion.source.usage.usage_common import GenericAggregatedDataset
 from datahub.metadata.schema_classes import OperationClass, OperationTypeClass
@@ -175,7 +172,7 @@ class RedshiftUsageExtractor:
         self.connection = connection
 
     def generate_usage(
-        self, all_tables: Dict[str, Dict[str, List[Union[RedshiftView, RedshiftTable]]]]
+        self, table_index: RedshiftTableIndex
     ) -> Iterable[MetadataWorkUnit]:
         self.report.num_usage_workunits_emitted = 0
         self.report.num_usage_stat_skipped = 0
@@ -186,7 +183,7 @@ class RedshiftUsageExtractor:
             with PerfTimer() as timer:
                 # Generate operation aspect workunits
                 yield from self._gen_operation_aspect_workunits(
-                    self.connection, all_tables
+                    self.connection, table_index
                 )
                 self.report.operational_metadata_extraction_sec[
                     self.config.database
@@ -201,7 +198,7 @@ class RedshiftUsageExtractor:
         access_events_iterable: Iterable[
             RedshiftAccessEvent
         ] = self._gen_access_events_from_history_query(
-            query, connection=self.connection, all_tables=all_tables
+            query, connection=self.connection, table_index=table_index
         )
 
         aggregated_events: AggregatedAccessEvents = self._aggregate_access_events(
@@ -217,7 +214,7 @@ class RedshiftUsageExtractor:
     def _gen_operation_aspect_workunits(
         self,
         connection: redshift_connector.Connection,
-        all_tables: Dict[str, Dict[str, List[Union[RedshiftView, RedshiftTable]]]],
+        table_index: RedshiftTableIndex,
     ) -> Iterable[MetadataWorkUnit]:
         # Generate access events
         query: str = REDSHIFT_OPERATION_ASPECT_QUERY_TEMPLATE.format(
@@ -227,33 +224,27 @@ class RedshiftUsageExtractor:
         access_events_iterable: Iterable[
             RedshiftAccessEvent
         ] = self._gen_access_events_from_history_query(
-            query, connection, all_tables=all_tables
+            query, connection, table_index=table_index
         )
 
         # Generate operation aspect work units from the access events
         yield from self._gen_operation_aspect_workunits_from_access_events(
-            access_events_iterable, all_tables=all_tables
+            access_events_iterable, table_index=table_index
         )
 
     def _should_process_event(
         self,
         event: RedshiftAccessEvent,
-        all_tables: Dict[str, Dict[str, List[Union[RedshiftView, RedshiftTable]]]],
+        table_index: RedshiftTableIndex,
     ) -> bool:
         # Check schema/table allow/deny patterns
-        return not (
-            event.database not in all_tables
-            or event.schema_ not in all_tables[event.database]
-            or not any(
-                event.table == t.name for t in all_tables[event.database][event.schema_]
-            )
-        )
+        return table_index.contains(event.database, event.schema_, event.table)
 
     def _gen_access_events_from_history_query(
         self,
         query: str,
         connection: redshift_connector.Connection,
-        all_tables: Dict[str, Dict[str, List[Union[RedshiftView, RedshiftTable]]]],
+        table_index: RedshiftTableIndex,
     ) -> Iterable[RedshiftAccessEvent]:
         cursor = connection.cursor()
         cursor.execute(query)
@@ -290,7 +281,9 @@ class RedshiftUsageExtractor:
                 if self.config.database_alias:
                     access_event.database = self.config.database_alias
 
-                if not self._should_process_event(access_event, all_tables=all_tables):
+                if not self._should_process_event(
+                    access_event, table_index=table_index
+                ):
                     self.report.num_usage_stat_skipped += 1
                     continue
 
@@ -300,7 +293,7 @@ class RedshiftUsageExtractor:
     def _gen_operation_aspect_workunits_from_access_events(
         self,
         events_iterable: Iterable[RedshiftAccessEvent],
-        all_tables: Dict[str, Dict[str, List[Union[RedshiftView, RedshiftTable]]]],
+        table_index: RedshiftTableIndex,
     ) -> Iterable[MetadataWorkUnit]:
         self.report.num_operational_stats_workunits_emitted = 0
         for event in events_iterable:
@@ -314,7 +307,7 @@ class RedshiftUsageExtractor:
             ):
                 continue
 
-            if not self._should_process_event(event, all_tables=all_tables):
+            if not self._should_process_event(event, table_index=table_index):
                 self.report.num_operational_stats_skipped += 1
                 continue
 
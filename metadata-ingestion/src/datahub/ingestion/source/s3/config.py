@@ -61,6 +61,11 @@ class DataLakeSourceConfig(DatasetSourceConfigMixin, PathSpecsConfigMixin):
         description="Maximum number of rows to use when inferring schemas for TSV and CSV files.",
     )
 
+    max_schema_inference_workers: pydantic.PositiveInt = Field(
+        default=4,
+        description="Maximum number of files to read and infer schemas from in parallel.",
+    )
+
     verify_ssl: Union[bool, str] = Field(
         default=True,
         description="Either a boolean, in which case it controls whether we verify the server's TLS certificate, or a string, in which case it must be a path to a CA bundle to use.",
@@ -4,6 +4,7 @@ import os
 import pathlib
 import re
 from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from typing import Any, Dict, Iterable, List, Optional, Tuple
 
@@ -376,6 +377,21 @@ class S3Source(Source):
         return df.toDF(*(c.replace(".", "_") for c in df.columns))
 
     def get_fields(self, table_data: TableData, path_spec: PathSpec) -> List:
+        fields, warnings = self._infer_fields(table_data, path_spec)
+        for key, reason in warnings:
+            self.report.report_warning(key, reason)
+        return fields
+
+    def _infer_fields(
+        self, table_data: TableData, path_spec: PathSpec
+    ) -> Tuple[List, List[Tuple[str, str]]]:
+        """
+        Returns the inferred fields along with any warnings, as (key, reason) pairs.
+
+        This runs on the schema inference worker threads, so it must not touch the
+        report; the caller records the warnings on the main thread.
+        """
+        warnings: List[Tuple[str, str]] = []
         if self.is_s3_platform():
             if self.source_config.aws_config is None:
                 raise ValueError("AWS config is required for S3 file sources")
@@ -419,21 +435,25 @@ class S3Source(Source):
             elif extension == ".avro":
                 fields = avro.AvroInferrer().infer_schema(file)
             else:
-                self.report.report_warning(
-                    table_data.full_path,
-                    f"file {table_data.full_path} has unsupported extension",
+                warnings.append(
+                    (
+                        table_data.full_path,
+                        f"file {table_data.full_path} has unsupported extension",
+                    )
                 )
             file.close()
         except Exception as e:
-            self.report.report_warning(
-                table_data.full_path,
-                f"could not infer schema for file {table_data.full_path}: {e}",
+            warnings.append(
+                (
+                    table_data.full_path,
+                    f"could not infer schema for file {table_data.full_path}: {e}",
+                )
             )
             file.close()
         logger.debug(f"Extracted fields in schema: {fields}")
         fields = sorted(fields, key=lambda f: f.fieldPath)
 
-        return fields
+        return fields, warnings
 
     def get_table_profile(
         self, table_data: TableData, dataset_urn: str
@@ -514,7 +534,10 @@ class S3Source(Source):
         yield wu
 
     def ingest_table(
-        self, table_data: TableData, path_spec: PathSpec
+        self,
+        table_data: TableData,
+        path_spec: PathSpec,
+        fields: Optional[List] = None,
     ) -> Iterable[MetadataWorkUnit]:
         logger.info(f"Extracting table schema from file: {table_data.full_path}")
         browse_path: str = (
@@ -553,7 +576,8 @@ class S3Source(Source):
         )
         dataset_snapshot.aspects.append(dataset_properties)
 
-        fields = self.get_fields(table_data, path_spec)
+        if fields is None:
+            fields = self.get_fields(table_data, path_spec)
         schema_metadata = SchemaMetadata(
             schemaName=table_data.display_name,
             platform=data_platform_urn,
@@ -778,8 +802,20 @@ class S3Source(Source):
                                 table_data.table_path
                             ].timestamp = table_data.timestamp
 
-                for guid, table_data in table_dict.items():
-                    yield from self.ingest_table(table_data, path_spec)
+                # Schemas are inferred in the background, so that reading the files
+                # of different tables overlaps.
+                with ThreadPoolExecutor(
+                    max_workers=self.source_config.max_schema_inference_workers
+                ) as executor:
+                    fields_futures: Dict[str, Future] = {
+                        guid: executor.submit(self._infer_fields, table_data, path_spec)
+                        for guid, table_data in table_dict.items()
+                    }
+                    for guid, table_data in table_dict.items():
+                        fields, warnings = fields_futures[guid].result()
+                        for key, reason in warnings:
+                            self.report.report_warning(key, reason)
+                        yield from self.ingest_table(table_data, path_spec, fields)
 
             if not self.source_config.profiling.enabled:
                 return
@@ -1,11 +1,11 @@
 import logging
-from typing import IO, Dict, List, Type, Union
+from typing import IO, Any, Dict, Iterable, List, Type, Union
 
+import ijson
 import jsonlines as jsl
-import ujson
 
 from datahub.ingestion.source.schema_inference.base import SchemaInferenceBase
-from datahub.ingestion.source.schema_inference.object import construct_schema
+from datahub.ingestion.source.schema_inference.object import SchemaAccumulator
 from datahub.metadata.com.linkedin.pegasus2avro.schema import (
     ArrayTypeClass,
     BooleanTypeClass,
@@ -29,23 +29,52 @@ _field_type_mapping: Dict[Union[Type, str], Type] = {
     "mixed": UnionTypeClass,
 }
 
+# Number of bytes read at a time when looking for the start of the JSON content.
+_PEEK_SIZE = 1024
+
 logger = logging.getLogger(__name__)
 
 
+def _is_json_array(file: IO[bytes]) -> bool:
+    while True:
+        chunk = file.read(_PEEK_SIZE)
+        stripped = chunk.lstrip()
+        if stripped or not chunk:
+            file.seek(0)
+            return stripped.startswith(b"[")
+
+
+def _iter_json_documents(file: IO[bytes]) -> Iterable[Any]:
+    if _is_json_array(file):
+        return ijson.items(file, "item", use_float=True)
+    # A single document, or documents separated by whitespace as in JSON lines.
+    return (
+        document
+        for document in ijson.items(file, "", multiple_values=True, use_float=True)
+        if isinstance(document, dict)
+    )
+
+
 class JsonInferrer(SchemaInferenceBase):
-    def infer_schema(self, file: IO[bytes]) -> List[SchemaField]:
+    def accumulate_schema(self, file: IO[bytes]) -> SchemaAccumulator:
+        """
+        Streams the documents of a JSON or JSON lines file into a schema accumulator,
+        so that the file is never loaded into memory as a whole.
+        """
+
+        schema = SchemaAccumulator()
         try:
-            datastore = ujson.load(file)
-        except ujson.JSONDecodeError as e:
-            logger.info(f"Got ValueError: {e}. Retry with jsonlines")
+            schema.add_documents(_iter_json_documents(file))
+        except ijson.JSONError as e:
+            logger.info(f"Got JSONError: {e}. Retry with jsonlines")
             file.seek(0)
             reader = jsl.Reader(file)
-            datastore = [obj for obj in reader.iter(type=dict, skip_invalid=True)]
+            schema = SchemaAccumulator()
+            schema.add_documents(reader.iter(type=dict, skip_invalid=True))
+        return schema
 
-        if not isinstance(datastore, list):
-            datastore = [datastore]
-
-        schema = construct_schema(datastore, delimiter=".")
+    def infer_schema(self, file: IO[bytes]) -> List[SchemaField]:
+        schema = self.accumulate_schema(file).get_schema(delimiter=".")
         fields: List[SchemaField] = []
 
         for schema_field in sorted(schema.values(), key=lambda x: x["delimited_name"]):
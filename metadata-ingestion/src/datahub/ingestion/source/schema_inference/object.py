@@ -1,5 +1,14 @@
 from collections import Counter
-from typing import Any, Counter as CounterType, Dict, Sequence, Tuple, Union
+from typing import (
+    Any,
+    Counter as CounterType,
+    Dict,
+    Iterable,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
 
 from mypy_extensions import TypedDict
 
@@ -80,33 +89,53 @@ def is_nullable_collection(
     return any(is_field_nullable(doc, field_path) for doc in collection)
 
 
-def construct_schema(
-    collection: Sequence[Dict[str, Any]], delimiter: str
-) -> Dict[Tuple[str, ...], SchemaDescription]:
+class SchemaAccumulator:
     """
-    Construct (infer) a schema from a collection of documents.
-
-    For each field (represented as a tuple to handle nested items), reports the following:
-        - `types`: Python types of field values
-        - `count`: Number of times the field was encountered
-        - `type`: type of the field if `types` is just a single value, otherwise `mixed`
-        - `nullable`: if field is ever null/missing
-        - `delimited_name`: name of the field, joined by a given delimiter
+    Incrementally infers a schema from a stream of documents.
 
-    Parameters
-    ----------
-        collection:
-            collection to construct schema over.
-        delimiter:
-            string to concatenate field names by
+    Documents are added one at a time, so the collection never has to be held in
+    memory. The state kept per field is bounded by the number of distinct types seen,
+    and accumulators built over different partitions of a collection can be merged.
     """
 
-    schema: Dict[Tuple[str, ...], BasicSchemaDescription] = {}
-
-    def append_to_schema(doc: Dict[str, Any], parent_prefix: Tuple[str, ...]) -> None:
+    def __init__(self) -> None:
+        self.num_documents = 0
+        self._schema: Dict[Tuple[str, ...], BasicSchemaDescription] = {}
+        # Number of documents in which each field is non-nullable, i.e. not missing,
+        # not None and not under an empty list. See is_field_nullable.
+        self._non_nullable_counts: CounterType[Tuple[str, ...]] = Counter()
+
+    def add_document(self, document: Dict[str, Any]) -> None:
+        self.num_documents += 1
+        self._non_nullable_counts.update(self._append_to_schema(document, ()))
+
+    def add_documents(self, documents: Iterable[Dict[str, Any]]) -> None:
+        for document in documents:
+            self.add_document(document)
+
+    def merge(self, other: "SchemaAccumulator") -> None:
+        """Adds the documents seen by another accumulator to this one."""
+
+        self.num_documents += other.num_documents
+        self._non_nullable_counts.update(other._non_nullable_counts)
+        for field_path, description in other._schema.items():
+            if field_path not in self._schema:
+                self._schema[field_path] = {
+                    "types": Counter(description["types"]),
+                    "count": description["count"],
+                }
+            else:
+                self._schema[field_path]["types"].update(description["types"])
+                self._schema[field_path]["count"] += description["count"]
+
+    def _append_to_schema(
+        self, doc: Dict[str, Any], parent_prefix: Tuple[str, ...]
+    ) -> Set[Tuple[str, ...]]:
         """
         Recursively update the schema with a document, which may/may not contain nested fields.
 
+        Returns the fields that are non-nullable in the document.
+
         Parameters
         ----------
             doc:
@@ -115,55 +144,103 @@ def construct_schema(
                 prefix of fields that the document is under, pass an empty tuple when initializing
         """
 
+        non_nullable: Set[Tuple[str, ...]] = set()
         for key, value in doc.items():
             new_parent_prefix = parent_prefix + (key,)
+            nested_non_nullable: Set[Tuple[str, ...]] = set()
 
             # if nested value, look at the types within
             if isinstance(value, dict):
-                append_to_schema(value, new_parent_prefix)
+                nested_non_nullable = self._append_to_schema(value, new_parent_prefix)
             # if array of values, check what types are within
             if isinstance(value, list):
-                for item in value:
+                item_non_nullables = [
                     # if dictionary, add it as a nested object
-                    if isinstance(item, dict):
-                        append_to_schema(item, new_parent_prefix)
+                    self._append_to_schema(item, new_parent_prefix)
+                    if isinstance(item, dict)
+                    else set()
+                    for item in value
+                ]
+                # nested fields are only non-nullable if no member is missing them
+                if item_non_nullables:
+                    nested_non_nullable = set.intersection(*item_non_nullables)
 
             # don't record None values (counted towards nullable)
             if value is not None:
-                if new_parent_prefix not in schema:
-                    schema[new_parent_prefix] = {
+                if new_parent_prefix not in self._schema:
+                    self._schema[new_parent_prefix] = {
                         "types": Counter([type(value)]),
                         "count": 1,
                     }
 
                 else:
                     # update the type count
-                    schema[new_parent_prefix]["types"].update({type(value): 1})
-                    schema[new_parent_prefix]["count"] += 1
-
-    for document in collection:
-        append_to_schema(document, ())
-
-    extended_schema: Dict[Tuple[str, ...], SchemaDescription] = {}
-
-    for field_path in schema.keys():
-        field_types = schema[field_path]["types"]
-        field_type: Union[str, type] = "mixed"
-
-        # if single type detected, mark that as the type to go with
-        if len(field_types.keys()) == 1:
-            field_type = next(iter(field_types))
-        elif set(field_types.keys()) == {int, float}:
-            # If there's only floats and ints, it's not really a mixed type.
-            field_type = float
-        field_extended: SchemaDescription = {
-            "types": schema[field_path]["types"],
-            "count": schema[field_path]["count"],
-            "nullable": is_nullable_collection(collection, field_path),
-            "delimited_name": delimiter.join(field_path),
-            "type": field_type,
-        }
-
-        extended_schema[field_path] = field_extended
-
-    return extended_schema
+                    self._schema[new_parent_prefix]["types"].update({type(value): 1})
+                    self._schema[new_parent_prefix]["count"] += 1
+
+                non_nullable.add(new_parent_prefix)
+                non_nullable.update(nested_non_nullable)
+
+        return non_nullable
+
+    def get_schema(self, delimiter: str) -> Dict[Tuple[str, ...], SchemaDescription]:
+        """
+        Returns the schema of the documents seen so far, as described in construct_schema.
+
+        Parameters
+        ----------
+            delimiter:
+                string to concatenate field names by
+        """
+
+        extended_schema: Dict[Tuple[str, ...], SchemaDescription] = {}
+
+        for field_path, description in self._schema.items():
+            field_types = description["types"]
+            field_type: Union[str, type] = "mixed"
+
+            # if single type detected, mark that as the type to go with
+            if len(field_types.keys()) == 1:
+                field_type = next(iter(field_types))
+            elif set(field_types.keys()) == {int, float}:
+                # If there's only floats and ints, it's not really a mixed type.
+                field_type = float
+            field_extended: SchemaDescription = {
+                "types": Counter(field_types),
+                "count": description["count"],
+                "nullable": self._non_nullable_counts[field_path] < self.num_documents,
+                "delimited_name": delimiter.join(field_path),
+                "type": field_type,
+            }
+
+            extended_schema[field_path] = field_extended
+
+        return extended_schema
+
+
+def construct_schema(
+    collection: Iterable[Dict[str, Any]], delimiter: str
+) -> Dict[Tuple[str, ...], SchemaDescription]:
+    """
+    Construct (infer) a schema from a collection of documents.
+
+    For each field (represented as a tuple to handle nested items), reports the following:
+        - `types`: Python types of field values
+        - `count`: Number of times the field was encountered
+        - `type`: type of the field if `types` is just a single value, otherwise `mixed`
+        - `nullable`: if field is ever null/missing
+        - `delimited_name`: name of the field, joined by a given delimiter
+
+    The collection is only iterated once, so it can be a stream of documents.
+
+    Parameters
+    ----------
+        collection:
+            collection to construct schema over.
+        delimiter:
+            string to concatenate field names by
+    """
+
+    schema = SchemaAccumulator()
+    schema.add_documents(collection)
+    return schema.get_schema(delimiter)
@@ -1,6 +1,5 @@
 import dataclasses
 import logging
-from datetime import datetime
 from typing import Callable, Dict, Iterable, List, Optional, cast
 
 from snowflake.sqlalchemy import snowdialect
@@ -25,6 +24,7 @@ from datahub.ingestion.source.snowflake.snowflake_schema import (
 from datahub.ingestion.source.snowflake.snowflake_utils import SnowflakeCommonMixin
 from datahub.ingestion.source.sql.sql_generic_profiler import (
     GenericProfiler,
+    ProfilingEligibility,
     TableProfilerRequest,
 )
 from datahub.ingestion.source.state.profiling_state_handler import ProfilingHandler
@@ -105,10 +105,9 @@ class SnowflakeProfiler(GenericProfiler, SnowflakeCommonMixin):
             )
 
             # We don't add to the profiler state if we only do table level profiling as it always happens
-            if self.state_handler:
-                self.state_handler.add_to_state(
-                    dataset_urn, int(datetime.now().timestamp() * 1000)
-                )
+            self.add_to_profiling_state(
+                dataset_urn, cast(SnowflakeProfilerRequest, request).table
+            )
 
             yield MetadataChangeProposalWrapper(
                 entityUrn=dataset_urn, aspect=profile
@@ -123,17 +122,15 @@ class SnowflakeProfiler(GenericProfiler, SnowflakeCommonMixin):
         skip_profiling = False
         profile_table_level_only = self.config.profiling.profile_table_level_only
         dataset_name = self.get_dataset_identifier(table.name, schema_name, db_name)
-        if not self.is_dataset_eligible_for_profiling(
+        eligibility = self.get_profiling_eligibility(
             dataset_name, table.last_altered, table.size_in_bytes, table.rows_count
-        ):
+        )
+        if eligibility == ProfilingEligibility.TABLE_LEVEL_ONLY:
             # Profile only table level if dataset is filtered from profiling
             # due to size limits alone
-            if self.is_dataset_eligible_for_profiling(
-                dataset_name, table.last_altered, 0, 0
-            ):
-                profile_table_level_only = True
-            else:
-                skip_profiling = True
+            profile_table_level_only = True
+        elif eligibility == ProfilingEligibility.NOT_ELIGIBLE:
+            skip_profiling = True
 
         if len(table.columns) == 0:
             skip_profiling = True
@@ -1,6 +1,7 @@
 import logging
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
+from enum import Enum
 from typing import Dict, Iterable, List, Optional, Tuple, Union, cast
 
 from sqlalchemy import create_engine, inspect
@@ -37,6 +38,13 @@ class DetailedProfilerReportMixin:
     )
 
 
+class ProfilingEligibility(Enum):
+    ELIGIBLE = "ELIGIBLE"
+    # Only skipped because of the size or row limits, so table-level stats can still be profiled.
+    TABLE_LEVEL_ONLY = "TABLE_LEVEL_ONLY"
+    NOT_ELIGIBLE = "NOT_ELIGIBLE"
+
+
 class ProfilingSqlReport(DetailedProfilerReportMixin, SQLSourceReport):
     pass
 
@@ -134,6 +142,20 @@ class GenericProfiler:
         size_in_bytes: Optional[int],
         rows_count: Optional[int],
     ) -> bool:
+        return (
+            self.get_profiling_eligibility(
+                dataset_name, last_altered, size_in_bytes, rows_count
+            )
+            == ProfilingEligibility.ELIGIBLE
+        )
+
+    def get_profiling_eligibility(
+        self,
+        dataset_name: str,
+        last_altered: Optional[datetime],
+        size_in_bytes: Optional[int],
+        rows_count: Optional[int],
+    ) -> ProfilingEligibility:
         dataset_urn = make_dataset_urn_with_platform_instance(
             self.platform,
             dataset_name,
@@ -142,14 +164,29 @@ class GenericProfiler:
         )
 
         if not self.config.table_pattern.allowed(dataset_name):
-            return False
+            return ProfilingEligibility.NOT_ELIGIBLE
 
         last_profiled: Optional[int] = None
+        last_fingerprint: Optional[str] = None
         if self.state_handler:
             last_profiled = self.state_handler.get_last_profiled(dataset_urn)
+            last_fingerprint = self.state_handler.get_last_fingerprint(dataset_urn)
             if last_profiled:
                 # If profiling state exists we have to carry over to the new state
-                self.state_handler.add_to_state(dataset_urn, last_profiled)
+                self.state_handler.add_to_state(
+                    dataset_urn, last_profiled, fingerprint=last_fingerprint
+                )
+
+        if (
+            last_profiled
+            and self.config.profiling.max_profile_age_days is not None
+            and datetime.fromtimestamp(last_profiled / 1000, timezone.utc)
+            < datetime.now(timezone.utc)
+            - timedelta(self.config.profiling.max_profile_age_days)
+        ):
+            # The last profile is too old, so we refresh it even if the table hasn't changed.
+            last_profiled = None
+            last_fingerprint = None
 
         threshold_time: Optional[datetime] = (
             datetime.fromtimestamp(last_profiled / 1000, timezone.utc)
@@ -165,14 +202,21 @@ class GenericProfiler:
             )
 
         if not self.config.profile_pattern.allowed(dataset_name):
-            return False
+            return ProfilingEligibility.NOT_ELIGIBLE
 
         schema_name = dataset_name.rsplit(".", 1)[0]
+        fingerprint = self.get_table_fingerprint(
+            last_altered, size_in_bytes, rows_count
+        )
+        if fingerprint is not None and fingerprint == last_fingerprint:
+            self.report.profiling_skipped_not_updated[schema_name] += 1
+            return ProfilingEligibility.NOT_ELIGIBLE
+
         if (threshold_time is not None) and (
             last_altered is not None and last_altered < threshold_time
         ):
             self.report.profiling_skipped_not_updated[schema_name] += 1
-            return False
+            return ProfilingEligibility.NOT_ELIGIBLE
 
         if self.config.profiling.profile_table_size_limit is not None and (
             size_in_bytes is None
@@ -180,16 +224,46 @@ class GenericProfiler:
             > self.config.profiling.profile_table_size_limit
         ):
             self.report.profiling_skipped_size_limit[schema_name] += 1
-            return False
+            return ProfilingEligibility.TABLE_LEVEL_ONLY
 
         if self.config.profiling.profile_table_row_limit is not None and (
             rows_count is None
             or rows_count > self.config.profiling.profile_table_row_limit
         ):
             self.report.profiling_skipped_row_limit[schema_name] += 1
-            return False
+            return ProfilingEligibility.TABLE_LEVEL_ONLY
+
+        return ProfilingEligibility.ELIGIBLE
+
+    @staticmethod
+    def get_table_fingerprint(
+        last_altered: Optional[datetime],
+        size_in_bytes: Optional[int],
+        rows_count: Optional[int],
+    ) -> Optional[str]:
+        """
+        Summarizes the table metadata that changes when the table's data changes.
+        Returns None if none of that metadata is available.
+        """
+
+        if last_altered is None and size_in_bytes is None and rows_count is None:
+            return None
+        last_altered_millis = (
+            int(last_altered.timestamp() * 1000) if last_altered is not None else None
+        )
+        return f"{last_altered_millis}:{rows_count}:{size_in_bytes}"
 
-        return True
+    def add_to_profiling_state(
+        self, dataset_urn: str, table: Union[BaseTable, BaseView]
+    ) -> None:
+        if self.state_handler:
+            self.state_handler.add_to_state(
+                dataset_urn,
+                int(datetime.now().timestamp() * 1000),
+                fingerprint=self.get_table_fingerprint(
+                    table.last_altered, table.size_in_bytes, table.rows_count
+                ),
+            )
 
     def get_profile_args(self) -> Dict:
         """Passed down to GE profiler"""
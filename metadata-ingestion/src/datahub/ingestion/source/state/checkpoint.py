@@ -7,9 +7,10 @@ import logging
 import pickle
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Callable, Generic, Optional, Type, TypeVar
+from typing import Any, Callable, Dict, Generic, Optional, Type, TypeVar
 
 import pydantic
+from pydantic.json import pydantic_encoder
 
 from datahub.configuration.common import ConfigModel
 from datahub.metadata.schema_classes import (
@@ -57,6 +58,14 @@ class CheckpointStateBase(ConfigModel):
             )
         elif self.serde == "base85-bz2-json":
             encoded_bytes = CheckpointStateBase._to_bytes_base85_json(self, compressor)
+        elif self.serde == "base85-bz2-compact-json":
+            encoded_bytes = base64.b85encode(
+                compressor(
+                    json.dumps(self.to_compact_dict(), default=pydantic_encoder).encode(
+                        "utf-8"
+                    )
+                )
+            )
         else:
             raise ValueError(f"Unknown serde: {self.serde}")
 
@@ -77,6 +86,14 @@ class CheckpointStateBase(ConfigModel):
     ) -> bytes:
         return base64.b85encode(compressor(CheckpointStateBase._to_bytes_utf8(model)))
 
+    def to_compact_dict(self) -> Dict[str, Any]:
+        """
+        Returns the JSON-serializable form of the state used by the base85-bz2-compact-json serde.
+        States can override this with an encoding that compresses better, as long as parse_obj
+        accepts the result. By default, this is the same as the base85-bz2-json payload.
+        """
+        return self.dict(exclude={"version", "serde"})
+
     def prepare_for_commit(self) -> None:
         """
         Perform any pre-commit steps, such as deduplication, custom-compression across data etc.
@@ -121,7 +138,10 @@ class Checkpoint(Generic[StateType]):
                         functools.partial(bz2.decompress),
                         state_class,
                     )
-                elif checkpoint_aspect.state.serde == "base85-bz2-json":
+                elif checkpoint_aspect.state.serde in {
+                    "base85-bz2-json",
+                    "base85-bz2-compact-json",
+                }:
                     state_obj = Checkpoint._from_base85_json_bytes(
                         checkpoint_aspect,
                         functools.partial(bz2.decompress),
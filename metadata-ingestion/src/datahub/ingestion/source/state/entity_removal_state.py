@@ -1,3 +1,4 @@
+import os
 from typing import Any, Dict, Iterable, List, Type
 
 import pydantic
@@ -11,6 +12,32 @@ from datahub.utilities.dedup_list import deduplicate_list
 from datahub.utilities.urns.urn import guess_entity_type
 
 
+def _front_code_urns(urns: Iterable[str]) -> Dict[str, list]:
+    # Sorting puts urns with long shared prefixes (same platform, database and schema)
+    # next to each other, so each urn is stored as the length of the prefix it shares
+    # with the previous urn plus the remaining suffix.
+    prefix_lengths: List[int] = []
+    suffixes: List[str] = []
+    prev = ""
+    for urn in sorted(urns):
+        prefix_length = len(os.path.commonprefix([prev, urn]))
+        prefix_lengths.append(prefix_length)
+        suffixes.append(urn[prefix_length:])
+        prev = urn
+    return {"prefix_lengths": prefix_lengths, "suffixes": suffixes}
+
+
+def _decode_front_coded_urns(compact_urns: Dict[str, list]) -> List[str]:
+    urns: List[str] = []
+    prev = ""
+    for prefix_length, suffix in zip(
+        compact_urns["prefix_lengths"], compact_urns["suffixes"]
+    ):
+        prev = prev[:prefix_length] + suffix
+        urns.append(prev)
+    return urns
+
+
 def pydantic_state_migrator(mapping: Dict[str, str]) -> classmethod:
     # mapping would be something like:
     # {
@@ -80,6 +107,14 @@ class GenericCheckpointState(StaleEntityCheckpointStateBase["GenericCheckpointSt
         }
     )
 
+    @pydantic.root_validator(pre=True, allow_reuse=True)
+    def _decode_compact_urns(cls, values: dict) -> dict:
+        if "compact_urns" in values:
+            values["urns"] = values.get("urns", []) + _decode_front_coded_urns(
+                values.pop("compact_urns")
+            )
+        return values
+
     def __init__(self, **data: Any):  # type: ignore
         super().__init__(**data)
         self.urns = deduplicate_list(self.urns)
@@ -97,7 +132,10 @@ class GenericCheckpointState(StaleEntityCheckpointStateBase["GenericCheckpointSt
     def get_urns_not_in(
         self, type: str, other_checkpoint_state: "GenericCheckpointState"
     ) -> Iterable[str]:
-        diff = set(self.urns) - set(other_checkpoint_state.urns)
+        # Stream the diff using the other state's existing set, rather than
+        # materializing new sets for both states.
+        other_urns = other_checkpoint_state._urns_set
+        diff = (urn for urn in self.urns if urn not in other_urns)
 
         # To maintain backwards compatibility, we provide this filtering mechanism.
         if type == "*":
@@ -110,6 +148,12 @@ class GenericCheckpointState(StaleEntityCheckpointStateBase["GenericCheckpointSt
     def get_percent_entities_changed(
         self, old_checkpoint_state: "GenericCheckpointState"
     ) -> float:
-        return StaleEntityCheckpointStateBase.compute_percent_entities_changed(
-            [(self.urns, old_checkpoint_state.urns)]
+        if not old_checkpoint_state.urns:
+            return 0.0
+        overlap_count = sum(
+            1 for urn in old_checkpoint_state.urns if urn in self._urns_set
         )
+        return (1 - overlap_count / len(old_checkpoint_state.urns)) * 100.0
+
+    def to_compact_dict(self) -> Dict[str, Any]:
+        return {"compact_urns": _front_code_urns(self.urns)}
@@ -8,9 +8,13 @@ from datahub.ingestion.source.state.checkpoint import CheckpointStateBase
 class ProfilingCheckpointState(CheckpointStateBase):
     """
     Base class for representing the checkpoint state for all profiling based sources.
-    Stores the last successful profiling time per urn.
+    Stores the last successful profiling time per urn, along with a fingerprint of
+    the table at that time.
     Subclasses can define additional state as appropriate.
     """
 
     # Last profiled stores urn, last_profiled timestamp millis in a dict
     last_profiled: Dict[str, pydantic.PositiveInt]
+
+    # Table fingerprints (last altered time, row count and size) stores urn, fingerprint in a dict
+    table_fingerprints: Dict[str, str] = pydantic.Field(default_factory=dict)
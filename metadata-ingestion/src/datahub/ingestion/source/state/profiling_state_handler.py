@@ -100,10 +100,15 @@ class ProfilingHandler(StatefulIngestionUsecaseHandlerBase[ProfilingCheckpointSt
         self,
         urn: str,
         profile_time_millis: pydantic.PositiveInt,
+        fingerprint: Optional[str] = None,
     ) -> None:
         cur_state = self.get_current_state()
         if cur_state:
             cur_state.last_profiled[urn] = profile_time_millis
+            if fingerprint is not None:
+                cur_state.table_fingerprints[urn] = fingerprint
+            else:
+                cur_state.table_fingerprints.pop(urn, None)
 
     def get_last_state(self) -> Optional[ProfilingCheckpointState]:
         if not self.is_checkpointing_enabled() or self._ignore_old_state():
@@ -122,3 +127,10 @@ class ProfilingHandler(StatefulIngestionUsecaseHandlerBase[ProfilingCheckpointSt
             return state.last_profiled.get(urn)
 
         return None
+
+    def get_last_fingerprint(self, urn: str) -> Optional[str]:
+        state = self.get_last_state()
+        if state:
+            return state.table_fingerprints.get(urn)
+
+        return None
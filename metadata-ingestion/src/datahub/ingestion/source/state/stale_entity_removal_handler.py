@@ -51,6 +51,10 @@ class StatefulStaleMetadataRemovalConfig(StatefulIngestionConfig):
         ge=0.0,
         hidden_from_docs=True,
     )
+    compact_checkpoint_state: bool = pydantic.Field(
+        default=False,
+        description="Writes the checkpoint state with the base85-bz2-compact-json serde, which front-codes the urns to keep large states small. CLI versions that predate this serde can't read such checkpoints, so only enable it once every CLI that reads the state has been upgraded.",
+    )
 
 
 @dataclass
@@ -242,7 +246,13 @@ class StaleEntityRemovalHandler(
                 job_name=self.job_id,
                 pipeline_name=self.pipeline_name,
                 run_id=self.run_id,
-                state=self.state_type_class(),
+                state=self.state_type_class(
+                    **(
+                        {"serde": "base85-bz2-compact-json"}
+                        if self.stateful_ingestion_config.compact_checkpoint_state
+                        else {}
+                    )
+                ),
             )
         return None
 
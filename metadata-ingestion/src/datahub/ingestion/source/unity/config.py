@@ -65,6 +65,16 @@ class UnityCatalogSourceConfig(StatefulIngestionConfigBase, DatasetSourceConfigM
         description="Option to enable/disable lineage generation. Currently we have to call a rest call per column to get column level lineage due to the Databrick api which can slow down ingestion. ",
     )
 
+    lineage_max_workers: pydantic.PositiveInt = pydantic.Field(
+        default=5,
+        description="Number of threads used to fetch table lineage, and as many again to fetch column lineage, concurrently.",
+    )
+
+    lineage_requests_per_min: Optional[pydantic.PositiveInt] = pydantic.Field(
+        default=None,
+        description="Maximum number of lineage requests per minute. By default, lineage requests are not rate limited.",
+    )
+
     stateful_ingestion: Optional[StatefulStaleMetadataRemovalConfig] = pydantic.Field(
         default=None, description="Unity Catalog Stateful Ingestion Config."
     )
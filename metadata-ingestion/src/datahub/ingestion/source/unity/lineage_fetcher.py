@@ -0,0 +1,137 @@
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+from datahub.ingestion.api.closeable import Closeable
+from datahub.ingestion.source.unity.proxy import Table, UnityCatalogApiProxy
+from datahub.ingestion.source.unity.report import UnityCatalogReport
+from datahub.utilities.perf_timer import PerfTimer
+
+if TYPE_CHECKING:
+    from ratelimiter import RateLimiter
+
+logger = logging.getLogger(__name__)
+
+
+class UnityCatalogLineageFetcher(Closeable):
+    """
+    Fetches the lineage of tables in the background, so that the lineage requests of
+    different tables, and of the columns of a table, overlap.
+
+    Requests run on bounded thread pools and can be rate limited. Table requests run
+    on a pool of their own, since they wait for the column requests of their table.
+    """
+
+    def __init__(
+        self,
+        proxy: UnityCatalogApiProxy,
+        report: UnityCatalogReport,
+        include_column_lineage: bool,
+        max_workers: int,
+        requests_per_min: Optional[int] = None,
+    ) -> None:
+        self.proxy = proxy
+        self.report = report
+        self.include_column_lineage = include_column_lineage
+        self._rate_limiter: Optional["RateLimiter"] = None
+        if requests_per_min:
+            # Imported lazily, since ratelimiter doesn't import on Python 3.11+.
+            import ratelimiter
+
+            self._rate_limiter = ratelimiter.RateLimiter(
+                max_calls=requests_per_min, period=60
+            )
+        self._table_executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="unity-table-lineage"
+        )
+        self._column_executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="unity-column-lineage"
+        )
+        # Keyed on the id of the table.
+        self._futures: Dict[str, Future] = {}
+        self._report_lock = threading.Lock()
+
+    def submit(self, table: Table) -> None:
+        """Starts fetching the lineage of the table, unless it was already started."""
+        if table.id not in self._futures:
+            self._futures[table.id] = self._table_executor.submit(
+                self._fetch_lineage, table
+            )
+
+    def wait(self, table: Table) -> None:
+        """Waits until the lineage of the table has been added to its upstreams."""
+        self.submit(table)
+        self._futures.pop(table.id).result()
+
+    def _request(self, table_name: str, column_name: Optional[str] = None) -> dict:
+        if self._rate_limiter is not None:
+            with self._rate_limiter:
+                return self._timed_request(table_name, column_name)
+        return self._timed_request(table_name, column_name)
+
+    def _timed_request(self, table_name: str, column_name: Optional[str]) -> dict:
+        with PerfTimer() as timer:
+            try:
+                if column_name is None:
+                    return self.proxy.list_lineages_by_table(table_name=table_name)
+                return self.proxy.list_lineages_by_column(
+                    table_name=table_name, column_name=column_name
+                )
+            except Exception:
+                with self._report_lock:
+                    self.report.num_lineage_request_failures += 1
+                raise
+            finally:
+                self._report_request(column_name is not None, timer.elapsed_seconds())
+
+    def _report_request(self, is_column_request: bool, elapsed_sec: float) -> None:
+        with self._report_lock:
+            if is_column_request:
+                self.report.num_column_lineage_requests += 1
+            else:
+                self.report.num_table_lineage_requests += 1
+            self.report.lineage_request_total_sec += elapsed_sec
+            self.report.lineage_request_max_sec = max(
+                self.report.lineage_request_max_sec, elapsed_sec
+            )
+
+    def _fetch_lineage(self, table: Table) -> None:
+        # Mirrors UnityCatalogApiProxy.table_lineage and get_column_lineage, with the
+        # column requests running concurrently.
+        table_name = f"{table.schema.catalog.name}.{table.schema.name}.{table.name}"
+        column_futures: List[Future] = []
+        with PerfTimer() as timer:
+            try:
+                response = self._request(table_name)
+                if not self.include_column_lineage:
+                    self.proxy.set_table_lineage(table, response)
+                elif response:
+                    column_futures = [
+                        self._column_executor.submit(
+                            self._request, table_name, column.name
+                        )
+                        for column in table.columns
+                    ]
+                    # Responses are added in column order, so that the upstreams
+                    # don't depend on the order in which the requests complete.
+                    for column, future in zip(table.columns, column_futures):
+                        self.proxy.add_column_lineage(
+                            table, column.name, future.result()
+                        )
+            except Exception as e:
+                logger.error(f"Error getting lineage: {e}")
+                for future in column_futures:
+                    future.cancel()
+
+        with self._report_lock:
+            self.report.lineage_extraction_sec[table_name] = round(
+                timer.elapsed_seconds(), 2
+            )
+
+    def close(self) -> None:
+        for future in self._futures.values():
+            future.cancel()
+        self._futures.clear()
+        self._table_executor.shutdown(wait=True)
+        self._column_executor.shutdown(wait=True)
@@ -258,10 +258,7 @@ class UnityCatalogApiProxy:
             response: dict = self.list_lineages_by_table(
                 table_name=f"{table.schema.catalog.name}.{table.schema.name}.{table.name}"
             )
-            table.upstreams = {
-                f"{item['catalog_name']}.{item['schema_name']}.{item['name']}": {}
-                for item in response.get("upstream_tables", [])
-            }
+            self.set_table_lineage(table, response)
         except Exception as e:
             logger.error(f"Error getting lineage: {e}")
 
@@ -276,22 +273,33 @@ class UnityCatalogApiProxy:
                         table_name=f"{table.schema.catalog.name}.{table.schema.name}.{table.name}",
                         column_name=column.name,
                     )
-                    for item in response.get("upstream_cols", []):
-                        table_name = f"{item['catalog_name']}.{item['schema_name']}.{item['table_name']}"
-                        col_name = item["name"]
-                        if not table.upstreams.get(table_name):
-                            table.upstreams[table_name] = {column.name: [col_name]}
-                        else:
-                            if column.name in table.upstreams[table_name]:
-                                table.upstreams[table_name][column.name].append(
-                                    col_name
-                                )
-                            else:
-                                table.upstreams[table_name][column.name] = [col_name]
+                    self.add_column_lineage(table, column.name, response)
 
         except Exception as e:
             logger.error(f"Error getting lineage: {e}")
 
+    @staticmethod
+    def set_table_lineage(table: Table, response: dict) -> None:
+        table.upstreams = {
+            f"{item['catalog_name']}.{item['schema_name']}.{item['name']}": {}
+            for item in response.get("upstream_tables", [])
+        }
+
+    @staticmethod
+    def add_column_lineage(table: Table, column_name: str, response: dict) -> None:
+        for item in response.get("upstream_cols", []):
+            table_name = (
+                f"{item['catalog_name']}.{item['schema_name']}.{item['table_name']}"
+            )
+            col_name = item["name"]
+            if not table.upstreams.get(table_name):
+                table.upstreams[table_name] = {column_name: [col_name]}
+            else:
+                if column_name in table.upstreams[table_name]:
+                    table.upstreams[table_name][column_name].append(col_name)
+                else:
+                    table.upstreams[table_name][column_name] = [col_name]
+
     @staticmethod
     def _escape_sequence(value: str) -> str:
         return value.replace(" ", "_")
@@ -1,9 +1,11 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Dict
 
 from datahub.ingestion.api.report import EntityFilterReport
 from datahub.ingestion.source.state.stale_entity_removal_handler import (
     StaleEntityRemovalSourceReport,
 )
+from datahub.utilities.stats_collections import TopKDict
 
 
 @dataclass
@@ -12,3 +14,11 @@ class UnityCatalogReport(StaleEntityRemovalSourceReport):
     catalogs: EntityFilterReport = EntityFilterReport.field(type="catalog")
     schemas: EntityFilterReport = EntityFilterReport.field(type="schema")
     tables: EntityFilterReport = EntityFilterReport.field(type="table/view")
+
+    num_table_lineage_requests: int = 0
+    num_column_lineage_requests: int = 0
+    num_lineage_request_failures: int = 0
+    lineage_request_total_sec: float = 0.0
+    lineage_request_max_sec: float = 0.0
+    # Time taken to fetch the lineage of a table, including its column lineage.
+    lineage_extraction_sec: Dict[str, float] = field(default_factory=TopKDict)
@@ -47,6 +47,7 @@ from datahub.ingestion.source.state.stateful_ingestion_base import (
 )
 from datahub.ingestion.source.unity import proxy
 from datahub.ingestion.source.unity.config import UnityCatalogSourceConfig
+from datahub.ingestion.source.unity.lineage_fetcher import UnityCatalogLineageFetcher
 from datahub.ingestion.source.unity.proxy import (
     Catalog,
     Metastore,
@@ -127,6 +128,13 @@ class UnityCatalogSource(StatefulIngestionSourceBase, TestableSource):
         self.unity_catalog_api_proxy = proxy.UnityCatalogApiProxy(
             config.workspace_url, config.token, report=self.report
         )
+        self.lineage_fetcher = UnityCatalogLineageFetcher(
+            self.unity_catalog_api_proxy,
+            self.report,
+            include_column_lineage=bool(config.include_column_lineage),
+            max_workers=config.lineage_max_workers,
+            requests_per_min=config.lineage_requests_per_min,
+        )
 
         # Determine the platform_instance_name
         self.platform_instance_name = (
@@ -186,6 +194,10 @@ class UnityCatalogSource(StatefulIngestionSourceBase, TestableSource):
             ),
         )
 
+    def close(self) -> None:
+        self.lineage_fetcher.close()
+        super().close()
+
     def get_workunits_internal(self) -> Iterable[MetadataWorkUnit]:
         self.build_service_principal_map()
         yield from self.process_metastores()
@@ -243,6 +255,7 @@ class UnityCatalogSource(StatefulIngestionSourceBase, TestableSource):
             self.report.schemas.processed(schema.id)
 
     def process_tables(self, schema: proxy.Schema) -> Iterable[MetadataWorkUnit]:
+        tables: List[proxy.Table] = []
         for table in self.unity_catalog_api_proxy.tables(schema=schema):
             filter_table_name = (
                 f"{table.schema.catalog.name}.{table.schema.name}.{table.name}"
@@ -252,6 +265,15 @@ class UnityCatalogSource(StatefulIngestionSourceBase, TestableSource):
                 self.report.tables.dropped(table.id, type=table.type)
                 continue
 
+            tables.append(table)
+
+        if self.config.include_column_lineage or self.config.include_table_lineage:
+            # Fetch the lineage of all the tables of the schema in the background,
+            # so that the requests overlap while the tables are processed in order.
+            for table in tables:
+                self.lineage_fetcher.submit(table)
+
+        for table in tables:
             yield from self.process_table(table, schema)
 
             self.report.tables.processed(table.id, type=table.type)
@@ -286,10 +308,10 @@ class UnityCatalogSource(StatefulIngestionSourceBase, TestableSource):
 
         lineage: Optional[UpstreamLineageClass] = None
         if self.config.include_column_lineage:
-            self.unity_catalog_api_proxy.get_column_lineage(table)
+            self.lineage_fetcher.wait(table)
             lineage = self._generate_column_lineage_aspect(dataset_urn, table)
         elif self.config.include_table_lineage:
-            self.unity_catalog_api_proxy.table_lineage(table)
+            self.lineage_fetcher.wait(table)
             lineage = self._generate_lineage_aspect(dataset_urn, table)
 
         yield from [
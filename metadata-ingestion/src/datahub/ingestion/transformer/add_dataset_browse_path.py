@@ -35,6 +35,11 @@ class AddDatasetBrowsePathTransformer(DatasetBrowsePathsTransformer):
         config = AddDatasetBrowsePathConfig.parse_obj(config_dict)
         return cls(config, ctx)
 
+    def _get_server_graph(self) -> Optional[DataHubGraph]:
+        if self.config.semantics == TransformerSemantics.PATCH:
+            return self.ctx.graph
+        return None
+
     @staticmethod
     def _merge_with_server_browse_paths(
         graph: DataHubGraph, urn: str, mce_browse_paths: Optional[BrowsePathsClass]
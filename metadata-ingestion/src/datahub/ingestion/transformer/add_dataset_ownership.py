@@ -51,6 +51,11 @@ class AddDatasetOwnership(DatasetOwnershipTransformer):
         config = AddDatasetOwnershipConfig.parse_obj(config_dict)
         return cls(config, ctx)
 
+    def _get_server_graph(self) -> Optional[DataHubGraph]:
+        if self.config.semantics == TransformerSemantics.PATCH:
+            return self.ctx.graph
+        return None
+
     @staticmethod
     def _merge_with_server_ownership(
         graph: DataHubGraph, urn: str, mce_ownership: Optional[OwnershipClass]
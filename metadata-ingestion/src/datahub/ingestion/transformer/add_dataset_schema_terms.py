@@ -8,6 +8,7 @@ from datahub.configuration.common import (
 )
 from datahub.configuration.import_resolver import pydantic_resolve_key
 from datahub.ingestion.api.common import PipelineContext
+from datahub.ingestion.graph.client import DataHubGraph
 from datahub.ingestion.transformer.dataset_transformer import (
     DatasetSchemaMetadataTransformer,
 )
@@ -42,6 +43,11 @@ class AddDatasetSchemaTerms(DatasetSchemaMetadataTransformer):
         config = AddDatasetSchemaTermsConfig.parse_obj(config_dict)
         return cls(config, ctx)
 
+    def _get_server_graph(self) -> Optional[DataHubGraph]:
+        if self.config.semantics == TransformerSemantics.PATCH:
+            return self.ctx.graph
+        return None
+
     def extend_field(
         self, schema_field: SchemaFieldClass, server_field: Optional[SchemaFieldClass]
     ) -> SchemaFieldClass:
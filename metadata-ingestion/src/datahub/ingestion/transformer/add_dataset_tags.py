@@ -35,6 +35,11 @@ class AddDatasetTags(DatasetTagsTransformer):
         config = AddDatasetTagsConfig.parse_obj(config_dict)
         return cls(config, ctx)
 
+    def _get_server_graph(self) -> Optional[DataHubGraph]:
+        if self.config.semantics == TransformerSemantics.PATCH:
+            return self.ctx.graph
+        return None
+
     @staticmethod
     def _merge_with_server_global_tags(
         graph: DataHubGraph, urn: str, global_tags_aspect: Optional[GlobalTagsClass]
@@ -42,6 +42,11 @@ class AddDatasetTerms(DatasetTermsTransformer):
         config = AddDatasetTermsConfig.parse_obj(config_dict)
         return cls(config, ctx)
 
+    def _get_server_graph(self) -> Optional[DataHubGraph]:
+        if self.config.semantics == TransformerSemantics.PATCH:
+            return self.ctx.graph
+        return None
+
     @staticmethod
     def _merge_with_server_glossary_terms(
         graph: DataHubGraph,
@@ -1,6 +1,18 @@
+import itertools
+import json
 import logging
 from abc import ABCMeta, abstractmethod
-from typing import Any, Dict, Iterable, List, Optional, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Type,
+    Union,
+)
 
 import datahub.emitter.mce_builder as builder
 from datahub.emitter.aspect import ASPECT_MAP
@@ -11,11 +23,86 @@ from datahub.ingestion.api.transform import Transformer
 from datahub.metadata.schema_classes import (
     MetadataChangeEventClass,
     MetadataChangeProposalClass,
+    SystemMetadataClass,
 )
+from datahub.utilities.file_backed_collections import FileBackedDict
 from datahub.utilities.urns.urn import Urn, guess_entity_type
 
+if TYPE_CHECKING:
+    from datahub.ingestion.graph.client import DataHubGraph
+
 log = logging.getLogger(__name__)
 
+# Number of records to look ahead when prefetching server aspects.
+_PREFETCH_BATCH_SIZE = 100
+
+
+class _EntityState(NamedTuple):
+    processed: bool
+    # The system metadata of the first MCP seen for the entity takes precedence
+    # over the system metadata of its MCEs.
+    seen_mcp: bool = False
+    system_metadata: Optional[SystemMetadataClass] = None
+
+
+_PROCESSED = _EntityState(processed=True)
+
+
+def _serialize_entity_state(state: _EntityState) -> str:
+    if state is _PROCESSED:
+        # Most entities end up processed, so skip encoding them each time.
+        return _SERIALIZED_PROCESSED
+    return json.dumps(
+        [
+            state.processed,
+            state.seen_mcp,
+            state.system_metadata.to_obj() if state.system_metadata else None,
+        ]
+    )
+
+
+def _deserialize_entity_state(value: str) -> _EntityState:
+    if value == _SERIALIZED_PROCESSED:
+        return _PROCESSED
+    processed, seen_mcp, system_metadata = json.loads(value)
+    return _EntityState(
+        processed=processed,
+        seen_mcp=seen_mcp,
+        system_metadata=SystemMetadataClass.from_obj(system_metadata)
+        if system_metadata
+        else None,
+    )
+
+
+_SERIALIZED_PROCESSED = json.dumps([True, False, None])
+
+
+class SnapshotAspectIndex:
+    """Looks up the aspects of an MCE's snapshot by type, scanning the snapshot only once."""
+
+    def __init__(self, mce: MetadataChangeEventClass):
+        self.mce = mce
+        self._aspects: Optional[Dict[type, Any]] = None
+
+    def get(self, aspect_type: Type[Aspect]) -> Optional[Aspect]:
+        if self._aspects is None:
+            self._aspects = {
+                type(aspect): aspect for aspect in self.mce.proposedSnapshot.aspects
+            }
+        return self._aspects.get(aspect_type)
+
+    def set(self, aspect_type: Type[Aspect], aspect: Optional[Aspect]) -> None:
+        builder.set_aspect(self.mce, aspect=aspect, aspect_type=aspect_type)
+        if self._aspects is not None:
+            if aspect is None:
+                self._aspects.pop(aspect_type, None)
+            else:
+                self._aspects[aspect_type] = aspect
+
+    def reset(self, mce: MetadataChangeEventClass) -> None:
+        self.mce = mce
+        self._aspects = None
+
 
 class LegacyMCETransformer(Transformer, metaclass=ABCMeta):
     @abstractmethod
@@ -52,7 +139,7 @@ class BaseTransformer(Transformer, metaclass=ABCMeta):
         return ["*"]
 
     def __init__(self):
-        self.entity_map: Dict[str, Dict[str, Any]] = {}
+        self._entity_map: Optional[FileBackedDict[_EntityState]] = None
         mixedin = False
         for mixin in [LegacyMCETransformer, SingleAspectTransformer]:
             mixedin = mixedin or isinstance(self, mixin)
@@ -61,6 +148,90 @@ class BaseTransformer(Transformer, metaclass=ABCMeta):
                 "Class does not implement one of required traits {self.allowed_mixins}"
             )
 
+    @property
+    def entity_map(self) -> FileBackedDict[_EntityState]:
+        # Created lazily, since the connection can only be used by the thread that
+        # runs the transformer. Each transformer has a database of its own, which
+        # is deleted when the map is closed.
+        if self._entity_map is None:
+            self._entity_map = FileBackedDict[_EntityState](
+                tablename="transformer_entity_state",
+                serializer=_serialize_entity_state,
+                deserializer=_deserialize_entity_state,
+                extra_columns={"processed": lambda state: int(state.processed)},
+            )
+        return self._entity_map
+
+    def _close_entity_map(self) -> None:
+        if self._entity_map is not None:
+            entity_map, self._entity_map = self._entity_map, None
+            entity_map.close()
+
+    def close(self) -> None:
+        self._close_entity_map()
+
+    def _get_server_graph(self) -> Optional["DataHubGraph"]:
+        """Override this method to return the graph if the transformer merges its aspect with the server's copy (e.g. PATCH semantics)."""
+        return None
+
+    def _get_urn_to_prefetch(
+        self,
+        record: Union[
+            MetadataChangeEventClass, MetadataChangeProposalWrapper, ControlRecord
+        ],
+    ) -> Optional[str]:
+        if isinstance(record, ControlRecord) or not self._should_process(record):
+            return None
+        if isinstance(record, MetadataChangeEventClass):
+            return record.proposedSnapshot.urn
+        if (
+            isinstance(record, MetadataChangeProposalWrapper)
+            and isinstance(self, SingleAspectTransformer)
+            and record.aspectName == self.aspect_name()
+        ):
+            return record.entityUrn
+        return None
+
+    def _prefetch_server_aspects(
+        self,
+        record_envelopes: Iterable[RecordEnvelope],
+        graph: "DataHubGraph",
+        aspect_type: Type[Aspect],
+    ) -> Iterable[RecordEnvelope]:
+        # Reads a batch of records ahead, so that the server aspects for all of them
+        # can be fetched in one request before they get transformed.
+        batch: List[RecordEnvelope] = []
+        for envelope in record_envelopes:
+            batch.append(envelope)
+            if len(batch) >= _PREFETCH_BATCH_SIZE or isinstance(
+                envelope.record, EndOfStream
+            ):
+                yield from self._prefetch_batch(batch, graph, aspect_type)
+                batch = []
+        if batch:
+            yield from self._prefetch_batch(batch, graph, aspect_type)
+
+    def _prefetch_batch(
+        self,
+        batch: List[RecordEnvelope],
+        graph: "DataHubGraph",
+        aspect_type: Type[Aspect],
+    ) -> Iterable[RecordEnvelope]:
+        urns = [
+            urn
+            for urn in (
+                self._get_urn_to_prefetch(envelope.record) for envelope in batch
+            )
+            if urn is not None
+        ]
+        if urns:
+            graph.prefetch_aspects(urns, aspect_type)
+        yield from batch
+        # The batch has been transformed by now. The sink writes these aspects
+        # later on, so the prefetched copies must not outlive the batch.
+        if urns:
+            graph.drop_prefetched_aspects(urns, aspect_type)
+
     def _should_process(
         self,
         record: Union[
@@ -86,39 +257,39 @@ class BaseTransformer(Transformer, metaclass=ABCMeta):
         return True
 
     def _record_mce(self, mce: MetadataChangeEventClass) -> None:
-        record_entry = self.entity_map.get(mce.proposedSnapshot.urn, {"seen": {}})
-        if "seen" in record_entry:
+        urn = mce.proposedSnapshot.urn
+        state = self.entity_map.get(urn, _EntityState(processed=False))
+        if not state.processed and not state.seen_mcp:
             # we just record the system metadata field from the mce, since we might need it later
-            record_entry["seen"]["mce"] = mce.systemMetadata
-            self.entity_map[mce.proposedSnapshot.urn] = record_entry
+            self.entity_map[urn] = state._replace(system_metadata=mce.systemMetadata)
 
     def _record_mcp(self, mcp: MetadataChangeProposalWrapper) -> None:
         assert mcp.entityUrn
-        record_entry = self.entity_map.get(mcp.entityUrn, {"seen": {}})
-        if "seen" in record_entry and "mcp" not in record_entry["seen"]:
+        state = self.entity_map.get(mcp.entityUrn, _EntityState(processed=False))
+        if not state.processed and not state.seen_mcp:
             # only record the first mcp seen
-            record_entry["seen"]["mcp"] = mcp
-        self.entity_map[mcp.entityUrn] = record_entry
+            self.entity_map[mcp.entityUrn] = _EntityState(
+                processed=False, seen_mcp=True, system_metadata=mcp.systemMetadata
+            )
 
     def _mark_processed(self, entity_urn: str) -> None:
-        self.entity_map[entity_urn] = {"processed": True}
+        self.entity_map[entity_urn] = _PROCESSED
 
     def _transform_or_record_mce(
         self,
         envelope: RecordEnvelope[MetadataChangeEventClass],
+        aspect_index: Optional[SnapshotAspectIndex] = None,
     ) -> RecordEnvelope[MetadataChangeEventClass]:
         mce: MetadataChangeEventClass = envelope.record
-        if mce.proposedSnapshot:
-            self._record_mce(mce)
+        if aspect_index is None:
+            aspect_index = SnapshotAspectIndex(mce)
+        processed = False
         if isinstance(self, SingleAspectTransformer):
             aspect_type = ASPECT_MAP.get(self.aspect_name())
             if aspect_type:
                 # if we find a type corresponding to the aspect name we look for it in the mce
                 old_aspect = (
-                    builder.get_aspect_if_available(
-                        mce,
-                        aspect_type,
-                    )
+                    aspect_index.get(aspect_type)
                     if builder.can_add_aspect(mce, aspect_type)
                     else None
                 )
@@ -126,19 +297,16 @@ class BaseTransformer(Transformer, metaclass=ABCMeta):
                     if isinstance(self, LegacyMCETransformer):
                         # use the transform_one pathway to transform this MCE
                         envelope.record = self.transform_one(mce)
+                        aspect_index.reset(envelope.record)
                     else:
                         transformed_aspect = self.transform_aspect(
                             entity_urn=mce.proposedSnapshot.urn,
                             aspect_name=self.aspect_name(),
                             aspect=old_aspect,
                         )
-                        builder.set_aspect(
-                            mce,
-                            aspect_type=aspect_type,
-                            aspect=transformed_aspect,
-                        )
+                        aspect_index.set(aspect_type, transformed_aspect)
                         envelope.record = mce
-                    self._mark_processed(mce.proposedSnapshot.urn)
+                    processed = True
             else:
                 log.warning(
                     f"Could not locate a snapshot aspect type for aspect {self.aspect_name()}. This can lead to silent drops of messages in transformers."
@@ -146,8 +314,15 @@ class BaseTransformer(Transformer, metaclass=ABCMeta):
         elif isinstance(self, LegacyMCETransformer):
             # we pass down the full MCE
             envelope.record = self.transform_one(mce)
-            self._mark_processed(mce.proposedSnapshot.urn)
+            aspect_index.reset(envelope.record)
+            processed = True
 
+        # A processed entity's recorded system metadata is never used, so it's
+        # enough to write its state once.
+        if processed:
+            self._mark_processed(mce.proposedSnapshot.urn)
+        elif mce.proposedSnapshot:
+            self._record_mce(mce)
         return envelope
 
     def _transform_or_record_mcp(
@@ -178,6 +353,17 @@ class BaseTransformer(Transformer, metaclass=ABCMeta):
     def transform(
         self, record_envelopes: Iterable[RecordEnvelope]
     ) -> Iterable[RecordEnvelope]:
+        graph = self._get_server_graph()
+        prefetch_aspect_type = (
+            ASPECT_MAP.get(self.aspect_name())
+            if graph is not None and isinstance(self, SingleAspectTransformer)
+            else None
+        )
+        if graph is not None and prefetch_aspect_type is not None:
+            record_envelopes = self._prefetch_server_aspects(
+                record_envelopes, graph, prefetch_aspect_type
+            )
+
         for envelope in record_envelopes:
             if not self._should_process(envelope.record):
                 # early exit
@@ -195,42 +381,55 @@ class BaseTransformer(Transformer, metaclass=ABCMeta):
             elif isinstance(envelope.record, EndOfStream) and isinstance(
                 self, SingleAspectTransformer
             ):
-                # walk through state and call transform for any unprocessed entities
-                for urn, state in self.entity_map.items():
-                    if "seen" in state:
-                        # call transform on this entity_urn
-                        last_seen_mcp = state["seen"].get("mcp")
-                        last_seen_mce_system_metadata = state["seen"].get("mce")
-
-                        transformed_aspect = self.transform_aspect(
-                            entity_urn=urn,
-                            aspect_name=self.aspect_name(),
-                            aspect=last_seen_mcp.aspect
-                            if last_seen_mcp
-                            and last_seen_mcp.aspectName == self.aspect_name()
-                            else None,
-                        )
-                        if transformed_aspect:
-                            # for end of stream records, we modify the workunit-id
-                            structured_urn = Urn.create_from_string(urn)
-                            simple_name = "-".join(structured_urn.get_entity_id())
-                            record_metadata = envelope.metadata.copy()
-                            record_metadata.update(
-                                {
-                                    "workunit_id": f"txform-{simple_name}-{self.aspect_name()}"
-                                }
-                            )
-                            yield RecordEnvelope(
-                                record=MetadataChangeProposalWrapper(
-                                    entityUrn=urn,
-                                    entityType=structured_urn.get_type(),
-                                    systemMetadata=last_seen_mcp.systemMetadata
-                                    if last_seen_mcp
-                                    else last_seen_mce_system_metadata,
-                                    aspectName=self.aspect_name(),
-                                    aspect=transformed_aspect,
-                                ),
-                                metadata=record_metadata,
-                            )
-                    self._mark_processed(urn)
+                yield from self._end_of_stream_records(
+                    envelope, graph, prefetch_aspect_type
+                )
             yield envelope
+
+    def _end_of_stream_records(
+        self,
+        envelope: RecordEnvelope[EndOfStream],
+        graph: Optional["DataHubGraph"] = None,
+        prefetch_aspect_type: Optional[Type[Aspect]] = None,
+    ) -> Iterable[RecordEnvelope[MetadataChangeProposalWrapper]]:
+        assert isinstance(self, SingleAspectTransformer)
+        # walk through state and call transform for any unprocessed entities
+        unprocessed_entities = self.entity_map.items_snapshot("processed = 0")
+        while True:
+            batch = list(itertools.islice(unprocessed_entities, _PREFETCH_BATCH_SIZE))
+            if not batch:
+                break
+            if graph is not None and prefetch_aspect_type is not None:
+                graph.prefetch_aspects([urn for urn, _ in batch], prefetch_aspect_type)
+            for urn, state in batch:
+                # A recorded mcp never carries this transformer's aspect, since
+                # those are transformed as soon as they are seen.
+                transformed_aspect = self.transform_aspect(
+                    entity_urn=urn,
+                    aspect_name=self.aspect_name(),
+                    aspect=None,
+                )
+                if transformed_aspect:
+                    # for end of stream records, we modify the workunit-id
+                    structured_urn = Urn.create_from_string(urn)
+                    simple_name = "-".join(structured_urn.get_entity_id())
+                    record_metadata = envelope.metadata.copy()
+                    record_metadata.update(
+                        {"workunit_id": f"txform-{simple_name}-{self.aspect_name()}"}
+                    )
+                    yield RecordEnvelope(
+                        record=MetadataChangeProposalWrapper(
+                            entityUrn=urn,
+                            entityType=structured_urn.get_type(),
+                            systemMetadata=state.system_metadata,
+                            aspectName=self.aspect_name(),
+                            aspect=transformed_aspect,
+                        ),
+                        metadata=record_metadata,
+                    )
+            if graph is not None and prefetch_aspect_type is not None:
+                graph.drop_prefetched_aspects(
+                    [urn for urn, _ in batch], prefetch_aspect_type
+                )
+        # every entity has been processed now, so the state can be dropped
+        self._close_entity_map()
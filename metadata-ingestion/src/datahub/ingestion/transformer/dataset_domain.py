@@ -48,6 +48,11 @@ class AddDatasetDomain(DatasetDomainTransformer):
         config = AddDatasetDomainSemanticsConfig.parse_obj(config_dict)
         return cls(config, ctx)
 
+    def _get_server_graph(self) -> Optional[DataHubGraph]:
+        if self.config.semantics == TransformerSemantics.PATCH:
+            return self.ctx.graph
+        return None
+
     @staticmethod
     def raise_ctx_configuration_error(ctx: PipelineContext) -> None:
         if ctx.graph is None:
@@ -0,0 +1,137 @@
+import logging
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from datahub.emitter.mcp import MetadataChangeProposalWrapper
+from datahub.ingestion.api.common import EndOfStream, RecordEnvelope
+from datahub.ingestion.api.transform import Transformer
+from datahub.ingestion.transformer.base_transformer import (
+    BaseTransformer,
+    SingleAspectTransformer,
+    SnapshotAspectIndex,
+)
+from datahub.metadata.schema_classes import MetadataChangeEventClass
+from datahub.utilities.urns.urn import guess_entity_type
+
+logger = logging.getLogger(__name__)
+
+# A route is the position of a transformer in the stage, and whether the transformer
+# transforms the record (as opposed to only recording that its entity was seen).
+_Route = Tuple[int, bool]
+
+
+class _FusedStage:
+    """
+    Runs consecutive BaseTransformers in a single pass over the records.
+
+    Records are routed with a dispatch table keyed by (entity type, aspect name),
+    so each record only visits the transformers that subscribe to its entity type.
+    MCEs share a single aspect index across the transformers.
+    """
+
+    def __init__(self, transformers: List[BaseTransformer]):
+        self.transformers = transformers
+        self._routes: Dict[Tuple[str, Optional[str]], Sequence[_Route]] = {}
+
+    def _get_routes(
+        self, entity_type: str, aspect_name: Optional[str]
+    ) -> Sequence[_Route]:
+        # aspect_name is None for MCEs.
+        key = (entity_type, aspect_name)
+        routes = self._routes.get(key)
+        if routes is None:
+            routes = []
+            for i, transformer in enumerate(self.transformers):
+                entity_types = transformer.entity_types()
+                if "*" not in entity_types and entity_type not in entity_types:
+                    continue
+                if aspect_name is None:
+                    routes.append((i, True))
+                elif isinstance(transformer, SingleAspectTransformer):
+                    routes.append((i, transformer.aspect_name() == aspect_name))
+            self._routes[key] = routes
+        return routes
+
+    def transform(self, records: Iterable[RecordEnvelope]) -> Iterable[RecordEnvelope]:
+        for envelope in records:
+            yield from self._process(envelope, 0)
+
+    def _process(
+        self, envelope: RecordEnvelope, start: int
+    ) -> Iterable[RecordEnvelope]:
+        record = envelope.record
+        if isinstance(record, MetadataChangeEventClass):
+            aspect_index = SnapshotAspectIndex(record)
+            for i, _ in self._get_routes(
+                guess_entity_type(record.proposedSnapshot.urn), None
+            ):
+                if i >= start:
+                    envelope = self.transformers[i]._transform_or_record_mce(
+                        envelope, aspect_index
+                    )
+        elif isinstance(record, MetadataChangeProposalWrapper):
+            assert record.entityType
+            for i, transforms in self._get_routes(record.entityType, record.aspectName):
+                if i < start:
+                    continue
+                if transforms:
+                    if self.transformers[i]._transform_or_record_mcp(envelope) is None:
+                        return
+                else:
+                    self.transformers[i]._record_mcp(record)
+                    if record.aspect is None:
+                        return
+        elif isinstance(record, EndOfStream):
+            for i in range(start, len(self.transformers)):
+                transformer = self.transformers[i]
+                if isinstance(transformer, SingleAspectTransformer):
+                    # records produced by a transformer still go through the ones after it
+                    for produced in transformer._end_of_stream_records(envelope):
+                        yield from self._process(produced, i + 1)
+        yield envelope
+
+
+def _can_fuse(transformer: Transformer) -> bool:
+    # Transformers that customize how the stream is consumed, or that read records
+    # ahead to prefetch server aspects, keep running as a stage of their own.
+    return (
+        isinstance(transformer, BaseTransformer)
+        and type(transformer).transform is BaseTransformer.transform
+        and transformer._get_server_graph() is None
+    )
+
+
+class TransformerChain:
+    """
+    Compiles the configured transformers into as few stages as possible.
+
+    Consecutive transformers that can be fused run in a single pass over the records,
+    the remaining ones wrap the record stream in their own generator as before.
+    """
+
+    def __init__(self, transformers: List[Transformer]):
+        self.transformers = transformers
+        self.stages: List[Union[_FusedStage, Transformer]] = []
+        fusable: List[BaseTransformer] = []
+        for transformer in transformers:
+            if _can_fuse(transformer):
+                assert isinstance(transformer, BaseTransformer)
+                fusable.append(transformer)
+                continue
+            if fusable:
+                self.stages.append(_FusedStage(fusable))
+                fusable = []
+            self.stages.append(transformer)
+        if fusable:
+            self.stages.append(_FusedStage(fusable))
+        logger.debug(
+            f"Compiled {len(transformers)} transformers into {len(self.stages)} stages"
+        )
+
+    def transform(self, records: Iterable[RecordEnvelope]) -> Iterable[RecordEnvelope]:
+        for stage in self.stages:
+            records = stage.transform(records)
+        return records
+
+    def close(self) -> None:
+        for transformer in self.transformers:
+            transformer.close()
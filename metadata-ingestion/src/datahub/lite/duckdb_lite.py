@@ -1,15 +1,19 @@
 import json
 import logging
 import pathlib
+import re
 import time
-from typing import Any, Dict, Iterable, List, Optional, Type, Union
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Type, Union
 
 import duckdb
 
 from datahub.emitter.aspect import ASPECT_MAP
 from datahub.emitter.mcp import MetadataChangeProposalWrapper
 from datahub.emitter.mcp_builder import mcps_from_mce
-from datahub.emitter.serialization_helper import post_json_transform
+from datahub.emitter.serialization_helper import (
+    codegen_to_restli_obj,
+    post_json_transform,
+)
 from datahub.lite.duckdb_lite_config import DuckDBLiteConfig
 from datahub.lite.lite_local import (
     AutoComplete,
@@ -38,6 +42,31 @@ from datahub.utilities.urns.urn import Urn
 
 logger = logging.getLogger(__name__)
 
+# The aspect's JSON, its system metadata and its createdon timestamp.
+_StagedAspect = Tuple[dict, dict, int]
+
+# Free-text search uses an inverted index of tokens. Each document is either an
+# aspect's name, or an entity's urn, which is stored under this pseudo aspect name.
+_URN_SEARCH_DOC = "urn"
+_SEARCH_TOKEN_RE = re.compile(r"[a-z0-9]+")
+# These appear in every urn, so they aren't useful for search.
+_SEARCH_STOP_TOKENS = {"urn", "li"}
+# Caps the number of documents returned by a single search.
+_MAX_SEARCH_RESULTS = 10000
+
+
+def _tokenize(text: str) -> List[str]:
+    tokens: Dict[str, None] = {}
+    for token in _SEARCH_TOKEN_RE.findall(text.lower()):
+        if token not in _SEARCH_STOP_TOKENS:
+            tokens[token] = None
+    return list(tokens)
+
+
+def _get_search_doc_text(metadata: dict) -> Optional[str]:
+    name = metadata.get("name")
+    return name if isinstance(name, str) else None
+
 
 class DuckDBLite(DataHubLiteLocal[DuckDBLiteConfig]):
     @classmethod
@@ -54,6 +83,15 @@ class DuckDBLite(DataHubLiteLocal[DuckDBLiteConfig]):
         )
         if not config.read_only:
             self._init_db()
+        # Databases created before the search index existed only get one once
+        # they are opened writable, so read-only opens may have to scan instead.
+        self._has_search_index = bool(
+            self.duckdb_client.execute(
+                "SELECT count(*) FROM duckdb_tables() WHERE table_name = 'metadata_search_token_v2'"
+            ).fetchone()[
+                0
+            ]  # type: ignore
+        )
 
     def _init_db(self):
         self.duckdb_client.execute(
@@ -71,6 +109,25 @@ class DuckDBLite(DataHubLiteLocal[DuckDBLiteConfig]):
             "CREATE UNIQUE INDEX IF NOT EXISTS edge_idx ON metadata_edge_v2 (src_id, relnship, dst_id)"
         )
 
+        search_index_exists = self.duckdb_client.execute(
+            "SELECT count(*) FROM duckdb_tables() WHERE table_name = 'metadata_search_token_v2'"
+        ).fetchone()[
+            0
+        ]  # type: ignore
+        self.duckdb_client.execute(
+            "CREATE TABLE IF NOT EXISTS metadata_search_token_v2 "
+            "(token VARCHAR, urn VARCHAR, aspect_name VARCHAR)"
+        )
+        self.duckdb_client.execute(
+            "CREATE INDEX IF NOT EXISTS search_token_idx ON metadata_search_token_v2 (token)"
+        )
+        self.duckdb_client.execute(
+            "CREATE INDEX IF NOT EXISTS search_token_urn_idx ON metadata_search_token_v2 (urn)"
+        )
+        if not search_index_exists:
+            # Databases created before the search index existed need a backfill.
+            self._rebuild_search_index()
+
     def location(self) -> str:
         return self.config.file
 
@@ -78,23 +135,31 @@ class DuckDBLite(DataHubLiteLocal[DuckDBLiteConfig]):
         fpath = pathlib.Path(self.config.file)
         fpath.unlink()
 
-    def write(
-        self,
+    @staticmethod
+    def _get_writeables(
         record: Union[
             MetadataChangeEventClass,
             MetadataChangeProposalWrapper,
         ],
-    ) -> None:
-        writeables: Iterable[MetadataChangeProposalWrapper]
+    ) -> Iterable[MetadataChangeProposalWrapper]:
         if isinstance(record, MetadataChangeProposalWrapper):
-            writeables = [record]
+            return [record]
         elif isinstance(record, MetadataChangeEventClass):
-            writeables = mcps_from_mce(record)
+            return mcps_from_mce(record)
         else:
             raise ValueError(
                 f"DuckDBCatalog only supports MCEs and MCPs, not {type(record)}"
             )
 
+    def write(
+        self,
+        record: Union[
+            MetadataChangeEventClass,
+            MetadataChangeProposalWrapper,
+        ],
+    ) -> None:
+        writeables = self._get_writeables(record)
+
         if not writeables:
             return
 
@@ -187,6 +252,14 @@ class DuckDBLite(DataHubLiteLocal[DuckDBLiteConfig]):
                                 writeable.aspectName,
                             ],
                         )
+                    self._replace_search_docs(
+                        self._get_search_docs(
+                            writeable.entityUrn,
+                            writeable.aspectName,
+                            writeable_dict["aspect"]["json"],
+                            is_new=not max_row,
+                        )
+                    )
                 else:
                     # this is a dup, we still want to update the lastObserved timestamp
                     if not system_metadata:
@@ -220,6 +293,241 @@ class DuckDBLite(DataHubLiteLocal[DuckDBLiteConfig]):
 
         self.duckdb_client.commit()
 
+    @staticmethod
+    def _stage_aspect(writeable: MetadataChangeProposalWrapper) -> _StagedAspect:
+        assert writeable.aspect
+        created_on = int(time.time() * 1000.0)
+        if writeable.systemMetadata is None:
+            writeable.systemMetadata = SystemMetadataClass(
+                lastObserved=created_on, properties={}
+            )
+        elif writeable.systemMetadata.lastObserved:
+            created_on = writeable.systemMetadata.lastObserved
+        else:
+            writeable.systemMetadata.lastObserved = created_on
+
+        return (
+            codegen_to_restli_obj(writeable.aspect),
+            writeable.systemMetadata.to_obj(),
+            created_on,
+        )
+
+    def write_batch(
+        self,
+        records: Iterable[
+            Union[
+                MetadataChangeEventClass,
+                MetadataChangeProposalWrapper,
+            ]
+        ],
+    ) -> None:
+        """
+        Writes many records in a single transaction.
+
+        The current versions of all aspects in the batch are fetched with one query,
+        and the new rows are written with bulk statements. If an aspect appears more
+        than once in a batch, only its last value is written. Unlike write(), this
+        does not maintain edges for every aspect. They get rebuilt by reindex(),
+        which runs on close().
+        """
+
+        staged: Dict[Tuple[str, str], _StagedAspect] = {}
+        for record in records:
+            for writeable in self._get_writeables(record):
+                assert writeable.entityUrn and writeable.aspectName
+                staged[
+                    (writeable.entityUrn, writeable.aspectName)
+                ] = self._stage_aspect(writeable)
+        if not staged:
+            return
+
+        self.duckdb_client.begin()
+        try:
+            self._write_staged_aspects(staged)
+        except Exception:
+            self.duckdb_client.rollback()
+            raise
+        self.duckdb_client.commit()
+
+    def _write_staged_aspects(
+        self, staged: Dict[Tuple[str, str], _StagedAspect]
+    ) -> None:
+        self.duckdb_client.execute(
+            "CREATE OR REPLACE TEMP TABLE staged_aspect_keys (urn VARCHAR, aspect_name VARCHAR)"
+        )
+        self.duckdb_client.executemany(
+            "INSERT INTO staged_aspect_keys VALUES (?, ?)", list(staged.keys())
+        )
+        existing = {
+            (row[0], row[1]): row[2:]
+            for row in self.duckdb_client.execute(
+                "SELECT a.urn, a.aspect_name, a.metadata, a.system_metadata, v.max_version "
+                "FROM metadata_aspect_v2 a "
+                "JOIN ("
+                "  SELECT m.urn, m.aspect_name, max(m.version) AS max_version "
+                "  FROM metadata_aspect_v2 m JOIN staged_aspect_keys k "
+                "  ON m.urn = k.urn AND m.aspect_name = k.aspect_name "
+                "  GROUP BY m.urn, m.aspect_name"
+                ") v ON a.urn = v.urn AND a.aspect_name = v.aspect_name "
+                "WHERE a.version = 0"
+            ).fetchall()
+        }
+
+        # Rows to insert, and the new contents of existing version 0 rows.
+        inserts: List[Tuple[str, str, int, str, str, int]] = []
+        updates: List[Tuple[str, str, str, str]] = []
+        search_docs: List[Tuple[str, str, Optional[str]]] = []
+        for (urn, aspect_name), (
+            metadata,
+            system_metadata,
+            created_on,
+        ) in staged.items():
+            current = existing.get((urn, aspect_name))
+            if current is None:
+                system_metadata.setdefault("properties", {})["sysVersion"] = 1
+                metadata_json = json.dumps(metadata)
+                system_metadata_json = json.dumps(system_metadata)
+                for version in (1, 0):
+                    inserts.append(
+                        (
+                            urn,
+                            aspect_name,
+                            version,
+                            metadata_json,
+                            system_metadata_json,
+                            created_on,
+                        )
+                    )
+                search_docs.extend(
+                    self._get_search_docs(urn, aspect_name, metadata, is_new=True)
+                )
+                continue
+
+            current_metadata_json, current_system_metadata_json, max_version = current
+            current_system_metadata = json.loads(current_system_metadata_json)
+            real_version = current_system_metadata.get("properties", {}).get(
+                "sysVersion"
+            )
+            if real_version is None:
+                real_version = max_version
+
+            if metadata == json.loads(current_metadata_json):
+                # This is a dup, we still want to update the lastObserved timestamp.
+                current_system_metadata["lastObserved"] = system_metadata[
+                    "lastObserved"
+                ]
+                updates.append(
+                    (
+                        urn,
+                        aspect_name,
+                        current_metadata_json,
+                        json.dumps(current_system_metadata),
+                    )
+                )
+            else:
+                new_version = real_version + 1
+                system_metadata.setdefault("properties", {})["sysVersion"] = new_version
+                metadata_json = json.dumps(metadata)
+                system_metadata_json = json.dumps(system_metadata)
+                inserts.append(
+                    (
+                        urn,
+                        aspect_name,
+                        new_version,
+                        metadata_json,
+                        system_metadata_json,
+                        created_on,
+                    )
+                )
+                updates.append((urn, aspect_name, metadata_json, system_metadata_json))
+                search_docs.extend(
+                    self._get_search_docs(urn, aspect_name, metadata, is_new=False)
+                )
+
+        if inserts:
+            self.duckdb_client.executemany(
+                "INSERT INTO metadata_aspect_v2 VALUES (?, ?, ?, ?, ?, ?)", inserts
+            )
+        if updates:
+            self.duckdb_client.execute(
+                "CREATE OR REPLACE TEMP TABLE staged_aspect_updates "
+                "(urn VARCHAR, aspect_name VARCHAR, metadata JSON, system_metadata JSON)"
+            )
+            self.duckdb_client.executemany(
+                "INSERT INTO staged_aspect_updates VALUES (?, ?, ?, ?)", updates
+            )
+            self.duckdb_client.execute(
+                "UPDATE metadata_aspect_v2 "
+                "SET metadata = u.metadata, system_metadata = u.system_metadata "
+                "FROM staged_aspect_updates u "
+                "WHERE metadata_aspect_v2.urn = u.urn "
+                "AND metadata_aspect_v2.aspect_name = u.aspect_name "
+                "AND metadata_aspect_v2.version = 0"
+            )
+            self.duckdb_client.execute("DROP TABLE staged_aspect_updates")
+        self.duckdb_client.execute("DROP TABLE staged_aspect_keys")
+        self._replace_search_docs(search_docs)
+
+    @staticmethod
+    def _get_search_docs(
+        urn: str, aspect_name: str, metadata: dict, is_new: bool
+    ) -> List[Tuple[str, str, Optional[str]]]:
+        docs = [(urn, aspect_name, _get_search_doc_text(metadata))]
+        if is_new:
+            # The urn only needs to be indexed once, but re-indexing it is harmless.
+            docs.append((urn, _URN_SEARCH_DOC, urn))
+        return docs
+
+    def _replace_search_docs(self, docs: List[Tuple[str, str, Optional[str]]]) -> None:
+        """Replaces the search tokens of each (urn, aspect name, text) document."""
+        if not docs:
+            return
+
+        if len(docs) == 1:
+            self.duckdb_client.execute(
+                "DELETE FROM metadata_search_token_v2 WHERE urn = ? AND aspect_name = ?",
+                [docs[0][0], docs[0][1]],
+            )
+        else:
+            self.duckdb_client.execute(
+                "CREATE OR REPLACE TEMP TABLE staged_search_docs (urn VARCHAR, aspect_name VARCHAR)"
+            )
+            self.duckdb_client.executemany(
+                "INSERT INTO staged_search_docs VALUES (?, ?)",
+                [(urn, aspect_name) for urn, aspect_name, _ in docs],
+            )
+            self.duckdb_client.execute(
+                "DELETE FROM metadata_search_token_v2 USING staged_search_docs d "
+                "WHERE metadata_search_token_v2.urn = d.urn "
+                "AND metadata_search_token_v2.aspect_name = d.aspect_name"
+            )
+            self.duckdb_client.execute("DROP TABLE staged_search_docs")
+
+        token_rows = [
+            (token, urn, aspect_name)
+            for urn, aspect_name, text in docs
+            if text
+            for token in _tokenize(text)
+        ]
+        if token_rows:
+            self.duckdb_client.executemany(
+                "INSERT INTO metadata_search_token_v2 VALUES (?, ?, ?)", token_rows
+            )
+
+    def _rebuild_search_index(self) -> None:
+        self.duckdb_client.begin()
+        self.duckdb_client.execute("DELETE FROM metadata_search_token_v2")
+        docs: List[Tuple[str, str, Optional[str]]] = []
+        urns: Set[str] = set()
+        for urn, aspect_name, metadata in self.duckdb_client.execute(
+            "SELECT urn, aspect_name, metadata FROM metadata_aspect_v2 WHERE version = 0"
+        ).fetchall():
+            docs.append((urn, aspect_name, _get_search_doc_text(json.loads(metadata))))
+            urns.add(urn)
+        docs.extend((urn, _URN_SEARCH_DOC, urn) for urn in urns)
+        self._replace_search_docs(docs)
+        self.duckdb_client.commit()
+
     def list_ids(self) -> Iterable[str]:
         self.duckdb_client.execute("SELECT distinct(urn) from metadata_aspect_v2")
         for row in self.duckdb_client.fetchall():
@@ -274,11 +582,7 @@ class DuckDBLite(DataHubLiteLocal[DuckDBLiteConfig]):
         snippet: bool = True,
     ) -> Iterable[Searchable]:
         if flavor == SearchFlavor.FREE_TEXT:
-            base_query = f"SELECT distinct(urn), 'urn', NULL from metadata_aspect_v2 where urn ILIKE '%{query}%' UNION SELECT urn, aspect_name, metadata from metadata_aspect_v2 where metadata->>'$.name' ILIKE '%{query}%'"
-            for r in self.duckdb_client.execute(base_query).fetchall():
-                yield Searchable(
-                    id=r[0], aspect=r[1], snippet=r[2] if snippet else None
-                )
+            yield from self._free_text_search(query, snippet)
         elif flavor == SearchFlavor.EXACT:
             base_query = f"SELECT urn, aspect_name, metadata from metadata_aspect_v2 where version = 0 AND ({query})"
             for r in self.duckdb_client.execute(base_query).fetchall():
@@ -288,6 +592,89 @@ class DuckDBLite(DataHubLiteLocal[DuckDBLiteConfig]):
         else:
             raise Exception(f"Unhandled search flavor {flavor}")
 
+    def _free_text_search(self, query: str, snippet: bool) -> Iterable[Searchable]:
+        """
+        Searches the token index. Every query term must match a token exactly,
+        except for the last one, which can match by prefix to support
+        autocomplete. Only documents that match every term are returned.
+        Documents that match more terms exactly rank higher, and aspect names
+        rank above urns.
+        """
+
+        if not self._has_search_index:
+            yield from self._free_text_scan(query, snippet)
+            return
+
+        terms = _tokenize(query)
+        if not terms:
+            return
+
+        # One row per document and matched term, with whether the match was exact.
+        term_matches = []
+        params: List[Any] = []
+        for i, term in enumerate(terms):
+            if i == len(terms) - 1:
+                condition = "token >= ? AND token < ?"
+                params.extend([term, term, term + "\uffff"])
+            else:
+                condition = "token = ?"
+                params.extend([term, term])
+            term_matches.append(
+                "SELECT urn, aspect_name, MAX(CASE WHEN token = ? THEN 1 ELSE 0 END) AS exact "
+                f"FROM metadata_search_token_v2 WHERE {condition} GROUP BY urn, aspect_name"
+            )
+        matched_docs = (
+            "SELECT urn, aspect_name, SUM(exact) AS exact_matches "
+            f"FROM ({' UNION ALL '.join(term_matches)}) "
+            "GROUP BY urn, aspect_name HAVING COUNT(*) = ?"
+        )
+        params.append(len(terms))
+
+        if snippet:
+            snippet_column = "a.metadata"
+            snippet_join = (
+                "LEFT JOIN metadata_aspect_v2 a "
+                "ON a.urn = d.urn AND a.aspect_name = d.aspect_name AND a.version = 0"
+            )
+        else:
+            snippet_column = "NULL"
+            snippet_join = ""
+        rows = self.duckdb_client.execute(
+            f"SELECT d.urn, d.aspect_name, {snippet_column} "
+            f"FROM ({matched_docs}) d {snippet_join} "
+            "ORDER BY d.exact_matches DESC, d.aspect_name = ?, length(d.urn), "
+            "d.urn, d.aspect_name LIMIT ?",
+            params + [_URN_SEARCH_DOC, _MAX_SEARCH_RESULTS],
+        ).fetchall()
+        for urn, aspect_name, metadata in rows:
+            yield Searchable(id=urn, aspect=aspect_name, snippet=metadata)
+
+    def _free_text_scan(self, query: str, snippet: bool) -> Iterable[Searchable]:
+        """
+        Searches urns and aspects' names for the query as a substring, without
+        the token index. Used for databases that were last opened writable before the
+        index existed.
+        """
+
+        logger.info(
+            f"{self.config.file} has no search index, so searching it scans every aspect. "
+            "Open it writable once to build the index."
+        )
+        pattern = "%{}%".format(
+            query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        )
+        rows = self.duckdb_client.execute(
+            "SELECT DISTINCT urn, ?, NULL FROM metadata_aspect_v2 "
+            "WHERE urn ILIKE ? ESCAPE '\\' "
+            "UNION SELECT urn, aspect_name, metadata FROM metadata_aspect_v2 "
+            "WHERE version = 0 AND (metadata->>'$.name') ILIKE ? ESCAPE '\\'",
+            [_URN_SEARCH_DOC, pattern, pattern],
+        ).fetchall()
+        for urn, aspect_name, metadata in rows:
+            yield Searchable(
+                id=urn, aspect=aspect_name, snippet=metadata if snippet else None
+            )
+
     def remove_edge(self, src: str, relnship: str) -> None:
         try:
             self.duckdb_client.execute(
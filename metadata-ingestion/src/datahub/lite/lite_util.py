@@ -43,6 +43,23 @@ class DataHubLiteWrapper(DataHubLiteLocal):
             record_envelope=record_envelope, write_callback=NoopWriteCallback()
         )
 
+    def write_batch(
+        self,
+        records: Iterable[
+            Union[
+                MetadataChangeEventClass,
+                MetadataChangeProposalWrapper,
+            ]
+        ],
+    ) -> None:
+        records = list(records)
+        self.lite.write_batch(records)
+        for record in records:
+            self.forward_to.write_record_async(
+                record_envelope=RecordEnvelope(record=record, metadata={}),
+                write_callback=NoopWriteCallback(),
+            )
+
     def close(self) -> None:
         self.lite.close()
         self.forward_to.close()
@@ -0,0 +1,96 @@
+import logging
+import os
+import pathlib
+import sqlite3
+from typing import Optional
+
+from datahub.ingestion.api.closeable import Closeable
+
+logger = logging.getLogger(__name__)
+
+
+def _is_corruption_error(e: sqlite3.Error) -> bool:
+    message = str(e)
+    return isinstance(e, sqlite3.DatabaseError) and (
+        "file is not a database" in message or "malformed" in message
+    )
+
+
+class PersistentCacheTable(Closeable):
+    """
+    A key-value table in a SQLite file that persists across runs.
+
+    Unlike ConnectionWrapper, which is meant for throwaway files, the file uses WAL
+    journaling with normal synchronization, so a killed run can't corrupt it. The
+    file is only opened on first use. The cache is never required for correctness,
+    so any SQLite error disables it for the rest of the run instead of failing the
+    caller. A corrupt file is also deleted, so that the next run starts afresh.
+    """
+
+    def __init__(self, filename: str, table_name: str) -> None:
+        self.filename = pathlib.Path(filename)
+        self.table_name = table_name
+        self._conn: Optional[sqlite3.Connection] = None
+        self._disabled = False
+
+    def _get_connection(self) -> Optional[sqlite3.Connection]:
+        if self._conn is None and not self._disabled:
+            conn = sqlite3.connect(self.filename, isolation_level=None)
+            self._conn = conn
+            conn.execute('PRAGMA journal_mode = "WAL"')
+            conn.execute('PRAGMA synchronous = "NORMAL"')
+            conn.execute(
+                f"""CREATE TABLE IF NOT EXISTS {self.table_name} (
+                    key TEXT PRIMARY KEY,
+                    value TEXT
+                )"""
+            )
+        return self._conn
+
+    def _discard(self, e: sqlite3.Error) -> None:
+        logger.warning(
+            f"Disabling cache file {self.filename} for the rest of the run: {e}"
+        )
+        self._disabled = True
+        self.close()
+        # Other errors, e.g. a locked database or misuse of the connection, leave
+        # the file intact.
+        if _is_corruption_error(e):
+            for suffix in ["", "-wal", "-shm"]:
+                try:
+                    os.remove(f"{self.filename}{suffix}")
+                except OSError:
+                    pass
+
+    def get(self, key: str) -> Optional[str]:
+        try:
+            conn = self._get_connection()
+            if conn is None:
+                return None
+            row = conn.execute(
+                f"SELECT value FROM {self.table_name} WHERE key = ?", (key,)
+            ).fetchone()
+        except sqlite3.Error as e:
+            self._discard(e)
+            return None
+        return row[0] if row is not None else None
+
+    def set(self, key: str, value: str) -> None:
+        try:
+            conn = self._get_connection()
+            if conn is None:
+                return
+            conn.execute(
+                f"INSERT OR REPLACE INTO {self.table_name} (key, value) VALUES (?, ?)",
+                (key, value),
+            )
+        except sqlite3.Error as e:
+            self._discard(e)
+
+    def close(self) -> None:
+        if self._conn is not None:
+            try:
+                self._conn.close()
+            except sqlite3.Error:
+                pass
+            self._conn = None
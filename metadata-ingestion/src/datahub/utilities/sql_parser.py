@@ -3,11 +3,11 @@ import logging
 import multiprocessing
 import re
 import traceback
-from multiprocessing import Process, Queue
-from typing import Any, List, Optional, Tuple
+from typing import Any, List, Optional, Sequence, Tuple, Union
 
 from datahub.utilities.sql_lineage_parser_impl import SqlLineageSQLParserImpl
 from datahub.utilities.sql_parser_base import SQLParser
+from datahub.utilities.sql_parser_pool import get_shared_sql_parser_pool
 
 with contextlib.suppress(ImportError):
     from sql_metadata import Parser as MetadataSQLParser
@@ -104,9 +104,16 @@ class SqlLineageSQLParser(SQLParser):
         sql_query: str,
         use_external_process: bool = True,
         use_raw_names: bool = False,
+        parsed_tables_columns: Optional[Tuple[List[str], List[str]]] = None,
     ) -> None:
+        """
+        If parsed_tables_columns is given, the query has already been parsed, e.g. by
+        parse_batch, and its tables and columns are used as they are.
+        """
         super().__init__(sql_query, use_external_process)
-        if use_external_process:
+        if parsed_tables_columns is not None:
+            self.tables, self.columns = parsed_tables_columns
+        elif use_external_process:
             self.tables, self.columns = self._get_tables_columns_process_wrapped(
                 sql_query, use_raw_names
             )
@@ -121,24 +128,58 @@ class SqlLineageSQLParser(SQLParser):
                     some_exception,
                 ) = return_tuple
 
+    @classmethod
+    def parse_batch(
+        cls,
+        sql_queries: Sequence[str],
+        use_external_process: bool = True,
+        use_raw_names: bool = False,
+    ) -> List[Union["SqlLineageSQLParser", Exception]]:
+        results: List[Union[SqlLineageSQLParser, Exception]] = []
+        if not use_external_process:
+            for sql_query in sql_queries:
+                try:
+                    results.append(
+                        cls(
+                            sql_query,
+                            use_external_process=False,
+                            use_raw_names=use_raw_names,
+                        )
+                    )
+                except Exception as e:
+                    results.append(e)
+            return results
+
+        for sql_query, result in zip(
+            sql_queries,
+            get_shared_sql_parser_pool().get_tables_columns_batch(
+                sql_queries, use_raw_names
+            ),
+        ):
+            if isinstance(result, Exception):
+                results.append(result)
+            else:
+                results.append(
+                    cls(
+                        sql_query,
+                        use_external_process=use_external_process,
+                        use_raw_names=use_raw_names,
+                        parsed_tables_columns=result,
+                    )
+                )
+        return results
+
     @staticmethod
     def _get_tables_columns_process_wrapped(
         sql_query: str, use_raw_names: bool = False
     ) -> Tuple[List[str], List[str]]:
-        # Invoke sql_lineage_parser_impl_func_wrapper in a separate process to avoid
+        # Run sql_lineage_parser_impl_func_wrapper in a pool of worker processes to avoid
         # memory leaks from sqllineage module used by SqlLineageSQLParserImpl. This will help
         # shield our sources like lookml & redash, that need to parse a large number of SQL statements,
         # from causing significant memory leaks in the datahub cli during ingestion.
-        queue: multiprocessing.Queue = Queue()
-        process: multiprocessing.Process = Process(
-            target=sql_lineage_parser_impl_func_wrapper,
-            args=(queue, sql_query, use_raw_names),
-        )
-        process.start()
-        tables, columns, exception_details = queue.get(block=True)
-        if exception_details is not None:
-            raise exception_details[0](f"Sub-process exception: {exception_details[1]}")
-        return tables, columns
+        # The workers are long-lived and get recycled periodically, so we don't pay
+        # the process startup cost for every query.
+        return get_shared_sql_parser_pool().get_tables_columns(sql_query, use_raw_names)
 
     def get_tables(self) -> List[str]:
         return self.tables
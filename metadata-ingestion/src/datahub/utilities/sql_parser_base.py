@@ -1,5 +1,5 @@
 from abc import ABCMeta, abstractmethod
-from typing import List
+from typing import List, Sequence, Type, TypeVar, Union
 
 
 class SqlParserException(Exception):
@@ -8,10 +8,35 @@ class SqlParserException(Exception):
     pass
 
 
+_SQLParserT = TypeVar("_SQLParserT", bound="SQLParser")
+
+
 class SQLParser(metaclass=ABCMeta):
     def __init__(self, sql_query: str, use_external_process: bool = True) -> None:
         self._sql_query = sql_query
 
+    @classmethod
+    def parse_batch(
+        cls: Type[_SQLParserT],
+        sql_queries: Sequence[str],
+        use_external_process: bool = True,
+    ) -> List[Union[_SQLParserT, Exception]]:
+        """
+        Parses many queries at once. Results are returned in the same order as the
+        queries, with the exception in place of the parser for queries that failed.
+
+        Subclasses can override this to parse the queries concurrently.
+        """
+        results: List[Union[_SQLParserT, Exception]] = []
+        for sql_query in sql_queries:
+            try:
+                results.append(
+                    cls(sql_query, use_external_process=use_external_process)
+                )
+            except Exception as e:
+                results.append(e)
+        return results
+
     @abstractmethod
     def get_tables(self) -> List[str]:
         pass
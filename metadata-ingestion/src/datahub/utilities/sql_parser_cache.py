@@ -0,0 +1,152 @@
+import collections
+import hashlib
+import json
+import logging
+import re
+from dataclasses import dataclass
+from typing import Any, List, Optional, OrderedDict, Tuple, Type
+
+from datahub.ingestion.api.closeable import Closeable
+from datahub.ingestion.api.report import Report
+from datahub.utilities.persistent_cache import PersistentCacheTable
+from datahub.utilities.sql_parser_base import SQLParser, SqlParserException
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_MEMORY_CACHE_MAX_SIZE = 10000
+# Bump the version whenever the cache key changes, so that results cached by older
+# versions are ignored.
+_CACHE_TABLE_NAME = "sql_parse_results_v2"
+
+# Stored results are tables, columns and an error message for failed parses.
+_CachedResult = Tuple[List[str], List[str], Optional[str]]
+
+# Matches quoted strings and identifiers, comments, and runs of whitespace. Only the
+# whitespace is normalized, so that queries which differ inside a string literal
+# don't share a cache key.
+_NORMALIZE_RE = re.compile(
+    r"""('(?:[^'\\]|\\.|'')*'|"(?:[^"\\]|\\.|"")*"|`[^`]*`|--[^\n]*\n?|/\*.*?\*/)|\s+""",
+    re.DOTALL,
+)
+
+
+@dataclass
+class SqlParsingCacheReport(Report):
+    memory_hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+
+
+def _normalize_query(sql_query: str) -> str:
+    return _NORMALIZE_RE.sub(lambda m: m.group(1) or " ", sql_query).strip()
+
+
+class SqlParsingResultCache(Closeable):
+    """
+    Caches the tables and columns extracted from SQL queries.
+
+    Results are keyed on a hash of the parser class, its options and the
+    query text, with whitespace outside of quotes and comments normalized. Lookups go through an in-memory LRU first and
+    then, if a cache file is configured, through a SQLite table that persists
+    across runs. Parse failures are cached in memory, so a bad query is only
+    parsed once per run.
+    """
+
+    def __init__(
+        self,
+        report: SqlParsingCacheReport,
+        cache_file: Optional[str] = None,
+        memory_cache_max_size: int = _DEFAULT_MEMORY_CACHE_MAX_SIZE,
+    ) -> None:
+        self.report = report
+        self.memory_cache_max_size = memory_cache_max_size
+        self._memory_cache: OrderedDict[str, _CachedResult] = collections.OrderedDict()
+
+        self._disk_cache: Optional[PersistentCacheTable] = None
+        if cache_file:
+            self._disk_cache = PersistentCacheTable(cache_file, _CACHE_TABLE_NAME)
+
+    @staticmethod
+    def _make_key(
+        parser_cls: Type[SQLParser], sql_query: str, parser_kwargs: dict
+    ) -> str:
+        key_parts = [
+            f"{parser_cls.__module__}.{parser_cls.__qualname__}",
+            json.dumps(parser_kwargs, sort_keys=True),
+            _normalize_query(sql_query),
+        ]
+        return hashlib.sha256("\n".join(key_parts).encode("utf-8")).hexdigest()
+
+    def _lookup(self, key: str) -> Optional[_CachedResult]:
+        if key in self._memory_cache:
+            self._memory_cache.move_to_end(key)
+            self.report.memory_hits += 1
+            return self._memory_cache[key]
+
+        if self._disk_cache is not None:
+            value = self._disk_cache.get(key)
+            if value is not None:
+                tables, columns, error = json.loads(value)
+                result: _CachedResult = (tables, columns, error)
+                self._add_to_memory_cache(key, result)
+                self.report.disk_hits += 1
+                return result
+
+        return None
+
+    def _add_to_memory_cache(self, key: str, result: _CachedResult) -> None:
+        self._memory_cache[key] = result
+        if len(self._memory_cache) > self.memory_cache_max_size:
+            self._memory_cache.popitem(last=False)
+
+    def _store(self, key: str, result: _CachedResult) -> None:
+        self._add_to_memory_cache(key, result)
+        # Failures might be transient (e.g. timeouts), so they aren't persisted.
+        if self._disk_cache is not None and result[2] is None:
+            self._disk_cache.set(key, json.dumps(result))
+
+    def get_tables_columns(
+        self, parser_cls: Type[SQLParser], sql_query: str, **parser_kwargs: Any
+    ) -> Tuple[List[str], List[str]]:
+        """
+        Returns the tables and columns of the query, parsing it with parser_cls
+        only if the result is not already cached.
+
+        Raises SqlParserException if the query could not be parsed.
+        """
+
+        key = self._make_key(parser_cls, sql_query, parser_kwargs)
+        result = self._lookup(key)
+        if result is None:
+            self.report.misses += 1
+            result = self._parse(parser_cls, sql_query, parser_kwargs)
+            self._store(key, result)
+
+        tables, columns, error = result
+        if error is not None:
+            raise SqlParserException(error)
+        # Copy the lists so that callers can't modify the cached result.
+        return list(tables), list(columns)
+
+    @staticmethod
+    def _parse(
+        parser_cls: Type[SQLParser], sql_query: str, parser_kwargs: dict
+    ) -> _CachedResult:
+        try:
+            parser = parser_cls(sql_query, **parser_kwargs)
+            tables = parser.get_tables()
+        except Exception as e:
+            return [], [], f"{type(e).__name__}: {e}"
+
+        try:
+            columns = parser.get_columns()
+        except Exception as e:
+            logger.debug(f"Failed to extract columns from {sql_query}: {e}")
+            columns = []
+
+        return tables, columns, None
+
+    def close(self) -> None:
+        self._memory_cache.clear()
+        if self._disk_cache is not None:
+            self._disk_cache.close()
@@ -0,0 +1,226 @@
+import atexit
+import logging
+import multiprocessing
+import os
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing.connection import Connection
+from typing import Any, List, Optional, Sequence, Tuple, Union
+
+import psutil
+
+from datahub.ingestion.api.closeable import Closeable
+from datahub.utilities.sql_parser_base import SqlParserException
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_NUM_WORKERS = int(
+    os.getenv("DATAHUB_SQL_PARSER_POOL_SIZE", str(min(4, os.cpu_count() or 1)))
+)
+_DEFAULT_MAX_QUERIES_PER_WORKER = int(
+    os.getenv("DATAHUB_SQL_PARSER_MAX_QUERIES_PER_WORKER", "1000")
+)
+_DEFAULT_MAX_WORKER_RSS_MB = int(
+    os.getenv("DATAHUB_SQL_PARSER_MAX_WORKER_RSS_MB", "1024")
+)
+_DEFAULT_QUERY_TIMEOUT_SEC = float(
+    os.getenv("DATAHUB_SQL_PARSER_QUERY_TIMEOUT_SEC", "120")
+)
+
+ParseResult = Tuple[List[str], List[str]]
+
+
+def _parser_worker_main(conn: Connection, max_rss_bytes: int) -> None:
+    # Imported here, since sql_parser itself depends on this module.
+    from datahub.utilities.sql_parser import sql_lineage_parser_impl_func_wrapper
+
+    process = psutil.Process()
+    while True:
+        try:
+            request = conn.recv()
+        except EOFError:
+            break
+        if request is None:
+            break
+
+        sql_query, use_raw_names = request
+        result = sql_lineage_parser_impl_func_wrapper(None, sql_query, use_raw_names)
+        assert result is not None
+        over_memory_limit = process.memory_info().rss > max_rss_bytes
+
+        try:
+            conn.send((result, over_memory_limit))
+        except Exception as e:
+            # The parser exception might not be picklable.
+            tables, columns, exception_details = result
+            assert exception_details is not None
+            conn.send(
+                (
+                    (
+                        tables,
+                        columns,
+                        (SqlParserException(str(e)), exception_details[1]),
+                    ),
+                    over_memory_limit,
+                )
+            )
+
+        if over_memory_limit:
+            break
+
+
+class _ParserWorker:
+    def __init__(self, max_rss_bytes: int) -> None:
+        self._conn, child_conn = multiprocessing.Pipe()
+        self._process = multiprocessing.Process(
+            target=_parser_worker_main, args=(child_conn, max_rss_bytes), daemon=True
+        )
+        self._process.start()
+        child_conn.close()
+
+        self.queries_handled = 0
+        self.retired = False
+
+    def parse(
+        self, sql_query: str, use_raw_names: bool, timeout_sec: float
+    ) -> Tuple[List[str], List[str], Any]:
+        self.queries_handled += 1
+        self._conn.send((sql_query, use_raw_names))
+        if not self._conn.poll(timeout_sec):
+            self.terminate()
+            raise SqlParserException(
+                f"SQL parsing timed out after {timeout_sec} seconds"
+            )
+
+        try:
+            result, over_memory_limit = self._conn.recv()
+        except EOFError as e:
+            self.terminate()
+            raise SqlParserException("SQL parser worker exited unexpectedly") from e
+
+        if over_memory_limit:
+            logger.debug("Retiring SQL parser worker after exceeding its memory limit")
+            self.retired = True
+        return result
+
+    def close(self) -> None:
+        if self._process.is_alive():
+            try:
+                self._conn.send(None)
+            except OSError:
+                pass
+            self._process.join(timeout=5)
+        self.terminate()
+
+    def terminate(self) -> None:
+        self.retired = True
+        if self._process.is_alive():
+            self._process.terminate()
+            self._process.join()
+        self._conn.close()
+
+
+class SqlParserWorkerPool(Closeable):
+    """
+    A pool of long-lived processes that run the sqllineage-based parser.
+
+    The sqllineage module leaks memory, so parsing happens outside of the main process.
+    Rather than paying the process startup cost for every query, workers are reused
+    and get restarted after a fixed number of queries or once their RSS exceeds a limit.
+    """
+
+    def __init__(
+        self,
+        num_workers: int = _DEFAULT_NUM_WORKERS,
+        max_queries_per_worker: int = _DEFAULT_MAX_QUERIES_PER_WORKER,
+        max_worker_rss_mb: int = _DEFAULT_MAX_WORKER_RSS_MB,
+        query_timeout_sec: float = _DEFAULT_QUERY_TIMEOUT_SEC,
+    ) -> None:
+        self.num_workers = max(1, num_workers)
+        self.max_queries_per_worker = max_queries_per_worker
+        self.max_worker_rss_bytes = max_worker_rss_mb * 1024 * 1024
+        self.query_timeout_sec = query_timeout_sec
+
+        self.queries_parsed = 0
+        self.workers_started = 0
+
+        # Workers are started lazily, so a placeholder of None stands in for each slot.
+        self._workers: "queue.Queue[Optional[_ParserWorker]]" = queue.Queue()
+        for _ in range(self.num_workers):
+            self._workers.put(None)
+        self._closed = False
+
+    def get_tables_columns(
+        self, sql_query: str, use_raw_names: bool = False
+    ) -> ParseResult:
+        if self._closed:
+            raise SqlParserException("SQL parser pool has already been closed")
+
+        worker = self._workers.get()
+        try:
+            if worker is None or worker.retired:
+                worker = _ParserWorker(self.max_worker_rss_bytes)
+                self.workers_started += 1
+
+            tables, columns, exception_details = worker.parse(
+                sql_query, use_raw_names, self.query_timeout_sec
+            )
+            self.queries_parsed += 1
+        finally:
+            if worker is not None and (
+                self._closed
+                or worker.retired
+                or worker.queries_handled >= self.max_queries_per_worker
+            ):
+                worker.close()
+                worker = None
+            self._workers.put(worker)
+
+        if exception_details is not None:
+            raise SqlParserException(
+                f"Sub-process exception: {exception_details[1]}"
+            ) from exception_details[0]
+        return tables, columns
+
+    def get_tables_columns_batch(
+        self, sql_queries: Sequence[str], use_raw_names: bool = False
+    ) -> List[Union[ParseResult, Exception]]:
+        """
+        Parses many queries concurrently across the pool's workers.
+
+        Results are returned in the same order as the queries. Queries that fail to
+        parse produce the exception instead of a result.
+        """
+
+        def _parse_one(sql_query: str) -> Union[ParseResult, Exception]:
+            try:
+                return self.get_tables_columns(sql_query, use_raw_names)
+            except Exception as e:
+                return e
+
+        with ThreadPoolExecutor(max_workers=self.num_workers) as executor:
+            return list(executor.map(_parse_one, sql_queries))
+
+    def close(self) -> None:
+        self._closed = True
+        while True:
+            try:
+                worker = self._workers.get_nowait()
+            except queue.Empty:
+                break
+            if worker is not None:
+                worker.close()
+
+
+_shared_pool: Optional[SqlParserWorkerPool] = None
+_shared_pool_lock = threading.Lock()
+
+
+def get_shared_sql_parser_pool() -> SqlParserWorkerPool:
+    global _shared_pool
+    with _shared_pool_lock:
+        if _shared_pool is None:
+            _shared_pool = SqlParserWorkerPool()
+            atexit.register(_shared_pool.close)
+        return _shared_pool
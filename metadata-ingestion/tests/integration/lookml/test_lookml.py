@@ -17,6 +17,7 @@ from datahub.ingestion.source.looker.lookml_source import (
     LookerRefinementResolver,
     LookMLSource,
     LookMLSourceConfig,
+    LookMLSourceReport,
 )
 from datahub.ingestion.source.state.checkpoint import Checkpoint
 from datahub.ingestion.source.state.entity_removal_state import GenericCheckpointState
@@ -332,6 +333,74 @@ def test_lookml_ingest_offline(pytestconfig, tmp_path, mock_time):
     )
 
 
+@freeze_time(FROZEN_TIME)
+def test_lookml_ingest_parse_cache(pytestconfig, tmp_path, mock_time):
+    test_resources_dir = pytestconfig.rootpath / "tests/integration/lookml"
+    mce_out = "lookml_mces_offline.json"
+
+    def run_pipeline() -> LookMLSourceReport:
+        pipeline = Pipeline.create(
+            {
+                "run_id": "lookml-test",
+                "source": {
+                    "type": "lookml",
+                    "config": {
+                        "base_folder": str(test_resources_dir / "lkml_samples"),
+                        "connection_to_platform_map": {
+                            "my_connection": {
+                                "platform": "snowflake",
+                                "default_db": "default_db",
+                                "default_schema": "default_schema",
+                            }
+                        },
+                        "parse_table_names_from_sql": True,
+                        "project_name": "lkml_samples",
+                        "model_pattern": {"deny": ["data2"]},
+                        "emit_reachable_views_only": False,
+                        "process_refinements": False,
+                        "lookml_parse_cache_file": str(tmp_path / "lookml_cache.db"),
+                        "max_lookml_parse_workers": 2,
+                    },
+                },
+                "sink": {
+                    "type": "file",
+                    "config": {
+                        "filename": f"{tmp_path}/{mce_out}",
+                    },
+                },
+            }
+        )
+        pipeline.run()
+        pipeline.raise_from_status(raise_warnings=True)
+        mce_helpers.check_golden_file(
+            pytestconfig,
+            output_path=tmp_path / mce_out,
+            golden_path=test_resources_dir / mce_out,
+        )
+        return cast(LookMLSourceReport, pipeline.source.get_report())
+
+    first_report = run_pipeline()
+    assert first_report.lookml_file_cache.files_parsed > 0
+    assert first_report.lookml_file_cache.disk_hits == 0
+
+    # Nothing changed, so the second run should not parse any files.
+    second_report = run_pipeline()
+    assert second_report.lookml_file_cache.files_parsed == 0
+    assert (
+        second_report.lookml_file_cache.disk_hits
+        == first_report.lookml_file_cache.files_parsed
+    )
+
+    # A corrupt cache file is discarded, and the files are parsed again.
+    (tmp_path / "lookml_cache.db").write_bytes(b"not a sqlite database" * 100)
+    third_report = run_pipeline()
+    assert third_report.lookml_file_cache.disk_hits == 0
+    assert (
+        third_report.lookml_file_cache.files_parsed
+        == first_report.lookml_file_cache.files_parsed
+    )
+
+
 @freeze_time(FROZEN_TIME)
 def test_lookml_ingest_offline_with_model_deny(pytestconfig, tmp_path, mock_time):
     """New form of config with offline specification of connection defaults"""
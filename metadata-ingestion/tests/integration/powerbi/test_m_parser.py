@@ -619,3 +619,34 @@ def test_redshift_native_query():
         data_platform_tables[0].data_platform_pair.powerbi_data_platform_name
         == SupportedDataPlatform.AMAZON_REDSHIFT.value.powerbi_data_platform_name
     )
+
+
+@pytest.mark.integration
+def test_upstreams_cache():
+    tables: List[powerbi_data_classes.Table] = [
+        powerbi_data_classes.Table(
+            expression=M_QUERIES[22],
+            name="category",
+            full_name=f"dev{i}.public.category",
+        )
+        for i in range(3)
+    ]
+    reporter = PowerBiDashboardSourceReport()
+    cache = parser.MQueryUpstreamsCache(reporter)
+
+    for table in tables:
+        data_platform_tables: List[DataPlatformTable] = cache.get_upstream_tables(
+            table, native_query_enabled=False
+        )
+        assert data_platform_tables == []
+
+    # The expression is only resolved once, and the warning is reported for every table.
+    assert reporter.m_query_expressions_resolved == 1
+    assert reporter.m_query_cache_hits == 2
+    assert set(reporter.warnings.keys()) == {table.full_name for table in tables}
+
+    data_platform_tables = cache.get_upstream_tables(
+        tables[0], native_query_enabled=True
+    )
+    assert len(data_platform_tables) == 1
+    assert reporter.m_query_expressions_resolved == 2
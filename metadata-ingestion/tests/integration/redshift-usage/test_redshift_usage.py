@@ -11,6 +11,7 @@ from datahub.ingestion.sink.file import write_metadata_file
 from datahub.ingestion.source.redshift.config import RedshiftConfig
 from datahub.ingestion.source.redshift.redshift_schema import (
     RedshiftTable,
+    RedshiftTableIndex,
     RedshiftView,
 )
 from datahub.ingestion.source.redshift.report import RedshiftReport
@@ -127,7 +128,9 @@ def test_redshift_usage_source(mock_cursor, mock_connection, pytestconfig, tmp_p
             ]
         },
     }
-    mwus = usage_extractor.generate_usage(all_tables=all_tables)
+    mwus = usage_extractor.generate_usage(
+        table_index=RedshiftTableIndex.from_tables(all_tables)
+    )
     metadata: List[
         Union[
             MetadataChangeEvent,
@@ -215,7 +218,9 @@ def test_redshift_usage_filtering(mock_cursor, mock_connection, pytestconfig, tm
             ]
         },
     }
-    mwus = usage_extractor.generate_usage(all_tables=all_tables)
+    mwus = usage_extractor.generate_usage(
+        table_index=RedshiftTableIndex.from_tables(all_tables)
+    )
     metadata: List[
         Union[
             MetadataChangeEvent,
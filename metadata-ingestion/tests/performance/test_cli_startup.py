@@ -0,0 +1,65 @@
+import logging
+import os
+import subprocess
+import sys
+from typing import List
+
+from datahub.utilities.perf_timer import PerfTimer
+
+# Commands whose cold-start latency we want to keep low.
+COMMANDS: List[List[str]] = [
+    ["version"],
+    ["--help"],
+    ["ingest", "--help"],
+    ["delete", "--help"],
+]
+
+
+def time_command(args: List[str], num_iterations: int) -> float:
+    env = {**os.environ, "DATAHUB_TELEMETRY_ENABLED": "false"}
+    with PerfTimer() as timer:
+        for _ in range(num_iterations):
+            subprocess.run(
+                [sys.executable, "-m", "datahub", *args],
+                env=env,
+                check=True,
+                stdout=subprocess.DEVNULL,
+            )
+        return timer.elapsed_seconds() / num_iterations
+
+
+def slowest_imports(args: List[str], num_modules: int) -> List[str]:
+    # -X importtime writes "import time: self | cumulative | module" lines to stderr.
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "datahub", *args],
+        env={**os.environ, "DATAHUB_TELEMETRY_ENABLED": "false"},
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    timings = []
+    for line in result.stderr.splitlines():
+        parts = line.split("|")
+        if len(parts) == 3 and parts[1].strip().isdigit():
+            timings.append((int(parts[1]), parts[2].rstrip()))
+    timings.sort(reverse=True)
+    return [f"{us / 1e6:.2f}s {module}" for us, module in timings[:num_modules]]
+
+
+def run_test():
+    num_iterations = 5
+    for args in COMMANDS:
+        seconds = time_command(args, num_iterations)
+        print(f"datahub {' '.join(args)}: {seconds:.2f} seconds")
+
+    print("Slowest cumulative imports for `datahub version`:")
+    for line in slowest_imports(["version"], num_modules=10):
+        print(f"  {line}")
+
+
+if __name__ == "__main__":
+    root_logger = logging.getLogger()
+    root_logger.setLevel(logging.INFO)
+    root_logger.addHandler(logging.StreamHandler())
+    run_test()
@@ -0,0 +1,63 @@
+import json
+import logging
+
+import datahub.metadata.schema_classes as models
+from datahub.emitter.mce_builder import make_data_platform_urn, make_tag_urn
+from datahub.emitter.serialization_helper import (
+    codegen_to_restli_obj,
+    pre_json_transform,
+)
+from datahub.utilities.perf_timer import PerfTimer
+
+
+def generate_schema_metadata(num_fields: int) -> models.SchemaMetadataClass:
+    return models.SchemaMetadataClass(
+        schemaName="benchmark",
+        platform=make_data_platform_urn("hive"),
+        version=0,
+        hash="",
+        platformSchema=models.OtherSchemaClass(rawSchema=""),
+        fields=[
+            models.SchemaFieldClass(
+                fieldPath=f"struct_{i // 100}.field_{i}",
+                type=models.SchemaFieldDataTypeClass(type=models.StringTypeClass()),
+                nativeDataType="VARCHAR(50)",
+                description=f"Description of field {i}",
+                globalTags=models.GlobalTagsClass(
+                    tags=[models.TagAssociationClass(tag=make_tag_urn("pii"))]
+                ),
+            )
+            for i in range(num_fields)
+        ],
+    )
+
+
+def run_test():
+    num_fields = 5000
+    num_iterations = 20
+    aspect = generate_schema_metadata(num_fields)
+    assert json.dumps(codegen_to_restli_obj(aspect)) == json.dumps(
+        pre_json_transform(aspect.to_obj())
+    )
+    print(f"Serializing SchemaMetadata with {num_fields} fields")
+
+    with PerfTimer() as timer:
+        for _ in range(num_iterations):
+            pre_json_transform(aspect.to_obj())
+        json_transform_seconds = timer.elapsed_seconds()
+    print(f"pre_json_transform(to_obj()): {json_transform_seconds:.2f} seconds")
+
+    with PerfTimer() as timer:
+        for _ in range(num_iterations):
+            codegen_to_restli_obj(aspect)
+        codegen_seconds = timer.elapsed_seconds()
+    print(f"codegen_to_restli_obj(): {codegen_seconds:.2f} seconds")
+
+    print(f"Speedup: {json_transform_seconds / codegen_seconds:.1f}x")
+
+
+if __name__ == "__main__":
+    root_logger = logging.getLogger()
+    root_logger.setLevel(logging.INFO)
+    root_logger.addHandler(logging.StreamHandler())
+    run_test()
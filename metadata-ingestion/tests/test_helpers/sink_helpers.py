@@ -1,3 +1,4 @@
+from dataclasses import dataclass, field
 from typing import List
 
 from datahub.configuration.common import ConfigModel
@@ -5,8 +6,9 @@ from datahub.ingestion.api.common import RecordEnvelope
 from datahub.ingestion.api.sink import Sink, SinkReport, WriteCallback
 
 
+@dataclass
 class RecordingSinkReport(SinkReport):
-    received_records: List[RecordEnvelope] = []
+    received_records: List[RecordEnvelope] = field(default_factory=list)
 
     def report_record_written(self, record_envelope: RecordEnvelope) -> None:
         super().report_record_written(record_envelope)
@@ -9,6 +9,10 @@ from avro.datafile import DataFileWriter
 from avro.io import DatumWriter
 
 from datahub.ingestion.source.schema_inference import avro, csv_tsv, json, parquet
+from datahub.ingestion.source.schema_inference.object import (
+    SchemaAccumulator,
+    construct_schema,
+)
 from datahub.metadata.com.linkedin.pegasus2avro.schema import (
     BooleanTypeClass,
     NumberTypeClass,
@@ -88,6 +92,44 @@ def test_infer_schema_json():
         assert_field_types_match(fields, expected_field_types)
 
 
+def test_infer_schema_jsonl():
+    with tempfile.TemporaryFile(mode="w+b") as file:
+        file.write(
+            bytes(
+                test_table.to_json(orient="records", lines=True) + "not json\n",
+                encoding="utf-8",
+            )
+        )
+        file.seek(0)
+
+        fields = json.JsonInferrer().infer_schema(file)
+        fields.sort(key=lambda x: x.fieldPath)
+
+        assert_field_paths_match(fields, expected_field_paths)
+        assert_field_types_match(fields, expected_field_types)
+
+
+def test_schema_accumulator_merge():
+    documents = [
+        {"a": 1, "b": {"c": "x"}, "d": [{"e": 1}, {"e": 2.5}]},
+        {"a": None, "b": {"c": "y", "f": True}, "d": [{"e": 3}]},
+        {"a": 2, "b": {"c": "z"}, "d": []},
+        {"a": 3, "b": {"c": "w"}, "d": [{"e": 4}, {}]},
+    ]
+    expected_schema = construct_schema(documents, delimiter=".")
+    assert {
+        field["delimited_name"]: field["nullable"] for field in expected_schema.values()
+    } == {"a": True, "b": False, "b.c": False, "b.f": True, "d": False, "d.e": True}
+
+    first_half, second_half = SchemaAccumulator(), SchemaAccumulator()
+    first_half.add_documents(iter(documents[:2]))
+    second_half.add_documents(iter(documents[2:]))
+    first_half.merge(second_half)
+
+    assert first_half.num_documents == 4
+    assert first_half.get_schema(delimiter=".") == expected_schema
+
+
 def test_infer_schema_parquet():
     with tempfile.TemporaryFile(mode="w+b") as file:
         test_table.to_parquet(file)
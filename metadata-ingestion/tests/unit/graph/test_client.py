@@ -1,11 +1,17 @@
 from unittest.mock import Mock, patch
 
+from datahub.emitter.mcp import MetadataChangeProposalWrapper
 from datahub.ingestion.graph.client import (
     DatahubClientConfig,
     DataHubGraph,
     _graphql_entity_type,
 )
-from datahub.metadata.schema_classes import CorpUserEditableInfoClass
+from datahub.metadata.schema_classes import (
+    CorpUserEditableInfoClass,
+    GlobalTagsClass,
+    TagAssociationClass,
+)
+from datahub.utilities.urns.urn import Urn
 
 
 @patch("datahub.ingestion.graph.client.telemetry_enabled", False)
@@ -27,6 +33,139 @@ def test_get_aspect(mock_test_connection):
         assert editable is not None
 
 
+@patch("datahub.ingestion.graph.client.telemetry_enabled", False)
+@patch("datahub.emitter.rest_emitter.DataHubRestEmitter.test_connection")
+def test_prefetch_aspects(mock_test_connection):
+    mock_test_connection.return_value = {}
+    graph = DataHubGraph(DatahubClientConfig())
+    tagged_urn = "urn:li:dataset:(urn:li:dataPlatform:hive,tagged,PROD)"
+    untagged_urn = "urn:li:dataset:(urn:li:dataPlatform:hive,untagged,PROD)"
+    with patch("requests.Session.post") as mock_post:
+        mock_response = Mock()
+        mock_response.json = Mock(
+            return_value={
+                "results": {
+                    tagged_urn: {
+                        "urn": tagged_urn,
+                        "aspects": {
+                            "globalTags": {
+                                "name": "globalTags",
+                                "value": {"tags": [{"tag": "urn:li:tag:pii"}]},
+                            }
+                        },
+                    },
+                    untagged_urn: {"urn": untagged_urn, "aspects": {}},
+                }
+            }
+        )
+        mock_post.return_value = mock_response
+        graph.prefetch_aspects([tagged_urn, untagged_urn], GlobalTagsClass)
+
+        # Already cached urns are not fetched again.
+        graph.prefetch_aspects([tagged_urn], GlobalTagsClass)
+        assert mock_post.call_count == 1
+
+    with patch("requests.Session.get") as mock_get:
+        tags = graph.get_tags(tagged_urn)
+        assert tags == GlobalTagsClass(tags=[TagAssociationClass(tag="urn:li:tag:pii")])
+        assert graph.get_tags(untagged_urn) is None
+        mock_get.assert_not_called()
+
+    # Each prefetched aspect is only served once, since the caller may write it.
+    with patch("requests.Session.get") as mock_get:
+        mock_get.return_value.status_code = 404
+        assert graph.get_tags(tagged_urn) is None
+        mock_get.assert_called_once()
+
+    # Aspects that were never read are dropped along with their batch.
+    with patch("requests.Session.post") as mock_post:
+        mock_post.return_value = mock_response
+        graph.prefetch_aspects([tagged_urn], GlobalTagsClass)
+    graph.drop_prefetched_aspects([tagged_urn], GlobalTagsClass)
+    with patch("requests.Session.get") as mock_get:
+        mock_get.return_value.status_code = 404
+        assert graph.get_tags(tagged_urn) is None
+        mock_get.assert_called_once()
+
+
+@patch("datahub.ingestion.graph.client.telemetry_enabled", False)
+@patch("datahub.emitter.rest_emitter.DataHubRestEmitter._emit_generic")
+@patch("datahub.emitter.rest_emitter.DataHubRestEmitter.test_connection")
+def test_emit_evicts_prefetched_aspects(mock_test_connection, mock_emit_generic):
+    mock_test_connection.return_value = {}
+    graph = DataHubGraph(DatahubClientConfig())
+    urn = "urn:li:dataset:(urn:li:dataPlatform:hive,tagged,PROD)"
+    with patch("requests.Session.post") as mock_post:
+        mock_response = Mock()
+        mock_response.json = Mock(
+            return_value={"results": {urn: {"urn": urn, "aspects": {}}}}
+        )
+        mock_post.return_value = mock_response
+        graph.prefetch_aspects([urn], GlobalTagsClass)
+
+    new_tags = GlobalTagsClass(tags=[TagAssociationClass(tag="urn:li:tag:pii")])
+    graph.emit_mcp(MetadataChangeProposalWrapper(entityUrn=urn, aspect=new_tags))
+    mock_emit_generic.assert_called_once()
+
+    # The emitted aspect is read from the server rather than the cache.
+    with patch("requests.Session.get") as mock_get:
+        mock_response = Mock()
+        mock_response.json = Mock(
+            return_value={
+                "version": 0,
+                "aspect": {"com.linkedin.common.GlobalTags": new_tags.to_obj()},
+            }
+        )
+        mock_get.return_value = mock_response
+        assert graph.get_tags(urn) == new_tags
+        mock_get.assert_called_once()
+
+
+@patch("datahub.ingestion.graph.client.telemetry_enabled", False)
+@patch("datahub.ingestion.graph.client._BATCH_GET_CHUNK_SIZE", 1)
+@patch("datahub.emitter.rest_emitter.DataHubRestEmitter.test_connection")
+def test_get_aspects_batch(mock_test_connection):
+    mock_test_connection.return_value = {}
+    graph = DataHubGraph(DatahubClientConfig())
+    tagged_urn = "urn:li:dataset:(urn:li:dataPlatform:hive,tagged,PROD)"
+    untagged_urn = "urn:li:dataset:(urn:li:dataPlatform:hive,untagged,PROD)"
+    entity_responses = {
+        tagged_urn: {
+            "urn": tagged_urn,
+            "aspects": {
+                "globalTags": {
+                    "name": "globalTags",
+                    "value": {"tags": [{"tag": "urn:li:tag:pii"}]},
+                }
+            },
+        },
+        untagged_urn: {"urn": untagged_urn, "aspects": {}},
+    }
+
+    def batch_get(url, data, headers):
+        # Each chunk holds a single urn, so only that entity is returned.
+        mock_response = Mock()
+        mock_response.json = Mock(
+            return_value={
+                "results": {
+                    urn: response
+                    for urn, response in entity_responses.items()
+                    if Urn.url_encode(urn) in data
+                }
+            }
+        )
+        return mock_response
+
+    with patch("requests.Session.post", side_effect=batch_get) as mock_post:
+        aspects = graph.get_aspects_batch([tagged_urn, untagged_urn], GlobalTagsClass)
+        assert mock_post.call_count == 2
+
+    assert aspects == {
+        tagged_urn: GlobalTagsClass(tags=[TagAssociationClass(tag="urn:li:tag:pii")]),
+        untagged_urn: None,
+    }
+
+
 def test_graphql_entity_types():
     # FIXME: This is a subset of all the types, but it's enough to get us ok coverage.
 
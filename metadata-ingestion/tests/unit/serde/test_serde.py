@@ -12,9 +12,18 @@ from freezegun import freeze_time
 import datahub.metadata.schema_classes as models
 from datahub.cli.json_file import check_mce_file
 from datahub.emitter import mce_builder
-from datahub.emitter.serialization_helper import post_json_transform, pre_json_transform
+from datahub.emitter.mcp import MetadataChangeProposalWrapper
+from datahub.emitter.serialization_helper import (
+    codegen_to_restli_obj,
+    post_json_transform,
+    pre_json_transform,
+)
 from datahub.ingestion.run.pipeline import Pipeline
-from datahub.ingestion.source.file import FileSourceConfig, GenericFileSource
+from datahub.ingestion.source.file import (
+    FileSourceConfig,
+    GenericFileSource,
+    read_metadata_file,
+)
 from datahub.metadata.schema_classes import MetadataChangeEventClass
 from datahub.metadata.schemas import getMetadataChangeEventSchema
 from tests.test_helpers import mce_helpers
@@ -351,6 +360,7 @@ def test_write_optional_empty_dict() -> None:
 def test_json_transforms(model, ref_server_obj):
     server_obj = pre_json_transform(model.to_obj())
     assert server_obj == ref_server_obj
+    assert codegen_to_restli_obj(model) == ref_server_obj
 
     post_obj = post_json_transform(server_obj)
 
@@ -358,6 +368,39 @@ def test_json_transforms(model, ref_server_obj):
     assert recovered == model
 
 
+@pytest.mark.parametrize(
+    "json_filename",
+    [
+        "tests/unit/serde/test_serde_large.json",
+        "tests/unit/serde/test_serde_chart_snapshot.json",
+        "tests/unit/serde/test_serde_usage.json",
+        "tests/unit/serde/test_serde_profile.json",
+    ],
+)
+def test_codegen_to_restli_obj_matches_json_transform(
+    pytestconfig: PytestConfig, json_filename: str
+) -> None:
+    for record in read_metadata_file(pytestconfig.rootpath / json_filename):
+        model = (
+            record.make_mcp()
+            if isinstance(record, MetadataChangeProposalWrapper)
+            else record
+        )
+        expected = pre_json_transform(model.to_obj())
+        # Compare the serialized form, since key order matters on the wire.
+        assert json.dumps(codegen_to_restli_obj(model)) == json.dumps(expected)
+
+
+def test_codegen_to_restli_obj_type_error() -> None:
+    model = models.DataFlowInfoClass(
+        name="hello_datahub",
+        customProperties={"x": 1},  # type: ignore
+    )
+
+    with pytest.raises(avrojson.AvroTypeException):
+        codegen_to_restli_obj(model)
+
+
 def test_unions_with_aliases_assumptions():
     # We have special handling for unions with aliases in our json serialization helpers.
     # Specifically, we assume that cost is the only instance of a union with alias.
@@ -198,3 +198,31 @@ def test_state_forward_compatibility(serde: str) -> None:
     )
 
     _assert_checkpoint_deserialization(checkpoint_state, expected_next_state)
+
+
+def test_compact_encoding():
+    """Verify that the base85-bz2-compact-json serde front-codes the urns and round-trips."""
+    test_state = BaseSQLAlchemyCheckpointState()
+    for i in range(1000):
+        test_state.add_checkpoint_urn(
+            type="table", urn=make_dataset_urn("mysql", f"db1.schema1.t{i}", "prod")
+        )
+    base85_json_payload = test_state.to_bytes()
+
+    # The compact serde is opt-in, since older CLIs can't read it.
+    test_state.prepare_for_commit()
+    assert test_state.serde == "base85-bz2-json"
+
+    test_state.serde = "base85-bz2-compact-json"
+    assert len(test_state.to_bytes()) < len(base85_json_payload)
+
+    # The compact encoding stores the urns in sorted order.
+    expected_state = BaseSQLAlchemyCheckpointState(
+        urns=sorted(test_state.urns), serde="base85-bz2-compact-json"
+    )
+    checkpoint_state = IngestionCheckpointStateClass(
+        formatVersion=test_state.version,
+        serde=test_state.serde,
+        payload=test_state.to_bytes(),
+    )
+    _assert_checkpoint_deserialization(checkpoint_state, expected_state)
@@ -49,3 +49,55 @@ def test_case_sensitivity():
     pattern = AllowDenyPattern(allow=["Foo.myTable"], ignoreCase=False)
     assert not pattern.allowed("foo.mytable")
     assert pattern.allowed("Foo.myTable")
+
+
+def test_literal_prefix_match():
+    pattern = AllowDenyPattern(allow=["db1", "Analytics"], deny=["db1_tmp"])
+    assert pattern.allowed("db10.table")
+    assert pattern.allowed("ANALYTICS.table")
+    assert not pattern.allowed("db1_tmp.table")
+    assert not pattern.allowed("other.db1")
+
+
+def test_patterns_with_group_references():
+    pattern = AllowDenyPattern(allow=[r"(a)\1", r"(?P<x>b)(?P=x)"])
+    assert pattern.allowed("aa")
+    assert pattern.allowed("bb")
+    assert not pattern.allowed("ab")
+
+
+def test_inline_flags():
+    pattern = AllowDenyPattern(allow=["(?i)foo", "bar.*", "baz.*"], ignoreCase=False)
+    assert pattern.allowed("FOO")
+    assert not pattern.allowed("BAR")
+    assert pattern.allowed("baz")
+
+    # The flagged pattern is compiled on its own, and the rest are still combined.
+    allow, _ = pattern._get_compiled()
+    assert [regex.pattern for regex in allow._regexes] == [
+        "(?:bar.*)|(?:baz.*)",
+        "(?i)foo",
+    ]
+
+
+def test_modified_after_creation():
+    pattern = AllowDenyPattern(allow=["foo.*"])
+    assert pattern.allowed("foo.table")
+    assert not pattern.allowed("bar.table")
+
+    pattern.deny.append("foo.table")
+    pattern.allow.append("bar.*")
+    assert not pattern.allowed("foo.table")
+    assert pattern.allowed("bar.table")
+
+    pattern.allow = ["baz.*"]
+    assert not pattern.allowed("bar.table")
+    assert pattern.allowed("baz.table")
+
+    pattern.ignoreCase = False
+    assert not pattern.allowed("BAZ.table")
+
+    # Edits that keep the length of the list.
+    pattern.allow[0] = "qux.*"
+    assert not pattern.allowed("baz.table")
+    assert pattern.allowed("qux.table")
@@ -1,3 +1,4 @@
+import json
 import os
 from unittest import mock
 
@@ -59,3 +60,30 @@ def test_correct_url_when_gms_host_port_url_protocol_set():
 )
 def test_correct_url_when_url_set():
     assert cli_utils.get_details_from_env() == ("https://example.com", None)
+
+
+def test_scroll_urns_by_filter_follows_scroll_id():
+    pages = [
+        {
+            "value": {
+                "entities": [{"entity": "urn:li:a"}, {"entity": "urn:li:b"}],
+                "scrollId": "next-page",
+                "numEntities": 3,
+            }
+        },
+        {"value": {"entities": [{"entity": "urn:li:c"}], "numEntities": 3}},
+    ]
+    session = mock.Mock()
+    session.post.side_effect = [
+        mock.Mock(json=mock.Mock(return_value=page)) for page in pages
+    ]
+
+    urns = cli_utils.scroll_urns_by_filter(
+        platform="hive", cached_session_host=(session, "http://localhost:8080")
+    )
+    assert list(urns) == ["urn:li:a", "urn:li:b", "urn:li:c"]
+
+    scroll_ids = [
+        json.loads(call.args[1]).get("scrollId") for call in session.post.call_args_list
+    ]
+    assert scroll_ids == [None, "next-page"]
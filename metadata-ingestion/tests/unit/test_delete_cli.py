@@ -0,0 +1,120 @@
+import pathlib
+from typing import List
+from unittest.mock import patch
+
+from datahub.cli.delete_cli import (
+    DeletionResult,
+    _ConcurrentDeleter,
+    _DeletionCheckpoint,
+    _RateLimitingRequestHook,
+)
+from datahub.emitter.rest_emitter import DatahubRestEmitter
+
+MOCK_GMS_ENDPOINT = "http://fakegmshost:8080"
+
+URNS = [f"urn:li:dataset:(urn:li:dataPlatform:hive,t{i},PROD)" for i in range(5)]
+
+
+class _CountingRateLimiter:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def __enter__(self) -> "_CountingRateLimiter":
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.calls += 1
+
+
+def _make_deleter(
+    checkpoint: _DeletionCheckpoint, soft: bool, batch_size: int = 2
+) -> _ConcurrentDeleter:
+    return _ConcurrentDeleter(
+        soft=soft,
+        dry_run=False,
+        aspect_name=None,
+        gms_host=MOCK_GMS_ENDPOINT,
+        emitter=DatahubRestEmitter(MOCK_GMS_ENDPOINT),
+        checkpoint=checkpoint,
+        workers=2,
+        batch_size=batch_size,
+    )
+
+
+def test_deletion_checkpoint_resume(tmp_path: pathlib.Path) -> None:
+    checkpoint_file = str(tmp_path / "checkpoint.txt")
+
+    checkpoint = _DeletionCheckpoint(checkpoint_file)
+    assert checkpoint.completed == set()
+    checkpoint.mark_completed(URNS[:2])
+    checkpoint.close()
+
+    # Resuming loads the completed urns and keeps appending to the same file.
+    checkpoint = _DeletionCheckpoint(checkpoint_file)
+    assert checkpoint.completed == set(URNS[:2])
+    checkpoint.mark_completed(URNS[2:3])
+    checkpoint.close()
+
+    assert _DeletionCheckpoint(checkpoint_file).completed == set(URNS[:3])
+
+
+def test_concurrent_hard_delete_skips_checkpointed_urns(
+    tmp_path: pathlib.Path,
+) -> None:
+    checkpoint_file = str(tmp_path / "checkpoint.txt")
+    checkpoint = _DeletionCheckpoint(checkpoint_file)
+    checkpoint.mark_completed(URNS[:2])
+    checkpoint.close()
+
+    deleted: List[str] = []
+
+    def _delete_one_urn(urn: str, **kwargs: object) -> DeletionResult:
+        deleted.append(urn)
+        return DeletionResult(num_entities=1, num_records=3)
+
+    checkpoint = _DeletionCheckpoint(checkpoint_file)
+    deleter = _make_deleter(checkpoint, soft=False)
+    with patch(
+        "datahub.cli.delete_cli._delete_one_urn", side_effect=_delete_one_urn
+    ), patch("datahub.cli.cli_utils.get_session_and_host", return_value=(None, "")):
+        result = deleter.delete(iter(URNS), num_urns=len(URNS))
+    checkpoint.close()
+
+    assert sorted(deleted) == URNS[2:]
+    assert deleter.num_skipped == 2
+    assert result.num_entities == 3
+    assert result.num_records == 9
+    assert _DeletionCheckpoint(checkpoint_file).completed == set(URNS)
+
+
+def test_concurrent_soft_delete_without_batch_endpoint(
+    tmp_path: pathlib.Path, requests_mock
+) -> None:
+    batch_mock = requests_mock.post(
+        f"{MOCK_GMS_ENDPOINT}/aspects?action=ingestProposalBatch",
+        status_code=404,
+        json={"message": "Not found", "status": 404},
+    )
+    single_mock = requests_mock.post(
+        f"{MOCK_GMS_ENDPOINT}/aspects?action=ingestProposal"
+    )
+
+    checkpoint_file = str(tmp_path / "checkpoint.txt")
+    checkpoint = _DeletionCheckpoint(checkpoint_file)
+    deleter = _make_deleter(checkpoint, soft=True, batch_size=len(URNS))
+    rate_limiter = _CountingRateLimiter()
+    deleter.emitter.add_request_hook(_RateLimitingRequestHook(rate_limiter))  # type: ignore
+    result = deleter.delete(iter(URNS), num_urns=len(URNS))
+    checkpoint.close()
+
+    # Every urn is soft-deleted with its own request once batching fails.
+    assert batch_mock.call_count == 1
+    assert sorted(
+        request.json()["proposal"]["entityUrn"]
+        for request in single_mock.request_history
+    ) == sorted(URNS)
+    assert result.num_entities == len(URNS)
+    assert _DeletionCheckpoint(checkpoint_file).completed == set(URNS)
+
+    # The rate limit counts each request, not each batch.
+    assert rate_limiter.calls == 1 + len(URNS)
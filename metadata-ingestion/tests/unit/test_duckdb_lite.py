@@ -0,0 +1,128 @@
+import pathlib
+
+import datahub.metadata.schema_classes as models
+from datahub.emitter.mcp import MetadataChangeProposalWrapper
+from datahub.lite.duckdb_lite import DuckDBLite
+from datahub.lite.duckdb_lite_config import DuckDBLiteConfig
+from datahub.lite.lite_local import SearchFlavor
+
+
+def _make_mcp(name: str, description: str) -> MetadataChangeProposalWrapper:
+    return MetadataChangeProposalWrapper(
+        entityUrn=f"urn:li:dataset:(urn:li:dataPlatform:hive,{name},PROD)",
+        aspect=models.DatasetPropertiesClass(name=name, description=description),
+        systemMetadata=models.SystemMetadataClass(lastObserved=1000),
+    )
+
+
+def _versions(lite: DuckDBLite) -> list:
+    return lite.duckdb_client.execute(
+        "SELECT urn, aspect_name, version, metadata FROM metadata_aspect_v2 ORDER BY urn, aspect_name, version"
+    ).fetchall()
+
+
+def test_write_batch_matches_write(tmp_path: pathlib.Path) -> None:
+    single = DuckDBLite(DuckDBLiteConfig(file=str(tmp_path / "single.duckdb")))
+    batched = DuckDBLite(DuckDBLiteConfig(file=str(tmp_path / "batched.duckdb")))
+
+    rounds = [
+        [_make_mcp("a", "first"), _make_mcp("b", "first")],
+        # An unchanged aspect doesn't create a new version.
+        [_make_mcp("a", "first"), _make_mcp("b", "second")],
+        [_make_mcp("b", "third")],
+    ]
+    for records in rounds:
+        for record in records:
+            single.write(record)
+        batched.write_batch(records)
+
+    assert _versions(batched) == _versions(single)
+    assert batched.get(
+        "urn:li:dataset:(urn:li:dataPlatform:hive,b,PROD)",
+        aspects=["datasetProperties"],
+        details=True,
+    ) == single.get(
+        "urn:li:dataset:(urn:li:dataPlatform:hive,b,PROD)",
+        aspects=["datasetProperties"],
+        details=True,
+    )
+
+    single.close()
+    batched.close()
+
+
+def test_free_text_search(tmp_path: pathlib.Path) -> None:
+    lite = DuckDBLite(DuckDBLiteConfig(file=str(tmp_path / "lite.duckdb")))
+    lite.write_batch([_make_mcp("orders", "x"), _make_mcp("order_items", "x")])
+    lite.write(_make_mcp("customers", "x"))
+
+    def search(query: str) -> list:
+        return [
+            (result.id, result.aspect)
+            for result in lite.search(query, SearchFlavor.FREE_TEXT, snippet=False)
+        ]
+
+    orders_urn = "urn:li:dataset:(urn:li:dataPlatform:hive,orders,PROD)"
+    order_items_urn = "urn:li:dataset:(urn:li:dataPlatform:hive,order_items,PROD)"
+    customers_urn = "urn:li:dataset:(urn:li:dataPlatform:hive,customers,PROD)"
+
+    # The last term matches by prefix, and names rank above urns.
+    assert search("ord") == [
+        (orders_urn, "datasetProperties"),
+        (order_items_urn, "datasetProperties"),
+        (orders_urn, "urn"),
+        (order_items_urn, "urn"),
+    ]
+    # Every term must match.
+    assert search("order items") == [
+        (order_items_urn, "datasetProperties"),
+        (order_items_urn, "urn"),
+    ]
+    assert search("customers ord") == []
+    # Exact matches rank above prefix matches.
+    assert search("hive orders")[0] == (orders_urn, "urn")
+    assert search("cust") == [
+        (customers_urn, "datasetProperties"),
+        (customers_urn, "urn"),
+    ]
+    # Query text is never interpolated into SQL.
+    assert search("' OR 1=1 --") == []
+
+    # Snippets are the aspect's JSON; urn documents have none.
+    results = list(lite.search("customers", SearchFlavor.FREE_TEXT))
+    assert [(r.aspect, r.snippet is None) for r in results] == [
+        ("datasetProperties", False),
+        ("urn", True),
+    ]
+    assert '"name": "customers"' in (results[0].snippet or "")
+
+    lite.close()
+
+
+def test_free_text_search_without_index(tmp_path: pathlib.Path) -> None:
+    # Simulate a database written before the search index existed.
+    lite_file = str(tmp_path / "lite.duckdb")
+    lite = DuckDBLite(DuckDBLiteConfig(file=lite_file))
+    lite.write_batch([_make_mcp("orders", "x"), _make_mcp("customers", "x")])
+    lite.duckdb_client.execute("DROP TABLE metadata_search_token_v2")
+    lite.close()
+
+    orders_urn = "urn:li:dataset:(urn:li:dataPlatform:hive,orders,PROD)"
+
+    # Read-only opens can't build the index, so they scan instead.
+    lite = DuckDBLite(DuckDBLiteConfig(file=lite_file, read_only=True))
+    assert sorted(
+        (result.id, result.aspect)
+        for result in lite.search("ORDERS", SearchFlavor.FREE_TEXT, snippet=False)
+    ) == [(orders_urn, "datasetProperties"), (orders_urn, "urn")]
+    assert list(lite.search("%", SearchFlavor.FREE_TEXT)) == []
+    # close() reindexes, which needs a writable database.
+    lite.duckdb_client.close()
+
+    # The first writable open backfills the index.
+    lite = DuckDBLite(DuckDBLiteConfig(file=lite_file))
+    assert [
+        (result.id, result.aspect)
+        for result in lite.search("orders", SearchFlavor.FREE_TEXT, snippet=False)
+    ] == [(orders_urn, "datasetProperties"), (orders_urn, "urn")]
+    lite.close()
@@ -0,0 +1,113 @@
+import concurrent.futures
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import pytest
+import sqlalchemy as sa
+
+from datahub.ingestion.source.ge_data_profiler import (
+    DatahubGEProfiler,
+    GEProfilerRequest,
+)
+from datahub.ingestion.source.ge_profiling_config import GEProfilingConfig
+from datahub.ingestion.source.sql.sql_common import SQLSourceReport
+
+# How long the slow table takes to profile, in seconds.
+SLOW_TABLE_SEC = 0.5
+
+
+class _FakeProfiler(DatahubGEProfiler):
+    """Profiles each table by sleeping for the time given in its request."""
+
+    def __init__(self, config: GEProfilingConfig) -> None:
+        super().__init__(
+            sa.create_engine("sqlite://"), SQLSourceReport(), config, "sqlite"
+        )
+        self._lock = threading.Lock()
+        self.running = 0
+        self.max_running = 0
+
+    def _generate_single_profile(  # type: ignore[override]
+        self, query_combiner: Any, pretty_name: str, **kwargs: Any
+    ) -> Optional[str]:
+        with self._lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        try:
+            time.sleep(kwargs["sleep_sec"])
+            return pretty_name
+        finally:
+            with self._lock:
+                self.running -= 1
+
+
+def _profile(
+    config: Dict[str, Any], sleep_secs: Dict[str, float], max_workers: int = 4
+) -> Tuple[_FakeProfiler, List[Tuple[str, Optional[str], float]]]:
+    """Returns the profiler, and each table's name, profile and time to be yielded."""
+    profiler = _FakeProfiler(GEProfilingConfig.parse_obj(config))
+    requests = [
+        GEProfilerRequest(pretty_name=name, batch_kwargs={"sleep_sec": sleep_sec})
+        for name, sleep_sec in sleep_secs.items()
+    ]
+    results = []
+    start_time = time.perf_counter()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for request, profile in profiler._generate_profiles_from_requests(
+            executor, None, requests, max_workers  # type: ignore[arg-type]
+        ):
+            results.append(
+                (request.pretty_name, profile, time.perf_counter() - start_time)
+            )
+    return profiler, results
+
+
+def test_profiles_in_request_order() -> None:
+    _, results = _profile({}, {"slow": SLOW_TABLE_SEC, "a": 0, "b": 0})
+    assert [name for name, _, _ in results] == ["slow", "a", "b"]
+
+
+def test_profiles_in_completion_order() -> None:
+    _, results = _profile(
+        {"profile_in_completion_order": True},
+        {"slow": SLOW_TABLE_SEC, "a": 0, "b": 0},
+    )
+    assert sorted(name for name, _, _ in results[:2]) == ["a", "b"]
+    assert results[2][0] == "slow"
+    # Fast tables don't wait for the slow one.
+    assert results[1][2] < SLOW_TABLE_SEC
+
+
+@pytest.mark.parametrize("profile_in_completion_order", [False, True])
+def test_max_pending_profile_requests(profile_in_completion_order: bool) -> None:
+    profiler, results = _profile(
+        {
+            "profile_in_completion_order": profile_in_completion_order,
+            "max_pending_profile_requests": 2,
+        },
+        {name: 0.05 for name in "abcdef"},
+        max_workers=6,
+    )
+    assert sorted(name for name, _, _ in results) == list("abcdef")
+    assert profiler.max_running <= 2
+
+
+@pytest.mark.parametrize("profile_in_completion_order", [False, True])
+def test_profile_table_timeout(profile_in_completion_order: bool) -> None:
+    profiler, results = _profile(
+        {
+            "profile_in_completion_order": profile_in_completion_order,
+            "profile_table_timeout_sec": 0.1,
+        },
+        {"a": 0, "slow": SLOW_TABLE_SEC, "b": 0},
+    )
+    profiles = {name: profile for name, profile, _ in results}
+    assert profiles == {"a": "a", "slow": None, "b": "b"}
+    if not profile_in_completion_order:
+        assert [name for name, _, _ in results] == ["a", "slow", "b"]
+
+    # The slow table is given up on once it times out, without waiting for its worker.
+    slow_yielded_after = next(t for name, _, t in results if name == "slow")
+    assert slow_yielded_after < SLOW_TABLE_SEC
+    assert "slow" in profiler.report.warnings
@@ -0,0 +1,89 @@
+from datetime import datetime, timedelta, timezone
+from typing import Optional, cast
+from unittest import mock
+
+from datahub.ingestion.source.sql.sql_config import BasicSQLAlchemyConfig
+from datahub.ingestion.source.sql.sql_generic_profiler import (
+    GenericProfiler,
+    ProfilingEligibility,
+    ProfilingSqlReport,
+)
+
+LAST_ALTERED = datetime(2023, 1, 1, tzinfo=timezone.utc)
+
+
+def _make_profiler(
+    last_profiled: Optional[datetime],
+    last_fingerprint: Optional[str],
+    max_profile_age_days: Optional[float] = None,
+    profile_table_row_limit: Optional[int] = None,
+) -> GenericProfiler:
+    config = BasicSQLAlchemyConfig.parse_obj(
+        {
+            "scheme": "postgresql",
+            "host_port": "localhost:5432",
+            "profiling": {
+                "enabled": True,
+                "profile_table_size_limit": None,
+                "profile_table_row_limit": profile_table_row_limit,
+                "max_profile_age_days": max_profile_age_days,
+            },
+        }
+    )
+    state_handler = mock.Mock()
+    state_handler.get_last_profiled.return_value = (
+        int(last_profiled.timestamp() * 1000) if last_profiled else None
+    )
+    state_handler.get_last_fingerprint.return_value = last_fingerprint
+    return GenericProfiler(
+        config, ProfilingSqlReport(), "postgres", state_handler=state_handler
+    )
+
+
+def test_unchanged_table_is_skipped():
+    # Without a last altered time, only the fingerprint can tell that the table is unchanged.
+    fingerprint = GenericProfiler.get_table_fingerprint(None, 1024, 10)
+    profiler = _make_profiler(LAST_ALTERED, fingerprint)
+
+    assert not profiler.is_dataset_eligible_for_profiling(
+        "db.public.orders", None, 1024, 10
+    )
+    assert profiler.is_dataset_eligible_for_profiling(
+        "db.public.orders", None, 1024, 11
+    )
+
+
+def test_unchanged_table_is_not_profiled_at_table_level():
+    fingerprint = GenericProfiler.get_table_fingerprint(None, 1024, 10)
+    profiler = _make_profiler(LAST_ALTERED, fingerprint, profile_table_row_limit=5)
+    report = cast(ProfilingSqlReport, profiler.report)
+
+    assert (
+        profiler.get_profiling_eligibility("db.public.orders", None, 1024, 10)
+        == ProfilingEligibility.NOT_ELIGIBLE
+    )
+    assert report.profiling_skipped_not_updated == {"db.public": 1}
+
+    # A changed table over the row limit still gets table-level stats.
+    assert (
+        profiler.get_profiling_eligibility("db.public.orders", None, 1024, 11)
+        == ProfilingEligibility.TABLE_LEVEL_ONLY
+    )
+    assert report.profiling_skipped_row_limit == {"db.public": 1}
+
+
+def test_unchanged_table_is_profiled_after_max_profile_age():
+    fingerprint = GenericProfiler.get_table_fingerprint(LAST_ALTERED, 1024, 10)
+    profiler = _make_profiler(
+        datetime.now(timezone.utc) - timedelta(days=10),
+        fingerprint,
+        max_profile_age_days=7,
+    )
+
+    assert profiler.is_dataset_eligible_for_profiling(
+        "db.public.orders", LAST_ALTERED, 1024, 10
+    )
+
+
+def test_table_without_metadata_has_no_fingerprint():
+    assert GenericProfiler.get_table_fingerprint(None, None, None) is None
@@ -0,0 +1,90 @@
+from typing import List
+
+import sqlalchemy as sa
+
+from datahub.ingestion.source.ge_profiling_config import GEProfilingConfig
+from datahub.ingestion.source.native_data_profiler import NativeDatasetProfiler
+from datahub.ingestion.source.sql.sql_common import SQLSourceReport
+
+
+def _make_engine() -> sa.engine.Engine:
+    engine = sa.create_engine("sqlite://")
+    with engine.begin() as conn:
+        conn.execute(
+            sa.text(
+                "CREATE TABLE orders (id INTEGER, status VARCHAR(20), amount FLOAT, note VARCHAR(20))"
+            )
+        )
+        for i in range(100):
+            conn.execute(
+                sa.text("INSERT INTO orders VALUES (:id, :status, :amount, :note)"),
+                dict(
+                    id=i,
+                    status=["open", "closed"][i % 2],
+                    amount=float(i),
+                    note=None if i % 4 else "late",
+                ),
+            )
+    return engine
+
+
+def _profile(engine: sa.engine.Engine, config: GEProfilingConfig) -> tuple:
+    queries: List[str] = []
+    sa.event.listen(
+        engine,
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: queries.append(statement),
+    )
+    with engine.connect() as conn:
+        profile = NativeDatasetProfiler(
+            conn,
+            "main.orders",
+            None,
+            "orders",
+            None,
+            config,
+            SQLSourceReport(),
+        ).generate_dataset_profile()
+    return profile, queries
+
+
+def test_native_profiler_computes_column_statistics():
+    config = GEProfilingConfig(include_field_distinct_value_frequencies=True)
+    profile, queries = _profile(_make_engine(), config)
+
+    assert profile.rowCount == 100
+    assert profile.columnCount == 4
+    fields = {field.fieldPath: field for field in profile.fieldProfiles}
+
+    assert fields["id"].uniqueCount == 100
+    assert fields["id"].nullCount == 0
+    assert fields["id"].min == "0"
+    assert fields["id"].max == "99"
+    assert fields["id"].mean == "49.5"
+
+    assert fields["status"].uniqueCount == 2
+    assert [
+        (frequency.value, frequency.frequency)
+        for frequency in fields["status"].distinctValueFrequencies
+    ] == [("closed", 50), ("open", 50)]
+
+    assert fields["note"].nullCount == 75
+    assert fields["note"].nullProportion == 0.75
+    assert fields["note"].sampleValues
+
+    # Statistics, value frequencies and sample values each take a single query,
+    # besides the queries used to list the table's columns.
+    profiling_queries = [query for query in queries if "PRAGMA" not in query]
+    assert len(profiling_queries) == 3
+
+
+def test_native_profiler_max_number_of_fields_to_profile():
+    config = GEProfilingConfig(max_number_of_fields_to_profile=1)
+    profile, _ = _profile(_make_engine(), config)
+
+    assert profile.rowCount == 100
+    assert [
+        field.fieldPath
+        for field in profile.fieldProfiles
+        if field.uniqueCount is not None
+    ] == ["id"]
@@ -1,6 +1,7 @@
 from typing import Any, Iterable, List, Optional, cast
 from unittest.mock import patch
 
+import pydantic
 import pytest
 from freezegun import freeze_time
 
@@ -11,6 +12,7 @@ from datahub.ingestion.api.source import Source, SourceReport
 from datahub.ingestion.api.transform import Transformer
 from datahub.ingestion.api.workunit import MetadataWorkUnit
 from datahub.ingestion.run.pipeline import Pipeline, PipelineContext
+from datahub.ingestion.run.pipeline_config import PipelineExecutionConfig
 from datahub.metadata.com.linkedin.pegasus2avro.mxe import SystemMetadata
 from datahub.metadata.schema_classes import (
     DatasetPropertiesClass,
@@ -202,6 +204,45 @@ class TestPipeline(object):
         assert len(sink_report.received_records) == 1
         assert expected_mce == sink_report.received_records[0].record
 
+    @freeze_time(FROZEN_TIME)
+    def test_run_pipelined_including_fake_transformation(self):
+        pipeline = Pipeline.create(
+            {
+                "source": {"type": "tests.unit.test_pipeline.FakeSource"},
+                "transformers": [
+                    {"type": "tests.unit.test_pipeline.AddStatusRemovedTransformer"}
+                ],
+                "sink": {"type": "tests.test_helpers.sink_helpers.RecordingSink"},
+                "run_id": "pipeline_test",
+                "execution": {
+                    "pipelined": True,
+                    "max_queued_workunits": 1,
+                    "max_queued_records": 1,
+                },
+            }
+        )
+        pipeline.run()
+        pipeline.raise_from_status()
+
+        expected_mce = get_initial_mce()
+
+        dataset_snapshot = cast(DatasetSnapshotClass, expected_mce.proposedSnapshot)
+        dataset_snapshot.aspects.append(get_status_removed_aspect())
+
+        sink_report: RecordingSinkReport = cast(
+            RecordingSinkReport, pipeline.sink.get_report()
+        )
+
+        assert len(sink_report.received_records) == 1
+        assert expected_mce == sink_report.received_records[0].record
+
+    @pytest.mark.parametrize("queue_size", [0, -1])
+    def test_pipelined_queue_sizes_must_be_positive(self, queue_size):
+        # A queue with a max size of 0 or less is unbounded.
+        for option in ["max_queued_workunits", "max_queued_records"]:
+            with pytest.raises(pydantic.ValidationError):
+                PipelineExecutionConfig.parse_obj({option: queue_size})
+
     @freeze_time(FROZEN_TIME)
     def test_run_including_registered_transformation(self):
         # This is not testing functionality, but just the transformer registration system.
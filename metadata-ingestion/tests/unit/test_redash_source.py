@@ -734,3 +734,19 @@ def test_get_chart_snapshot_parse_table_names_from_sql(mocked_data_source):
     )
 
     assert result == expected
+
+
+@patch("datahub.ingestion.source.redash.RedashSource._get_chart_data_source")
+def test_get_chart_snapshot_with_batch_parsed_table_names(mocked_data_source):
+    mocked_data_source.return_value = mock_mysql_data_source_response
+    source = redash_source_parse_table_names_from_sql()
+    viz_data = mock_chart_response.get("visualizations", [])[2]
+
+    parsed_sql_table_names = source._parse_sql_table_names_batch(
+        [mock_chart_response["query"]]
+    )
+    result = source._get_chart_snapshot(
+        mock_chart_response, viz_data, parsed_sql_table_names
+    )
+
+    assert result == source._get_chart_snapshot(mock_chart_response, viz_data)
@@ -36,3 +36,24 @@ def test_datahub_rest_emitter_extra_params():
     )
     assert emitter._session.headers.get("key1") == "value1"
     assert emitter._session.headers.get("key2") == "value2"
+
+
+def test_datahub_rest_emitter_batch_chunking():
+    serialized = ["a" * 10, "b" * 10, "c" * 10, "d" * 50, "e" * 10]
+
+    # Split by count.
+    chunks = list(rest_emitter._chunk_serialized_proposals(serialized, 2, 1000))
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+
+    # Split by payload size. Oversized items are still sent on their own.
+    chunks = list(rest_emitter._chunk_serialized_proposals(serialized, 100, 40))
+    assert [len(chunk) for chunk in chunks] == [3, 1, 1]
+
+
+def test_datahub_rest_emitter_pool_size():
+    emitter = DatahubRestEmitter(MOCK_GMS_ENDPOINT, pool_maxsize=7)
+    assert emitter._adapter._pool_maxsize == 7
+    assert emitter.get_connection_stats() == {
+        "requests_made": 0,
+        "connections_opened": 0,
+    }
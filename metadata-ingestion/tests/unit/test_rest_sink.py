@@ -1,11 +1,24 @@
 import json
+from datetime import timedelta
+from typing import List
 
+import pydantic
 import pytest
 import requests
 
 import datahub.metadata.schema_classes as models
+from datahub.configuration.common import OperationalError
 from datahub.emitter.mcp import MetadataChangeProposalWrapper
+from datahub.emitter.request_helper import RequestHook
 from datahub.emitter.rest_emitter import DatahubRestEmitter
+from datahub.ingestion.api.common import PipelineContext, RecordEnvelope
+from datahub.ingestion.api.sink import WriteCallback
+from datahub.ingestion.sink.datahub_rest import (
+    DatahubRestSink,
+    DatahubRestSinkConfig,
+    DataHubRestSinkReport,
+    _ReportingRequestHook,
+)
 
 MOCK_GMS_ENDPOINT = "http://fakegmshost:8080"
 
@@ -259,3 +272,236 @@ def test_datahub_rest_emitter(requests_mock, record, path, snapshot):
 
     emitter = DatahubRestEmitter(MOCK_GMS_ENDPOINT)
     emitter.emit(record)
+
+
+def test_datahub_rest_emitter_batch(requests_mock):
+    mcps = [
+        MetadataChangeProposalWrapper(
+            entityUrn=f"urn:li:dataset:(urn:li:dataPlatform:foo,bar{i},PROD)",
+            aspect=models.StatusClass(removed=False),
+        )
+        for i in range(5)
+    ]
+
+    batches = []
+
+    def match_request_text(request: requests.Request) -> bool:
+        batches.append(request.json()["proposals"])
+        return True
+
+    requests_mock.post(
+        f"{MOCK_GMS_ENDPOINT}/aspects?action=ingestProposalBatch",
+        request_headers={"X-RestLi-Protocol-Version": "2.0.0"},
+        additional_matcher=match_request_text,
+    )
+
+    emitter = DatahubRestEmitter(MOCK_GMS_ENDPOINT)
+    assert emitter.emit_mcps(mcps, max_batch_size=2) == 3
+
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    assert [proposal["entityUrn"] for batch in batches for proposal in batch] == [
+        mcp.entityUrn for mcp in mcps
+    ]
+    assert batches[0][0]["aspect"] == {
+        "value": '{"removed": false}',
+        "contentType": "application/json",
+    }
+
+
+def test_datahub_rest_emitter_batch_fallback(requests_mock):
+    mcps = [
+        MetadataChangeProposalWrapper(
+            entityUrn=f"urn:li:dataset:(urn:li:dataPlatform:foo,bar{i},PROD)",
+            aspect=models.StatusClass(removed=False),
+        )
+        for i in range(3)
+    ]
+    batch_mock = requests_mock.post(
+        f"{MOCK_GMS_ENDPOINT}/aspects?action=ingestProposalBatch",
+        status_code=404,
+        json={"message": "Not found", "status": 404},
+    )
+    single_mock = requests_mock.post(
+        f"{MOCK_GMS_ENDPOINT}/aspects?action=ingestProposal"
+    )
+
+    emitter = DatahubRestEmitter(MOCK_GMS_ENDPOINT)
+    assert emitter.emit_mcps(mcps) == 3
+    assert emitter.emit_mcps(mcps) == 3
+
+    # The batch endpoint is only tried once.
+    assert batch_mock.call_count == 1
+    assert [
+        request.json()["proposal"]["entityUrn"]
+        for request in single_mock.request_history
+    ] == [mcp.entityUrn for mcp in mcps + mcps]
+
+
+class _RecordingCallback(WriteCallback):
+    def __init__(self) -> None:
+        self.succeeded: List[str] = []
+        self.failed: List[str] = []
+
+    def on_success(self, record_envelope, success_metadata):
+        self.succeeded.append(record_envelope.record.entityUrn)
+
+    def on_failure(self, record_envelope, failure_exception, failure_metadata):
+        self.failed.append(record_envelope.record.entityUrn)
+
+
+def test_datahub_rest_sink_batch_reports_records(requests_mock):
+    requests_mock.get(f"{MOCK_GMS_ENDPOINT}/config", json={"noCode": "true"})
+    requests_mock.post(
+        f"{MOCK_GMS_ENDPOINT}/aspects?action=ingestProposalBatch",
+        status_code=500,
+        json={"message": "Failed to ingest bar1", "status": 500},
+    )
+    requests_mock.post(f"{MOCK_GMS_ENDPOINT}/aspects?action=ingestProposal")
+    requests_mock.post(
+        f"{MOCK_GMS_ENDPOINT}/aspects?action=ingestProposal",
+        additional_matcher=lambda request: request.json()["proposal"][
+            "entityUrn"
+        ].endswith("bar1,PROD)"),
+        status_code=400,
+        json={"message": "Failed to ingest bar1", "status": 400},
+    )
+
+    sink = DatahubRestSink(
+        PipelineContext(run_id="test"),
+        DatahubRestSinkConfig(
+            server=MOCK_GMS_ENDPOINT, mode="ASYNC_BATCH", max_per_batch=3
+        ),
+    )
+    callback = _RecordingCallback()
+    urns = [f"urn:li:dataset:(urn:li:dataPlatform:foo,bar{i},PROD)" for i in range(3)]
+    for urn in urns:
+        sink.write_record_async(
+            RecordEnvelope(
+                MetadataChangeProposalWrapper(
+                    entityUrn=urn, aspect=models.StatusClass(removed=False)
+                ),
+                metadata={},
+            ),
+            callback,
+        )
+    sink.close()
+
+    # Only the record that failed on its own is reported as a failure.
+    assert sorted(callback.succeeded) == [urns[0], urns[2]]
+    assert callback.failed == [urns[1]]
+    report = sink.get_report()
+    assert report.total_records_written == 2
+    assert len(report.failures) == 1
+    assert report.batches_written == 1
+    assert report.pending_requests == 0
+
+
+def test_datahub_rest_sink_batch_report_counts(requests_mock):
+    requests_mock.get(f"{MOCK_GMS_ENDPOINT}/config", json={"noCode": "true"})
+    requests_mock.post(f"{MOCK_GMS_ENDPOINT}/aspects?action=ingestProposalBatch")
+
+    sink = DatahubRestSink(
+        PipelineContext(run_id="test"),
+        DatahubRestSinkConfig(
+            server=MOCK_GMS_ENDPOINT,
+            mode="ASYNC_BATCH",
+            max_per_batch=2,
+            max_threads=8,
+        ),
+    )
+    callback = _RecordingCallback()
+    urns = [f"urn:li:dataset:(urn:li:dataPlatform:foo,bar{i},PROD)" for i in range(200)]
+    for urn in urns:
+        sink.write_record_async(
+            RecordEnvelope(
+                MetadataChangeProposalWrapper(
+                    entityUrn=urn, aspect=models.StatusClass(removed=False)
+                ),
+                metadata={},
+            ),
+            callback,
+        )
+    sink.close()
+
+    # The counters are updated from the worker threads without losing updates.
+    report = sink.get_report()
+    assert sorted(callback.succeeded) == sorted(urns)
+    assert report.batches_written == 100
+    assert report.batch_requests == 100
+    assert report.pending_requests == 0
+
+
+def test_datahub_rest_sink_pool_size(requests_mock):
+    requests_mock.get(f"{MOCK_GMS_ENDPOINT}/config", json={"noCode": "true"})
+
+    # The pool never shrinks below the default, but grows to fit every worker.
+    for max_threads, pool_maxsize in [(1, 100), (200, 200)]:
+        sink = DatahubRestSink(
+            PipelineContext(run_id="test"),
+            DatahubRestSinkConfig(server=MOCK_GMS_ENDPOINT, max_threads=max_threads),
+        )
+        assert sink.emitter._adapter._pool_maxsize == pool_maxsize
+        sink.close()
+
+
+def test_datahub_rest_sink_batch_wait_must_be_positive():
+    with pytest.raises(pydantic.ValidationError):
+        DatahubRestSinkConfig(
+            server=MOCK_GMS_ENDPOINT, mode="ASYNC_BATCH", max_batch_wait_sec=0
+        )
+
+
+def test_datahub_rest_emitter_request_hook(requests_mock):
+    class RecordingHook(RequestHook):
+        def __init__(self):
+            self.requests = []
+
+        def on_request(self, url, payload_bytes, duration_sec, success):
+            self.requests.append((url, payload_bytes, success))
+
+    mcp = MetadataChangeProposalWrapper(
+        entityUrn="urn:li:dataset:(urn:li:dataPlatform:foo,bar,PROD)",
+        aspect=models.StatusClass(removed=False),
+    )
+    url = f"{MOCK_GMS_ENDPOINT}/aspects?action=ingestProposal"
+
+    emitter = DatahubRestEmitter(MOCK_GMS_ENDPOINT)
+    hook = RecordingHook()
+    emitter.add_request_hook(hook)
+
+    requests_mock.post(url)
+    emitter.emit(mcp)
+    requests_mock.post(url, status_code=400, json={"message": "bad request"})
+    with pytest.raises(OperationalError):
+        emitter.emit(mcp)
+
+    assert len(hook.requests) == 2
+    assert hook.requests[0][0] == url
+    assert hook.requests[0][1] > 0
+    assert [success for _, _, success in hook.requests] == [True, False]
+
+
+def test_datahub_rest_sink_report_latency():
+    report = DataHubRestSinkReport()
+    for i in range(1, 101):
+        report.report_write_latency(timedelta(milliseconds=i))
+    report.report_request_payload_size(100)
+    report.report_request_payload_size(120)
+    report.report_request_payload_size(5000)
+
+    report.compute_stats()
+    assert report.write_latency_p50_ms == 50
+    assert report.write_latency_p99_ms == 99
+    assert report.request_payload_size_histogram == {64: 2, 4096: 1}
+    assert "_write_latencies_ms" not in report.as_obj()
+
+
+def test_datahub_rest_sink_report_request_hook():
+    report = DataHubRestSinkReport()
+    hook = _ReportingRequestHook(report, DatahubRestEmitter(MOCK_GMS_ENDPOINT))
+    hook.on_request(MOCK_GMS_ENDPOINT, 100, 0.25, True)
+    hook.on_request(MOCK_GMS_ENDPOINT, 100, 0.75, False)
+
+    report.compute_stats()
+    assert list(report._write_latencies_ms) == [250, 750]
+    assert report.request_payload_size_histogram == {64: 2}
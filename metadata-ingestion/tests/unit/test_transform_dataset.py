@@ -3,6 +3,7 @@ from typing import (
     Any,
     Callable,
     Dict,
+    Iterable,
     List,
     MutableSequence,
     Optional,
@@ -22,6 +23,7 @@ from datahub.configuration.common import TransformerSemantics
 from datahub.emitter.mcp import MetadataChangeProposalWrapper
 from datahub.ingestion.api import workunit
 from datahub.ingestion.api.common import EndOfStream, PipelineContext, RecordEnvelope
+from datahub.ingestion.api.transform import Transformer
 from datahub.ingestion.graph.client import DatahubClientConfig, DataHubGraph
 from datahub.ingestion.run.pipeline import Pipeline
 from datahub.ingestion.transformer.add_dataset_browse_path import (
@@ -53,8 +55,12 @@ from datahub.ingestion.transformer.add_dataset_terms import (
     SimpleAddDatasetTerms,
 )
 from datahub.ingestion.transformer.base_transformer import (
+    _PROCESSED,
     BaseTransformer,
     SingleAspectTransformer,
+    _deserialize_entity_state,
+    _EntityState,
+    _serialize_entity_state,
 )
 from datahub.ingestion.transformer.dataset_domain import (
     PatternAddDatasetDomain,
@@ -65,6 +71,7 @@ from datahub.ingestion.transformer.mark_dataset_status import MarkDatasetStatus
 from datahub.ingestion.transformer.remove_dataset_ownership import (
     SimpleRemoveDatasetOwnership,
 )
+from datahub.ingestion.transformer.transformer_chain import TransformerChain
 from datahub.metadata.schema_classes import (
     BrowsePathsClass,
     DatasetPropertiesClass,
@@ -319,6 +326,105 @@ def test_simple_remove_dataset_ownership():
     assert len(ownership_aspect.owners) == 0
 
 
+def test_transformer_chain_matches_chained_transformers():
+    def make_transformers() -> List[Transformer]:
+        ctx = PipelineContext(run_id="test")
+        return [
+            SimpleAddDatasetOwnership.create(
+                {"owner_urns": [builder.make_user_urn("person1")]}, ctx
+            ),
+            MarkDatasetStatus.create({"removed": True}, ctx),
+            SimpleAddDatasetTags.create(
+                {"tag_urns": [builder.make_tag_urn("NeedsDocumentation")]}, ctx
+            ),
+        ]
+
+    def make_inputs() -> List[RecordEnvelope]:
+        records: List[Any] = [
+            make_generic_dataset(),
+            make_dataset_with_owner(),
+            make_generic_dataset_mcp(
+                entity_urn="urn:li:dataset:(urn:li:dataPlatform:bigquery,example2,PROD)"
+            ),
+            make_generic_dataset_mcp(
+                entity_urn="urn:li:dataset:(urn:li:dataPlatform:bigquery,example3,PROD)",
+                aspect_name="globalTags",
+                aspect=GlobalTagsClass(tags=[]),
+            ),
+            EndOfStream(),
+        ]
+        return [RecordEnvelope(record, metadata={}) for record in records]
+
+    expected: Iterable[RecordEnvelope] = make_inputs()
+    for transformer in make_transformers():
+        expected = transformer.transform(expected)
+
+    chain = TransformerChain(make_transformers())
+    assert len(chain.stages) == 1
+
+    def comparable(envelope: RecordEnvelope) -> Any:
+        # Control records don't implement equality, so compare them by type.
+        record = envelope.record
+        if isinstance(record, EndOfStream):
+            record = EndOfStream
+        return record, envelope.metadata
+
+    assert [comparable(envelope) for envelope in chain.transform(make_inputs())] == [
+        comparable(envelope) for envelope in expected
+    ]
+
+
+def test_transformer_entity_state_is_released():
+    ctx = PipelineContext(run_id="test")
+    transformers: List[Transformer] = [
+        MarkDatasetStatus.create({"removed": True}, ctx),
+        SimpleAddDatasetTags.create(
+            {"tag_urns": [builder.make_tag_urn("NeedsDocumentation")]}, ctx
+        ),
+    ]
+    chain = TransformerChain(transformers)
+    records = [
+        RecordEnvelope(make_generic_dataset(), metadata={}),
+        RecordEnvelope(
+            make_generic_dataset_mcp(
+                entity_urn="urn:li:dataset:(urn:li:dataPlatform:bigquery,example2,PROD)"
+            ),
+            metadata={},
+        ),
+    ]
+    list(chain.transform(records))
+
+    # Each transformer keeps its state in a database of its own.
+    entity_maps = [
+        transformer._entity_map
+        for transformer in transformers
+        if isinstance(transformer, BaseTransformer)
+    ]
+    assert all(entity_map is not None for entity_map in entity_maps)
+    filenames = {entity_map._conn.filename for entity_map in entity_maps}  # type: ignore
+    assert len(filenames) == 2
+
+    # The pipeline closes the transformers even if the stream never ends.
+    chain.close()
+    assert all(
+        transformer._entity_map is None
+        for transformer in transformers
+        if isinstance(transformer, BaseTransformer)
+    )
+    assert not any(filename.exists() for filename in filenames)
+
+
+def test_transformer_entity_state_serde():
+    system_metadata = models.SystemMetadataClass(runId="test", lastObserved=1000)
+    for state in [
+        _PROCESSED,
+        _EntityState(processed=False),
+        _EntityState(processed=False, seen_mcp=True, system_metadata=system_metadata),
+    ]:
+        assert _deserialize_entity_state(_serialize_entity_state(state)) == state
+    assert _deserialize_entity_state(_serialize_entity_state(_PROCESSED)) is _PROCESSED
+
+
 def test_mark_status_dataset(tmp_path):
     dataset = make_generic_dataset()
 
@@ -644,6 +750,52 @@ def test_simple_dataset_tags_transformation(mock_time):
     assert tags_aspect.tags[0].tag == builder.make_tag_urn("NeedsDocumentation")
 
 
+def test_simple_dataset_tags_patch_prefetches_server_tags(mock_time):
+    mock_graph = mock.MagicMock()
+    mock_graph.get_tags.return_value = None
+    pipeline_context = PipelineContext(run_id="test-tags-prefetch")
+    pipeline_context.graph = mock_graph
+
+    transformer = SimpleAddDatasetTags.create(
+        {
+            "tag_urns": [builder.make_tag_urn("NeedsDocumentation")],
+            "semantics": TransformerSemantics.PATCH,
+        },
+        pipeline_context,
+    )
+
+    dataset_urns = [
+        builder.make_dataset_urn("bigquery", f"example{i}") for i in range(3)
+    ]
+    outputs = list(
+        transformer.transform(
+            [
+                RecordEnvelope(
+                    make_generic_dataset_mcp(
+                        entity_urn=urn,
+                        aspect_name="globalTags",
+                        aspect=models.GlobalTagsClass(tags=[]),
+                    ),
+                    metadata={},
+                )
+                for urn in dataset_urns
+            ]
+            + [RecordEnvelope(EndOfStream(), metadata={})]
+        )
+    )
+    assert len(outputs) == 4
+
+    # The server tags for all datasets are fetched in one batch, ahead of the merges.
+    mock_graph.prefetch_aspects.assert_called_once_with(
+        dataset_urns, models.GlobalTagsClass
+    )
+    assert mock_graph.get_tags.call_count == 3
+    # The prefetched tags don't outlive the batch.
+    mock_graph.drop_prefetched_aspects.assert_called_once_with(
+        dataset_urns, models.GlobalTagsClass
+    )
+
+
 def dummy_tag_resolver_method(dataset_snapshot):
     return []
 
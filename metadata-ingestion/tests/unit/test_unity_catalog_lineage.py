@@ -0,0 +1,147 @@
+import datetime
+from typing import List, Optional
+from unittest import mock
+
+from datahub.ingestion.source.unity.lineage_fetcher import UnityCatalogLineageFetcher
+from datahub.ingestion.source.unity.proxy import (
+    Catalog,
+    Column,
+    Metastore,
+    Schema,
+    Table,
+    UnityCatalogApiProxy,
+)
+from datahub.ingestion.source.unity.report import UnityCatalogReport
+from datahub.metadata.schema_classes import StringTypeClass
+
+
+def make_tables(num_tables: int, num_columns: int) -> List[Table]:
+    metastore = Metastore(
+        id="metastore",
+        name="metastore",
+        type="metastore",
+        comment=None,
+        metastore_id="metastore",
+        owner=None,
+    )
+    catalog = Catalog(
+        id="catalog",
+        name="catalog",
+        type="catalog",
+        comment=None,
+        metastore=metastore,
+        owner=None,
+    )
+    schema = Schema(
+        id="schema",
+        name="schema",
+        type="schema",
+        comment=None,
+        catalog=catalog,
+        owner=None,
+    )
+    return [
+        Table(
+            id=f"catalog.schema.table{i}",
+            name=f"table{i}",
+            type="table",
+            comment=None,
+            schema=schema,
+            columns=[
+                Column(
+                    id=f"column{j}",
+                    name=f"column{j}",
+                    type="column",
+                    comment=None,
+                    type_text="string",
+                    type_name=StringTypeClass(),
+                    type_precision=0,
+                    type_scale=0,
+                    position=j,
+                    nullable=True,
+                )
+                for j in range(num_columns)
+            ],
+            storage_location=None,
+            data_source_format=None,
+            table_type="MANAGED",
+            owner=None,
+            generation=0,
+            created_at=datetime.datetime(2023, 1, 1),
+            created_by="abc@acryl.io",
+            updated_at=None,
+            updated_by=None,
+            table_id=f"table{i}",
+            view_definition=None,
+            properties={},
+        )
+        for i in range(num_tables)
+    ]
+
+
+def list_lineages_by_table(table_name: Optional[str] = None, headers=None) -> dict:
+    return {
+        "upstream_tables": [
+            {"catalog_name": "catalog", "schema_name": "schema", "name": "upstream"}
+        ]
+    }
+
+
+def list_lineages_by_column(
+    table_name: Optional[str] = None, column_name: Optional[str] = None, headers=None
+) -> dict:
+    assert column_name is not None
+    if table_name == "catalog.schema.table1" and column_name == "column3":
+        raise Exception("Request failed")
+    return {
+        "upstream_cols": [
+            {
+                "catalog_name": "catalog",
+                "schema_name": "schema",
+                "table_name": f"upstream{k}",
+                "name": column_name,
+            }
+            for k in range(int(column_name[len("column") :]) % 3)
+        ]
+    }
+
+
+def test_lineage_fetcher_matches_sequential_fetching():
+    proxy = UnityCatalogApiProxy.__new__(UnityCatalogApiProxy)
+    with mock.patch.object(
+        proxy, "list_lineages_by_table", side_effect=list_lineages_by_table
+    ), mock.patch.object(
+        proxy, "list_lineages_by_column", side_effect=list_lineages_by_column
+    ):
+        for include_column_lineage in [True, False]:
+            expected_tables = make_tables(num_tables=4, num_columns=10)
+            for table in expected_tables:
+                if include_column_lineage:
+                    proxy.get_column_lineage(table)
+                else:
+                    proxy.table_lineage(table)
+
+            report = UnityCatalogReport()
+            fetcher = UnityCatalogLineageFetcher(
+                proxy,
+                report,
+                include_column_lineage=include_column_lineage,
+                max_workers=3,
+            )
+            tables = make_tables(num_tables=4, num_columns=10)
+            for table in tables:
+                fetcher.submit(table)
+            for table in tables:
+                fetcher.wait(table)
+            fetcher.close()
+
+            assert [table.upstreams for table in tables] == [
+                table.upstreams for table in expected_tables
+            ]
+            assert report.num_table_lineage_requests == 4
+            if include_column_lineage:
+                # table1 fails at column3, but its other column requests may still run.
+                assert 34 <= report.num_column_lineage_requests <= 40
+                assert report.num_lineage_request_failures == 1
+            else:
+                assert report.num_column_lineage_requests == 0
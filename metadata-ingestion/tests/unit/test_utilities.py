@@ -1,5 +1,8 @@
+import pytest
+
 from datahub.utilities.delayed_iter import delayed_iter
 from datahub.utilities.sql_parser import MetadataSQLSQLParser, SqlLineageSQLParser
+from datahub.utilities.sql_parser_pool import SqlParserWorkerPool
 
 
 def test_delayed_iter():
@@ -348,3 +351,46 @@ JOIN `admin-table` a on d.`column-date` = a.`column-admin`
     ]
     assert sorted(SqlLineageSQLParser(sql_query).get_tables()) == expected_tables
     assert sorted(SqlLineageSQLParser(sql_query).get_columns()) == expected_columns
+
+
+def test_sqllineage_sql_parser_parse_batch():
+    sql_queries = [
+        "SELECT foo.a, foo.b, bar.c FROM foo JOIN bar ON (foo.a == bar.b);",
+        "SELECT a FROM baz",
+    ]
+
+    results = SqlLineageSQLParser.parse_batch(sql_queries)
+
+    assert len(results) == 2
+    assert not isinstance(results[0], Exception)
+    assert results[0].get_tables() == ["bar", "foo"]
+    assert not isinstance(results[1], Exception)
+    assert results[1].get_tables() == ["baz"]
+    assert results[1].get_columns() == ["a"]
+
+
+@pytest.mark.parametrize("use_external_process", [True, False])
+def test_sqllineage_sql_parser_parse_batch_raw_names(use_external_process):
+    sql_queries = ["SELECT A FROM Foo", "SELECT b FROM BAR"]
+
+    results = SqlLineageSQLParser.parse_batch(
+        sql_queries, use_external_process=use_external_process, use_raw_names=True
+    )
+
+    for sql_query, result in zip(sql_queries, results):
+        assert isinstance(result, SqlLineageSQLParser)
+        expected = SqlLineageSQLParser(
+            sql_query, use_external_process=False, use_raw_names=True
+        )
+        assert result.get_tables() == expected.get_tables()
+        assert result.get_columns() == expected.get_columns()
+
+
+def test_sql_parser_worker_pool_recycles_workers():
+    with SqlParserWorkerPool(num_workers=1, max_queries_per_worker=2) as pool:
+        for _ in range(5):
+            tables, _columns = pool.get_tables_columns("SELECT a FROM foo")
+            assert tables == ["foo"]
+
+        assert pool.queries_parsed == 5
+        assert pool.workers_started == 3
@@ -0,0 +1,121 @@
+import pathlib
+from typing import List
+
+import pytest
+
+from datahub.utilities.persistent_cache import PersistentCacheTable
+from datahub.utilities.sql_parser_base import SQLParser, SqlParserException
+from datahub.utilities.sql_parser_cache import (
+    SqlParsingCacheReport,
+    SqlParsingResultCache,
+)
+
+
+class _CountingParser(SQLParser):
+    calls = 0
+
+    def __init__(self, sql_query: str, use_external_process: bool = True) -> None:
+        super().__init__(sql_query, use_external_process)
+        _CountingParser.calls += 1
+        if "broken" in sql_query:
+            raise ValueError("unable to parse")
+
+    def get_tables(self) -> List[str]:
+        return [self._sql_query.split()[-1]]
+
+    def get_columns(self) -> List[str]:
+        return ["a"]
+
+
+def test_sql_parsing_cache_memory() -> None:
+    _CountingParser.calls = 0
+    report = SqlParsingCacheReport()
+    with SqlParsingResultCache(report) as cache:
+        assert cache.get_tables_columns(_CountingParser, "SELECT a FROM foo") == (
+            ["foo"],
+            ["a"],
+        )
+        # Whitespace differences map to the same entry.
+        assert cache.get_tables_columns(_CountingParser, "SELECT  a\n FROM foo  ") == (
+            ["foo"],
+            ["a"],
+        )
+
+        for _ in range(2):
+            with pytest.raises(SqlParserException):
+                cache.get_tables_columns(_CountingParser, "SELECT broken")
+
+    assert _CountingParser.calls == 2
+    assert report.memory_hits == 2
+    assert report.misses == 2
+
+
+def test_sql_parsing_cache_disk(tmp_path: pathlib.Path) -> None:
+    _CountingParser.calls = 0
+    cache_file = str(tmp_path / "sql_cache.db")
+
+    first_report = SqlParsingCacheReport()
+    with SqlParsingResultCache(first_report, cache_file) as cache:
+        cache.get_tables_columns(_CountingParser, "SELECT a FROM foo")
+    assert first_report.misses == 1
+
+    second_report = SqlParsingCacheReport()
+    with SqlParsingResultCache(second_report, cache_file) as cache:
+        assert cache.get_tables_columns(_CountingParser, "SELECT a FROM foo") == (
+            ["foo"],
+            ["a"],
+        )
+    assert second_report.disk_hits == 1
+    assert second_report.misses == 0
+    assert _CountingParser.calls == 1
+
+
+def test_sql_parsing_cache_keeps_whitespace_in_literals() -> None:
+    _CountingParser.calls = 0
+    report = SqlParsingCacheReport()
+    with SqlParsingResultCache(report) as cache:
+        cache.get_tables_columns(_CountingParser, "SELECT 'a  b' FROM foo")
+        cache.get_tables_columns(_CountingParser, "SELECT 'a b' FROM foo")
+        cache.get_tables_columns(_CountingParser, "-- comment\nFROM foo")
+        cache.get_tables_columns(_CountingParser, "-- comment FROM foo")
+
+    assert report.misses == 4
+    assert _CountingParser.calls == 4
+
+
+def test_sql_parsing_cache_corrupt_file(tmp_path: pathlib.Path) -> None:
+    _CountingParser.calls = 0
+    cache_file = tmp_path / "sql_cache.db"
+    cache_file.write_bytes(b"this is not a sqlite database" * 100)
+
+    report = SqlParsingCacheReport()
+    with SqlParsingResultCache(report, str(cache_file)) as cache:
+        for _ in range(2):
+            assert cache.get_tables_columns(_CountingParser, "SELECT a FROM foo") == (
+                ["foo"],
+                ["a"],
+            )
+
+    # The corrupt file is discarded and results are only cached in memory.
+    assert report.misses == 1
+    assert report.memory_hits == 1
+    assert not cache_file.exists()
+
+
+def test_persistent_cache_keeps_file_on_other_errors(tmp_path: pathlib.Path) -> None:
+    cache_file = tmp_path / "cache.db"
+    cache = PersistentCacheTable(str(cache_file), "entries")
+    cache.set("key", "value")
+    assert cache.get("key") == "value"
+
+    # Using a closed connection is a programming error, not a corrupt file.
+    assert cache._conn is not None
+    cache._conn.close()
+    assert cache.get("key") is None
+
+    # The cache is disabled for the rest of the run, but the file is kept.
+    cache.set("other", "value")
+    assert cache.get("other") is None
+    assert cache_file.exists()
+    cache.close()
+    assert PersistentCacheTable(str(cache_file), "entries").get("key") == "value"
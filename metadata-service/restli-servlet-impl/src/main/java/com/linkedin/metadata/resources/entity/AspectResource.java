@@ -61,12 +61,14 @@ public class AspectResource extends CollectionResourceTaskTemplate<String, Versi
 
   private static final String ACTION_GET_TIMESERIES_ASPECT = "getTimeseriesAspectValues";
   private static final String ACTION_INGEST_PROPOSAL = "ingestProposal";
+  private static final String ACTION_INGEST_PROPOSAL_BATCH = "ingestProposalBatch";
   private static final String ACTION_GET_COUNT = "getCount";
   private static final String ACTION_RESTORE_INDICES = "restoreIndices";
 
   private static final String PARAM_ENTITY = "entity";
   private static final String PARAM_ASPECT = "aspect";
   private static final String PARAM_PROPOSAL = "proposal";
+  private static final String PARAM_PROPOSALS = "proposals";
   private static final String PARAM_START_TIME_MILLIS = "startTimeMillis";
   private static final String PARAM_END_TIME_MILLIS = "endTimeMillis";
   private static final String PARAM_LATEST_VALUE = "latestValue";
@@ -170,14 +172,63 @@ public class AspectResource extends CollectionResourceTaskTemplate<String, Versi
       @ActionParam(PARAM_ASYNC) @Optional(UNSET) String async) throws URISyntaxException {
     log.info("INGEST PROPOSAL proposal: {}", metadataChangeProposal);
 
-    boolean asyncBool;
+    final boolean asyncBool = parseAsync(async);
+    Authentication authentication = AuthenticationContext.getAuthentication();
+    authorizeProposal(authentication, metadataChangeProposal);
+    String actorUrnStr = authentication.getActor().toUrnStr();
+    final AuditStamp auditStamp = new AuditStamp().setTime(_clock.millis()).setActor(Urn.createFromString(actorUrnStr));
+
+    return RestliUtil.toTask(() -> {
+      log.debug("Proposal: {}", metadataChangeProposal);
+      try {
+        return ingestOneProposal(metadataChangeProposal, auditStamp, asyncBool).toString();
+      } catch (ValidationException e) {
+        throw new RestLiServiceException(HttpStatus.S_422_UNPROCESSABLE_ENTITY, e.getMessage());
+      }
+    }, MetricRegistry.name(this.getClass(), "ingestProposal"));
+  }
+
+  /**
+   * Ingests a batch of proposals in a single request. Proposals are applied in order, and the
+   * request fails on the first proposal that does not pass validation.
+   */
+  @Action(name = ACTION_INGEST_PROPOSAL_BATCH)
+  @Nonnull
+  @WithSpan
+  public Task<Void> ingestProposalBatch(
+      @ActionParam(PARAM_PROPOSALS) @Nonnull MetadataChangeProposal[] metadataChangeProposals,
+      @ActionParam(PARAM_ASYNC) @Optional(UNSET) String async) throws URISyntaxException {
+    log.info("INGEST PROPOSAL BATCH proposals: {}", metadataChangeProposals.length);
+
+    final boolean asyncBool = parseAsync(async);
+    Authentication authentication = AuthenticationContext.getAuthentication();
+    for (MetadataChangeProposal metadataChangeProposal : metadataChangeProposals) {
+      authorizeProposal(authentication, metadataChangeProposal);
+    }
+    String actorUrnStr = authentication.getActor().toUrnStr();
+    final AuditStamp auditStamp = new AuditStamp().setTime(_clock.millis()).setActor(Urn.createFromString(actorUrnStr));
+
+    return RestliUtil.toTask(() -> {
+      for (MetadataChangeProposal metadataChangeProposal : metadataChangeProposals) {
+        log.debug("Proposal: {}", metadataChangeProposal);
+        try {
+          ingestOneProposal(metadataChangeProposal, auditStamp, asyncBool);
+        } catch (ValidationException e) {
+          throw new RestLiServiceException(HttpStatus.S_422_UNPROCESSABLE_ENTITY, e.getMessage());
+        }
+      }
+      return null;
+    }, MetricRegistry.name(this.getClass(), "ingestProposalBatch"));
+  }
+
+  private boolean parseAsync(String async) {
     if (UNSET.equals(async)) {
-      asyncBool = Boolean.parseBoolean(System.getenv(ASYNC_INGEST_DEFAULT_NAME));
-    } else {
-      asyncBool = Boolean.parseBoolean(async);
+      return Boolean.parseBoolean(System.getenv(ASYNC_INGEST_DEFAULT_NAME));
     }
+    return Boolean.parseBoolean(async);
+  }
 
-    Authentication authentication = AuthenticationContext.getAuthentication();
+  private void authorizeProposal(Authentication authentication, MetadataChangeProposal metadataChangeProposal) {
     EntitySpec entitySpec = _entityService.getEntityRegistry().getEntitySpec(metadataChangeProposal.getEntityType());
     Urn urn = EntityKeyUtils.getUrnFromProposal(metadataChangeProposal, entitySpec.getKeyAspectSpec());
     if (Boolean.parseBoolean(System.getenv(REST_API_AUTHORIZATION_ENABLED_ENV))
@@ -185,26 +236,19 @@ public class AspectResource extends CollectionResourceTaskTemplate<String, Versi
         new ResourceSpec(urn.getEntityType(), urn.toString()))) {
       throw new RestLiServiceException(HttpStatus.S_401_UNAUTHORIZED, "User is unauthorized to modify entity " + urn);
     }
-    String actorUrnStr = authentication.getActor().toUrnStr();
-    final AuditStamp auditStamp = new AuditStamp().setTime(_clock.millis()).setActor(Urn.createFromString(actorUrnStr));
+  }
 
-    return RestliUtil.toTask(() -> {
-      log.debug("Proposal: {}", metadataChangeProposal);
-      try {
-        EntityService.IngestProposalResult result = _entityService.ingestProposal(metadataChangeProposal, auditStamp, asyncBool);
-        Urn responseUrn = result.getUrn();
+  private Urn ingestOneProposal(MetadataChangeProposal metadataChangeProposal, AuditStamp auditStamp, boolean asyncBool) {
+    EntityService.IngestProposalResult result = _entityService.ingestProposal(metadataChangeProposal, auditStamp, asyncBool);
+    Urn responseUrn = result.getUrn();
 
-        AspectUtils.getAdditionalChanges(metadataChangeProposal, _entityService)
-                .forEach(proposal -> _entityService.ingestProposal(proposal, auditStamp, asyncBool));
+    AspectUtils.getAdditionalChanges(metadataChangeProposal, _entityService)
+            .forEach(proposal -> _entityService.ingestProposal(proposal, auditStamp, asyncBool));
 
-        if (!result.isQueued()) {
-          tryIndexRunId(responseUrn, metadataChangeProposal.getSystemMetadata(), _entitySearchService);
-        }
-        return responseUrn.toString();
-      } catch (ValidationException e) {
-        throw new RestLiServiceException(HttpStatus.S_422_UNPROCESSABLE_ENTITY, e.getMessage());
-      }
-    }, MetricRegistry.name(this.getClass(), "ingestProposal"));
+    if (!result.isQueued()) {
+      tryIndexRunId(responseUrn, metadataChangeProposal.getSystemMetadata(), _entitySearchService);
+    }
+    return responseUrn;
   }
 
   @Action(name = ACTION_GET_COUNT)